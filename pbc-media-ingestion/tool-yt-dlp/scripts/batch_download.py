@@ -1,25 +1,447 @@
 """
 Batch download from URL list file.
 
-STATUS: STUB - Not yet implemented
+Parallel, resumable download scheduler built on download_youtube.download_video().
+URLs are read from a text file, deduplicated by video ID, and downloaded on a
+bounded worker pool with a per-host concurrency cap, all in one process (no
+per-URL Python + yt-dlp startup).
+
+Every finished item appends one line to a JSONL journal in the output directory:
+
+    {"key": "Youtube:dQw4w9WgXcQ", "url": "...", "status": "done", "title": "...",
+     "bytes": 18734120, "duration": 42.7, "throughput": 438738.4,
+     "error": null, "ts": "2025-12-18T10:15:02"}
+
+The journal is flushed after every record, so --resume after a crash or
+Ctrl-C skips everything already downloaded. Completed items are also added to
+the shared download archive (see download_archive.py), so videos fetched by
+any script in this tool are skipped without a network request.
 
 Usage:
-    python batch_download.py urls.txt --output-dir ./downloads
+    python batch_download.py urls.txt [options]
 
-Expected functionality:
-    - Read URLs from text file (one per line)
-    - Download each URL with metadata
-    - Handle errors gracefully (continue on failure)
-    - Generate summary report
+Examples:
+    python batch_download.py urls.txt
+    python batch_download.py urls.txt --output-dir ./downloads --jobs 6 --per-host 3
+    python batch_download.py urls.txt --audio-only --resume
 """
 
+import argparse
+import json
 import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+from download_archive import ARCHIVE_FILENAME, DownloadArchive, format_signature, url_video_key
+from download_youtube import DEFAULT_OUTPUT_DIR, download_video
+
+
+# Journal filename, written inside the output directory
+JOURNAL_FILENAME = "_batch_journal.jsonl"
+
+# Default concurrent downloads per host (most sites throttle beyond a few)
+DEFAULT_PER_HOST = 2
+
+
+def load_urls_from_file(filepath: str) -> list:
+    """Load URLs from a text file (one per line, # for comments)."""
+    urls = []
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                urls.append(line)
+    return urls
+
+
+def get_video_key(url: str) -> str:
+    """
+    Build a dedupe key for a URL without any network request.
+
+    Gives e.g. 'Youtube:dQw4w9WgXcQ' for both youtube.com/watch?v= and
+    youtu.be/ links. Falls back to the URL itself when no extractor can
+    read an ID from it.
+    """
+    key = url_video_key(url)
+    return f"{key[0]}:{key[1]}" if key else url
+
+
+def dedupe_urls(urls: list) -> list:
+    """
+    Deduplicate URLs by video ID, keeping the first URL for each video.
+
+    Returns:
+        List of (key, url) tuples in input order
+    """
+    seen = set()
+    items = []
+    for url in urls:
+        key = get_video_key(url)
+        if key not in seen:
+            seen.add(key)
+            items.append((key, url))
+    return items
+
+
+class BatchJournal:
+    """Append-only JSONL journal of per-item download status."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def completed_keys(self) -> set:
+        """Keys whose latest record is 'done'."""
+        latest = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partial last line from an interrupted write
+                    continue
+                latest[record["key"]] = record.get("status")
+        return {key for key, status in latest.items() if status == "done"}
+
+    def record(self, result: dict) -> None:
+        """Append a result record and flush it to disk."""
+        entry = {**result, "ts": datetime.now().isoformat(timespec="seconds")}
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+
+def _download_item(
+    key: str,
+    url: str,
+    output_dir: Path,
+    audio_only: bool,
+    max_resolution: int,
+    write_metadata: bool,
+) -> dict:
+    """Download one item and measure it."""
+    start = time.monotonic()
+    try:
+        info = download_video(
+            url,
+            output_dir,
+            audio_only=audio_only,
+            max_resolution=max_resolution,
+            write_metadata=write_metadata,
+            quiet=True,
+        )
+    except Exception as e:  # Isolate failures to this item
+        return {
+            "key": key,
+            "url": url,
+            "status": "failed",
+            "title": None,
+            "bytes": 0,
+            "duration": round(time.monotonic() - start, 2),
+            "throughput": None,
+            "error": str(e),
+        }
+    elapsed = time.monotonic() - start
+
+    size = sum(Path(f).stat().st_size for f in info["files"] if Path(f).exists())
+    return {
+        "key": key,
+        "url": url,
+        "status": "done",
+        "title": info["title"],
+        "id": info["id"],
+        "extractor": info["extractor"],
+        "file": info["files"][0] if info["files"] else None,
+        "bytes": size,
+        "duration": round(elapsed, 2),
+        "throughput": round(size / elapsed, 1) if elapsed > 0 else None,
+        "error": None,
+    }
+
+
+def batch_download(
+    urls: list,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    audio_only: bool = False,
+    max_resolution: int = None,
+    write_metadata: bool = True,
+    jobs: int = 4,
+    per_host: int = DEFAULT_PER_HOST,
+    resume: bool = False,
+    archive: DownloadArchive = None,
+) -> dict:
+    """
+    Download a list of URLs on a bounded worker pool.
+
+    Args:
+        urls: Video URLs (duplicates of the same video are downloaded once)
+        output_dir: Directory to save files and the journal
+        audio_only: If True, extract audio only as mp3
+        max_resolution: Max video height (e.g., 720, 1080)
+        write_metadata: Write .info.json sidecar files
+        jobs: Total concurrent downloads
+        per_host: Concurrent downloads per host
+        resume: Skip items recorded as done in the journal
+        archive: Skip items already in the download archive, and add
+                 completed ones
+
+    Returns:
+        dict with 'results' (one per item, in completion order), 'skipped',
+        'archived', 'duplicates' and 'journal'
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    items = dedupe_urls(urls)
+    duplicates = len(urls) - len(items)
+    if duplicates:
+        print(f"Removed {duplicates} duplicate URLs", file=sys.stderr)
+
+    journal = BatchJournal(output_dir / JOURNAL_FILENAME)
+    skipped = 0
+    if resume:
+        done = journal.completed_keys()
+        pending = [(key, url) for key, url in items if key not in done]
+        skipped = len(items) - len(pending)
+        items = pending
+        if skipped:
+            print(f"Resuming: skipping {skipped} completed items", file=sys.stderr)
+
+    fmt = format_signature(audio_only, max_resolution)
+    archived = 0
+    if archive:
+        pending = []
+        for key, url in items:
+            video_key = url_video_key(url)
+            if video_key and archive.contains(*video_key, fmt):
+                continue
+            pending.append((key, url))
+        archived = len(items) - len(pending)
+        items = pending
+        if archived:
+            print(f"Skipping {archived} archived items", file=sys.stderr)
+
+    # Items wait in per-host queues and are only submitted when their host
+    # has a free slot, so a busy host never ties up workers other hosts could use
+    queues = defaultdict(deque)
+    for key, url in items:
+        queues[urlparse(url).netloc.lower()].append((key, url))
+    active = defaultdict(int)
+    running = {}
+
+    total = len(items)
+    print(f"Downloading {total} items with {jobs} workers ({per_host} per host)", file=sys.stderr)
+
+    def start_ready(pool: ThreadPoolExecutor) -> None:
+        """Submit queued items round-robin across hosts with free slots."""
+        started = True
+        while started and len(running) < jobs:
+            started = False
+            for host in list(queues):
+                if len(running) >= jobs:
+                    break
+                if active[host] >= per_host:
+                    continue
+                key, url = queues[host].popleft()
+                if not queues[host]:
+                    del queues[host]
+                active[host] += 1
+                future = pool.submit(
+                    _download_item,
+                    key,
+                    url,
+                    output_dir,
+                    audio_only,
+                    max_resolution,
+                    write_metadata,
+                )
+                running[future] = host
+                started = True
+
+    results = []
+    done = 0
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            start_ready(pool)
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    active[running.pop(future)] -= 1
+                    result = future.result()
+                    done += 1
+                    journal.record(result)
+                    results.append(result)
+                    if result["status"] == "done":
+                        print(f"   [{done}/{total}] Downloaded: {result['title']}", file=sys.stderr)
+                        if archive and result["extractor"]:
+                            archive.add(
+                                result["extractor"], result["id"], fmt,
+                                title=result["title"], path=result["file"]
+                            )
+                    else:
+                        print(f"   [{done}/{total}] FAILED: {result['url']} - {result['error']}", file=sys.stderr)
+                start_ready(pool)
+    finally:
+        journal.close()
+
+    return {
+        "results": results,
+        "skipped": skipped,
+        "archived": archived,
+        "duplicates": duplicates,
+        "journal": str(journal.path),
+    }
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable byte count."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def print_summary(summary: dict, wall_time: float) -> None:
+    """Print a per-item table and totals to stderr."""
+    results = summary["results"]
+    succeeded = [r for r in results if r["status"] == "done"]
+    failed = [r for r in results if r["status"] != "done"]
+
+    print(f"\n{'Bytes':>10}  {'Time':>7}  {'Speed':>11}  Title", file=sys.stderr)
+    for r in succeeded:
+        speed = f"{format_bytes(r['throughput'])}/s" if r["throughput"] else "-"
+        print(
+            f"{format_bytes(r['bytes']):>10}  {r['duration']:>6.1f}s  {speed:>11}  {r['title']}",
+            file=sys.stderr
+        )
+
+    total_bytes = sum(r["bytes"] for r in succeeded)
+    print(f"\nSUCCESS: Downloaded {len(succeeded)} items", file=sys.stderr)
+    print(f"   Total: {format_bytes(total_bytes)} in {wall_time:.1f}s", file=sys.stderr)
+    if wall_time > 0:
+        print(f"   Aggregate throughput: {format_bytes(total_bytes / wall_time)}/s", file=sys.stderr)
+    if summary["skipped"]:
+        print(f"   Skipped (already done): {summary['skipped']}", file=sys.stderr)
+    if summary["archived"]:
+        print(f"   Skipped (in archive): {summary['archived']}", file=sys.stderr)
+    if summary["duplicates"]:
+        print(f"   Duplicates removed: {summary['duplicates']}", file=sys.stderr)
+    print(f"   Journal: {summary['journal']}", file=sys.stderr)
+
+    if failed:
+        print(f"FAILED: {len(failed)} items", file=sys.stderr)
+        for r in failed:
+            print(f"   - {r['url']}: {r['error']}", file=sys.stderr)
 
 
 def main():
-    print("ERROR: batch_download.py is a stub - not yet implemented", file=sys.stderr)
-    print("   See download_youtube.py for working implementation", file=sys.stderr)
-    sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Download videos from a URL list file"
+    )
+    parser.add_argument(
+        "url_file",
+        help="Text file with one URL per line (# for comments)"
+    )
+    parser.add_argument(
+        "-o", "--output-dir",
+        type=Path,
+        default=DEFAULT_OUTPUT_DIR,
+        help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})"
+    )
+    parser.add_argument(
+        "--audio-only",
+        action="store_true",
+        help="Extract audio only as mp3"
+    )
+    parser.add_argument(
+        "--max-resolution",
+        type=int,
+        choices=[480, 720, 1080, 1440, 2160],
+        help="Maximum video resolution"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=4,
+        help="Total concurrent downloads (default: 4)"
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST,
+        help=f"Concurrent downloads per host (default: {DEFAULT_PER_HOST})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Skip items already recorded as done in {JOURNAL_FILENAME}"
+    )
+    parser.add_argument(
+        "--no-metadata",
+        action="store_true",
+        help="Don't write .info.json sidecar files"
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        help=f"Download archive path (default: <output-dir>/{ARCHIVE_FILENAME})"
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Ignore the download archive"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        urls = load_urls_from_file(args.url_file)
+    except FileNotFoundError:
+        print(f"ERROR: URL file not found: {args.url_file}", file=sys.stderr)
+        sys.exit(1)
+
+    if not urls:
+        print("ERROR: No URLs found in file", file=sys.stderr)
+        sys.exit(1)
+
+    archive = None
+    if not args.no_archive:
+        archive = DownloadArchive(args.archive or args.output_dir / ARCHIVE_FILENAME)
+
+    start = time.monotonic()
+    try:
+        summary = batch_download(
+            urls,
+            args.output_dir,
+            audio_only=args.audio_only,
+            max_resolution=args.max_resolution,
+            write_metadata=not args.no_metadata,
+            jobs=args.jobs,
+            per_host=args.per_host,
+            resume=args.resume,
+            archive=archive,
+        )
+    finally:
+        if archive:
+            archive.close()
+    print_summary(summary, time.monotonic() - start)
+
+    if any(r["status"] != "done" for r in summary["results"]):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
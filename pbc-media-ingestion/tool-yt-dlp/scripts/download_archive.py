@@ -0,0 +1,144 @@
+"""
+Persistent download archive for yt-dlp scripts.
+
+Remembers which videos have already been ingested, keyed by extractor,
+video ID and a format signature ('video-best', 'video-720p', 'audio-mp3',
+'metadata', ...). Video IDs are read from the URL itself using yt-dlp's
+extractor URL patterns, so the archive is consulted before any network
+extraction: re-running a channel costs one flat playlist fetch plus
+downloads for new videos only. Keying on the ID (not %(title)s) means
+renamed videos are still recognised.
+
+Entries live in a SQLite table with a composite primary key, so lookups
+stay constant-time in practice at 100k+ entries and nothing is loaded
+up front.
+
+Usage:
+    from download_archive import DownloadArchive, ARCHIVE_FILENAME
+
+    archive = DownloadArchive(output_dir / ARCHIVE_FILENAME)
+    key = archive.key_for_url(url)              # ('Youtube', 'dQw4w9WgXcQ') or None
+    if key and archive.contains(*key, "video-best"):
+        ...skip...
+    archive.add("Youtube", "dQw4w9WgXcQ", "video-best", title=..., path=...)
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from yt_dlp.extractor import gen_extractor_classes
+
+
+# Archive filename, written inside the output directory
+ARCHIVE_FILENAME = "_download_archive.sqlite3"
+
+# Extractor classes, loaded on first use (importing them all takes a moment)
+_extractors = None
+
+
+def url_video_key(url: str) -> tuple | None:
+    """
+    Read (extractor key, video ID) from a URL without any network request.
+
+    Returns:
+        Tuple like ('Youtube', 'dQw4w9WgXcQ'), or None when the first
+        matching extractor cannot take an ID from the URL (generic pages,
+        playlists, channels)
+    """
+    global _extractors
+    if _extractors is None:
+        _extractors = list(gen_extractor_classes())
+
+    for ie in _extractors:
+        if ie.suitable(url):
+            video_id = ie.get_temp_id(url)
+            return (ie.ie_key(), video_id) if video_id else None
+    return None
+
+
+def format_signature(audio_only: bool = False, max_resolution: int = None) -> str:
+    """Format signature for a download_video()/download_playlist() call."""
+    if audio_only:
+        return "audio-mp3"
+    if max_resolution:
+        return f"video-{max_resolution}p"
+    return "video-best"
+
+
+class DownloadArchive:
+    """SQLite-backed set of (extractor, video ID, format signature) entries."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS archive (
+                extractor TEXT NOT NULL,
+                video_id TEXT NOT NULL,
+                format TEXT NOT NULL,
+                title TEXT,
+                path TEXT,
+                added_at REAL NOT NULL,
+                PRIMARY KEY (extractor, video_id, format)
+            ) WITHOUT ROWID
+        """)
+        self._db.commit()
+
+    def key_for_url(self, url: str) -> tuple | None:
+        """(extractor, video ID) for a URL, or None if it has no readable ID."""
+        return url_video_key(url)
+
+    def get(self, extractor: str, video_id: str, fmt: str) -> dict | None:
+        """Return the archived entry, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT title, path, added_at FROM archive "
+                "WHERE extractor = ? AND video_id = ? AND format = ?",
+                (extractor, video_id, fmt)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "extractor": extractor,
+            "id": video_id,
+            "format": fmt,
+            "title": row[0],
+            "path": row[1],
+            "added_at": row[2],
+        }
+
+    def contains(self, extractor: str, video_id: str, fmt: str) -> bool:
+        """True if this video was already ingested in this format."""
+        return self.get(extractor, video_id, fmt) is not None
+
+    def add(
+        self,
+        extractor: str,
+        video_id: str,
+        fmt: str,
+        title: str | None = None,
+        path: str | None = None,
+    ) -> None:
+        """Record a completed download."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO archive VALUES (?, ?, ?, ?, ?, ?)",
+                (extractor, video_id, fmt, title, path, time.time())
+            )
+            self._db.commit()
+
+    def count(self) -> int:
+        """Number of archived entries."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM archive").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the archive database."""
+        self._db.close()
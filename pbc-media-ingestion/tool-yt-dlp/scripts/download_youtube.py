@@ -12,15 +12,24 @@ Examples:
     python download_youtube.py https://youtube.com/watch?v=VIDEO_ID --audio-only
     python download_youtube.py https://youtube.com/watch?v=VIDEO_ID --metadata-only
     python download_youtube.py https://youtube.com/playlist?list=PLAYLIST_ID --playlist
+    python download_youtube.py https://youtube.com/@CHANNEL/videos --playlist --jobs 4
+
+Completed downloads are recorded in a download archive (see download_archive.py)
+in the output directory; archived videos are skipped without any network request.
+Use --no-archive to force a re-download.
 """
 
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterator
 
 from yt_dlp import YoutubeDL
 
+from download_archive import ARCHIVE_FILENAME, DownloadArchive, format_signature
+
 
 # Default output directory
 DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "downloads"
@@ -48,6 +57,8 @@ def download_video(
     audio_only: bool = False,
     max_resolution: int = None,
     write_metadata: bool = True,
+    quiet: bool = False,
+    archive: DownloadArchive = None,
 ) -> dict:
     """
     Download a video with optional format constraints.
@@ -58,13 +69,33 @@ def download_video(
         audio_only: If True, extract audio only as mp3
         max_resolution: Max video height (e.g., 720, 1080)
         write_metadata: Write .info.json sidecar file
+        quiet: Suppress yt-dlp console output and progress bars
+        archive: Skip the video if already archived in this format, and
+                 record it after downloading
 
     Returns:
-        dict with download info (title, filename, etc.)
+        dict with download info (title, filename, etc.); archived videos
+        return only 'title', 'id', 'extractor', 'output_dir', 'files' and 'skipped'
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    fmt = format_signature(audio_only, max_resolution)
+    key = archive.key_for_url(url) if archive else None
+    if key:
+        entry = archive.get(*key, fmt)
+        if entry:
+            return {
+                "title": entry["title"],
+                "id": entry["id"],
+                "extractor": entry["extractor"],
+                "output_dir": str(output_dir),
+                "files": [],
+                "skipped": True,
+            }
+
     opts = get_base_opts(output_dir, write_metadata)
+    if quiet:
+        opts.update({"quiet": True, "noprogress": True})
 
     if audio_only:
         opts.update({
@@ -91,31 +122,56 @@ def download_video(
     with YoutubeDL(opts) as ydl:
         info = ydl.extract_info(url, download=True)
 
+        files = [
+            d["filepath"] for d in info.get("requested_downloads") or []
+            if d.get("filepath")
+        ]
+        if archive:
+            archive.add(
+                info.get("extractor_key"), info.get("id"), fmt,
+                title=info.get("title"), path=files[0] if files else None
+            )
+
         return {
             "title": info.get("title"),
             "id": info.get("id"),
+            "extractor": info.get("extractor_key"),
             "duration": info.get("duration"),
             "uploader": info.get("uploader"),
             "upload_date": info.get("upload_date"),
             "view_count": info.get("view_count"),
             "description": info.get("description", "")[:500],
             "output_dir": str(output_dir),
+            "files": files,
         }
 
 
-def extract_metadata(url: str, output_dir: Path = DEFAULT_OUTPUT_DIR) -> dict:
+def extract_metadata(
+    url: str,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    archive: DownloadArchive = None,
+) -> dict:
     """
     Extract metadata without downloading.
 
     Args:
         url: YouTube video URL
         output_dir: Directory to save .info.json
+        archive: Reuse the archived .info.json when present, and record
+                 new extractions
 
     Returns:
         Full metadata dict
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    key = archive.key_for_url(url) if archive else None
+    if key:
+        entry = archive.get(*key, "metadata")
+        if entry and entry["path"] and Path(entry["path"]).exists():
+            with open(entry["path"], "r", encoding="utf-8") as f:
+                return json.load(f)
+
     opts = {
         "outtmpl": str(output_dir / "%(title)s.%(ext)s"),
         "writeinfojson": True,
@@ -131,13 +187,157 @@ def extract_metadata(url: str, output_dir: Path = DEFAULT_OUTPUT_DIR) -> dict:
         with open(json_path, "w", encoding="utf-8") as f:
             json.dump(info, f, indent=2, ensure_ascii=False)
 
+        if archive:
+            archive.add(
+                info.get("extractor_key"), info.get("id"), "metadata",
+                title=info.get("title"), path=str(json_path)
+            )
+
         return info
 
 
+def get_playlist_opts(output_dir: Path, audio_only: bool = False) -> dict:
+    """Get yt-dlp options for playlist entries."""
+    opts = get_base_opts(output_dir)
+
+    if audio_only:
+        opts.update({
+            "format": "bestaudio/best",
+            "postprocessors": [{
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": "mp3",
+                "preferredquality": "0",
+            }],
+        })
+    else:
+        opts["format"] = "bestvideo+bestaudio/best"
+        opts["merge_output_format"] = "mp4"
+
+    return opts
+
+
+def list_playlist_entries(url: str) -> list:
+    """
+    Flat-extract a playlist or channel: entry IDs, titles and URLs only.
+
+    No per-video pages are fetched, so this is one request per playlist page.
+
+    Returns:
+        List of dicts with 'id', 'extractor', 'title', 'url', plus whatever
+        other fields the flat listing carries (duration, channel, view_count, ...)
+    """
+    opts = {
+        "extract_flat": "in_playlist",
+        "quiet": True,
+        "no_warnings": True,
+    }
+
+    with YoutubeDL(opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    entries = []
+    for entry in info.get("entries") or []:
+        if not entry:
+            continue
+        entry_url = entry.get("webpage_url") or entry.get("url")
+        if not entry_url or not entry_url.startswith("http"):
+            entry_url = f"https://www.youtube.com/watch?v={entry['id']}"
+        entries.append({
+            **entry,
+            "id": entry.get("id"),
+            "extractor": entry.get("ie_key"),
+            "title": entry.get("title"),
+            "url": entry_url,
+        })
+
+    return entries
+
+
+def _download_entry(entry: dict, opts: dict) -> dict:
+    """Download one playlist entry with its own YoutubeDL instance."""
+    try:
+        with YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(entry["url"], download=True)
+        return {
+            "title": info.get("title"),
+            "id": info.get("id"),
+            "extractor": info.get("extractor_key"),
+            "duration": info.get("duration"),
+        }
+    except Exception as e:  # Isolate failures to this entry
+        return {
+            "title": entry.get("title"),
+            "id": entry.get("id"),
+            "duration": None,
+            "error": str(e),
+        }
+
+
+def iter_playlist_downloads(
+    url: str,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    audio_only: bool = False,
+    jobs: int = 4,
+    archive: DownloadArchive = None,
+) -> Iterator[dict]:
+    """
+    Download playlist entries on a bounded worker pool, yielding results as they complete.
+
+    The playlist is flat-extracted first, then each entry is downloaded by
+    its own YoutubeDL instance (instances are not thread-safe). A failed
+    entry yields a dict with an 'error' key and does not affect the others.
+
+    Args:
+        url: YouTube playlist or channel URL
+        output_dir: Directory to save files
+        audio_only: If True, extract audio only
+        jobs: Number of concurrent downloads
+        archive: Skip archived entries (checked against the flat listing,
+                 before any per-video request) and record new downloads
+
+    Yields:
+        Download info dicts, in completion order
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = list_playlist_entries(url)
+    fmt = format_signature(audio_only)
+
+    if archive:
+        listed = len(entries)
+        entries = [
+            e for e in entries
+            if not (e["extractor"] and e["id"] and archive.contains(e["extractor"], e["id"], fmt))
+        ]
+        if listed > len(entries):
+            print(f"Skipping {listed - len(entries)} archived entries", file=sys.stderr)
+
+    total = len(entries)
+    print(f"Playlist has {total} entries, downloading with {jobs} workers", file=sys.stderr)
+
+    opts = get_playlist_opts(output_dir, audio_only)
+    # Parallel progress bars interleave into noise; report per entry instead
+    opts.update({"quiet": True, "noprogress": True})
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_download_entry, entry, opts) for entry in entries]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            if "error" in result:
+                print(f"   [{done}/{total}] FAILED: {result['title']} - {result['error']}", file=sys.stderr)
+            else:
+                print(f"   [{done}/{total}] Downloaded: {result['title']}", file=sys.stderr)
+                if archive and result["extractor"]:
+                    archive.add(result["extractor"], result["id"], fmt, title=result["title"])
+            yield result
+
+
 def download_playlist(
     url: str,
     output_dir: Path = DEFAULT_OUTPUT_DIR,
     audio_only: bool = False,
+    jobs: int = 1,
+    archive: DownloadArchive = None,
 ) -> list:
     """
     Download all videos in a playlist.
@@ -146,28 +346,23 @@ def download_playlist(
         url: YouTube playlist URL
         output_dir: Directory to save files
         audio_only: If True, extract audio only
+        jobs: Concurrent downloads. 1 hands the whole playlist to a single
+              YoutubeDL call; >1 uses iter_playlist_downloads()
+        archive: Skip archived entries; always uses iter_playlist_downloads()
+                 so the archive is checked before per-video extraction
 
     Returns:
-        List of download info dicts
+        List of download info dicts for new downloads (entries that failed
+        have an 'error' key when jobs > 1 or archive is set)
     """
+    if jobs > 1 or archive is not None:
+        return list(iter_playlist_downloads(url, output_dir, audio_only, jobs, archive))
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    opts = get_base_opts(output_dir)
+    opts = get_playlist_opts(output_dir, audio_only)
     opts["ignoreerrors"] = True
 
-    if audio_only:
-        opts.update({
-            "format": "bestaudio/best",
-            "postprocessors": [{
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "0",
-            }],
-        })
-    else:
-        opts["format"] = "bestvideo+bestaudio/best"
-        opts["merge_output_format"] = "mp4"
-
     results = []
 
     with YoutubeDL(opts) as ydl:
@@ -220,18 +415,38 @@ def main():
         action="store_true",
         help="Download entire playlist"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Concurrent downloads for --playlist (default: 1)"
+    )
     parser.add_argument(
         "--no-metadata",
         action="store_true",
         help="Don't write .info.json sidecar file"
     )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        help=f"Download archive path (default: <output-dir>/{ARCHIVE_FILENAME})"
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Ignore the download archive and re-download everything"
+    )
 
     args = parser.parse_args()
 
+    archive = None
+    if not args.no_archive:
+        archive = DownloadArchive(args.archive or args.output_dir / ARCHIVE_FILENAME)
+
     try:
         if args.metadata_only:
             print(f"Extracting metadata from: {args.url}", file=sys.stderr)
-            info = extract_metadata(args.url, args.output_dir)
+            info = extract_metadata(args.url, args.output_dir, archive)
             print(f"SUCCESS: Metadata extracted: {info.get('title')}", file=sys.stderr)
             print(f"   Duration: {info.get('duration')}s", file=sys.stderr)
             print(f"   Uploader: {info.get('uploader')}", file=sys.stderr)
@@ -240,10 +455,16 @@ def main():
 
         elif args.playlist:
             print(f"Downloading playlist: {args.url}", file=sys.stderr)
-            results = download_playlist(args.url, args.output_dir, args.audio_only)
-            print(f"SUCCESS: Downloaded {len(results)} videos", file=sys.stderr)
+            results = download_playlist(args.url, args.output_dir, args.audio_only, args.jobs, archive)
+            failed = [r for r in results if "error" in r]
+            print(f"SUCCESS: Downloaded {len(results) - len(failed)} videos", file=sys.stderr)
             for r in results:
-                print(f"   - {r['title']}", file=sys.stderr)
+                if "error" not in r:
+                    print(f"   - {r['title']}", file=sys.stderr)
+            if failed:
+                print(f"FAILED: {len(failed)} videos", file=sys.stderr)
+                for r in failed:
+                    print(f"   - {r['title']}: {r['error']}", file=sys.stderr)
 
         else:
             print(f"Downloading: {args.url}", file=sys.stderr)
@@ -253,7 +474,11 @@ def main():
                 audio_only=args.audio_only,
                 max_resolution=args.max_resolution,
                 write_metadata=not args.no_metadata,
+                archive=archive,
             )
+            if info.get("skipped"):
+                print(f"SKIPPED: Already downloaded: {info['title']}", file=sys.stderr)
+                return
             print(f"SUCCESS: Downloaded: {info['title']}", file=sys.stderr)
             print(f"   Duration: {info['duration']}s", file=sys.stderr)
             print(f"   Output: {info['output_dir']}", file=sys.stderr)
@@ -261,6 +486,9 @@ def main():
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if archive:
+            archive.close()
 
 
 if __name__ == "__main__":
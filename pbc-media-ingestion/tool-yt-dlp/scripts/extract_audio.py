@@ -1,25 +1,376 @@
 """
 Audio extraction wrapper for transcription pipeline.
 
-STATUS: STUB - Not yet implemented
+Produces speech-to-text ready audio: 16 kHz mono WAV (16-bit PCM), FLAC or
+Opus, the input format Whisper-style engines resample to anyway, so the
+transcription step needs no second conversion.
+
+For URLs, the smallest adequate audio-only format is downloaded (no video,
+no thumbnail, no metadata postprocessors) and converted by a single ffmpeg
+pass; the downloaded source is deleted afterwards unless --keep-source.
+Local files and directories of already-downloaded media are converted the
+same way, in parallel (one single-threaded ffmpeg per worker).
 
 Usage:
-    python extract_audio.py <url>
-    python extract_audio.py <url> --format wav --quality 192
+    python extract_audio.py <url-or-path> [<url-or-path> ...] [options]
 
-Expected functionality:
-    - Extract audio in various formats (mp3, wav, flac)
-    - Quality/bitrate control
-    - Optimized for speech transcription
+Examples:
+    python extract_audio.py https://youtube.com/watch?v=VIDEO_ID
+    python extract_audio.py https://youtube.com/watch?v=VIDEO_ID --format flac
+    python extract_audio.py ../downloads --output-dir ./speech --jobs 8
+    python extract_audio.py lecture.mp4 podcast.m4a --format opus
 """
 
+import argparse
+import os
+import subprocess
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from yt_dlp import YoutubeDL
+
+from download_archive import ARCHIVE_FILENAME, DownloadArchive
+from download_youtube import DEFAULT_OUTPUT_DIR
+
+
+# Sample rate expected by speech-to-text models
+SPEECH_SAMPLE_RATE = 16000
+
+# ffmpeg encoder arguments per output format
+CODEC_ARGS = {
+    "wav": ["-c:a", "pcm_s16le"],
+    "flac": ["-c:a", "flac"],
+    "opus": ["-c:a", "libopus", "-b:a", "24k", "-application", "voip"],
+}
+
+# Smallest audio-only stream that is still clean speech (>= 48 kbps),
+# falling back to the best audio, then to a muxed format
+SPEECH_FORMAT = "worstaudio[vcodec=none][abr>=48]/bestaudio/best"
+
+# Extensions treated as media when scanning a directory
+MEDIA_EXTENSIONS = {
+    ".mp4", ".mkv", ".webm", ".mov", ".avi",
+    ".mp3", ".m4a", ".aac", ".opus", ".ogg", ".wav", ".flac",
+}
+
+
+def transcode_for_speech(source: Path, dest: Path, codec: str = "wav") -> Path:
+    """
+    Convert any media file to 16 kHz mono audio in one ffmpeg pass.
+
+    Video, subtitle and data streams and all metadata are dropped.
+
+    Raises:
+        RuntimeError: ffmpeg failed (message is ffmpeg's stderr)
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", str(source),
+        "-vn", "-sn", "-dn", "-map_metadata", "-1",
+        "-ac", "1", "-ar", str(SPEECH_SAMPLE_RATE),
+        # Parallelism comes from running several files at once
+        "-threads", "1",
+        *CODEC_ARGS[codec],
+        str(dest),
+    ]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        dest.unlink(missing_ok=True)
+        raise RuntimeError(e.stderr.strip() or f"ffmpeg exited with {e.returncode}")
+    return dest
+
+
+def speech_output_path(
+    source: Path,
+    output_dir: Path,
+    codec: str,
+    root: Path = None,
+    keep_suffix: bool = False,
+) -> Path:
+    """
+    Output path for a converted file, never overwriting the source.
+
+    Files found under a scanned directory (root) keep their relative
+    subdirectory below output_dir. keep_suffix names the output after the
+    full source name (talk.mp4 -> talk.mp4.wav), for sources sharing a stem.
+    """
+    subdir = source.parent.relative_to(root) if root else Path()
+    name = source.name if keep_suffix else source.stem
+    dest = output_dir / subdir / f"{name}.{codec}"
+    if dest.resolve() == source.resolve():
+        dest = output_dir / subdir / f"{name}.{SPEECH_SAMPLE_RATE // 1000}k.{codec}"
+    return dest
+
+
+def convert_file(source: Path, dest: Path, codec: str = "wav") -> dict:
+    """
+    Convert one local media file to dest, skipping it if dest is up to date.
+
+    Returns:
+        dict with 'source', 'output', 'bytes', 'seconds', 'skipped' and,
+        on failure, 'error'
+    """
+    result = {"source": str(source), "output": str(dest), "bytes": 0, "seconds": 0.0, "skipped": False}
+
+    if dest.exists() and dest.stat().st_mtime >= source.stat().st_mtime:
+        result.update({"bytes": dest.stat().st_size, "skipped": True})
+        return result
+
+    start = time.monotonic()
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        transcode_for_speech(source, dest, codec)
+    except Exception as e:  # Isolate failures to this file
+        result["error"] = str(e)
+        return result
+
+    result.update({"bytes": dest.stat().st_size, "seconds": round(time.monotonic() - start, 2)})
+    return result
+
+
+def download_speech_audio(
+    url: str,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    codec: str = "wav",
+    keep_source: bool = False,
+    archive: DownloadArchive = None,
+) -> dict:
+    """
+    Download the smallest adequate audio stream and convert it for speech.
+
+    Args:
+        url: Video URL
+        output_dir: Directory to save the converted audio
+        codec: 'wav', 'flac' or 'opus'
+        keep_source: Keep the downloaded audio stream after conversion
+        archive: Skip the video if already converted in this format, and
+                 record it afterwards
+
+    Returns:
+        dict with 'source', 'output', 'bytes', 'seconds', 'skipped' and,
+        on failure, 'error'
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    fmt = f"speech-{codec}"
+    result = {"source": url, "output": None, "bytes": 0, "seconds": 0.0, "skipped": False}
+
+    key = archive.key_for_url(url) if archive else None
+    if key:
+        entry = archive.get(*key, fmt)
+        if entry and entry["path"] and Path(entry["path"]).exists():
+            result.update({"output": entry["path"], "skipped": True})
+            return result
+
+    opts = {
+        "format": SPEECH_FORMAT,
+        # '.source' keeps the raw stream from colliding with the converted file
+        "outtmpl": str(output_dir / "%(title)s.source.%(ext)s"),
+        "windowsfilenames": True,
+        "quiet": True,
+        "noprogress": True,
+        "no_warnings": True,
+    }
+
+    start = time.monotonic()
+    try:
+        with YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+
+        source = Path(info["requested_downloads"][0]["filepath"])
+        dest = output_dir / f"{source.stem.removesuffix('.source')}.{codec}"
+        try:
+            transcode_for_speech(source, dest, codec)
+        finally:
+            if not keep_source:
+                source.unlink(missing_ok=True)
+    except Exception as e:  # Isolate failures to this URL
+        result["error"] = str(e)
+        return result
+
+    if archive:
+        archive.add(info.get("extractor_key"), info.get("id"), fmt, title=info.get("title"), path=str(dest))
+
+    result.update({
+        "output": str(dest),
+        "bytes": dest.stat().st_size,
+        "seconds": round(time.monotonic() - start, 2),
+    })
+    return result
+
+
+def find_media_files(path: Path, output_dir: Path, codec: str) -> list:
+    """
+    Media files in a directory tree (or the file itself), sorted by path.
+
+    Previous outputs (files of the output format anywhere under output_dir)
+    are left out, so scanning the output directory itself is safe to repeat.
+    """
+    if path.is_file():
+        return [path]
+
+    output_dir = output_dir.resolve()
+    return sorted(
+        p for p in path.rglob("*")
+        if p.is_file()
+        and p.suffix.lower() in MEDIA_EXTENSIONS
+        and ".source." not in p.name
+        and not (p.suffix.lower() == f".{codec}" and output_dir in p.resolve().parents)
+    )
+
+
+def plan_conversions(paths: list, output_dir: Path, codec: str) -> list:
+    """
+    (source, dest) pairs for local files and directories.
+
+    Sources in one directory that share a stem (talk.mp4, talk.mp3) keep
+    their extension in the output name.
+
+    Raises:
+        ValueError: two sources would still write the same output file
+    """
+    plan = {}
+    for path in paths:
+        root = path if path.is_dir() else None
+        media = find_media_files(path, output_dir, codec)
+        stems = Counter((source.parent, source.stem.lower()) for source in media)
+        for source in media:
+            shared = stems[(source.parent, source.stem.lower())] > 1
+            dest = speech_output_path(source, output_dir, codec, root, keep_suffix=shared)
+            # Case-folded: the same file on case-insensitive filesystems
+            other = plan.setdefault(str(dest.resolve()).lower(), (source, dest))[0]
+            if other.resolve() != source.resolve():
+                raise ValueError(f"{other} and {source} would both be converted to {dest}")
+    return list(plan.values())
+
+
+def extract_audio(
+    sources: list,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    codec: str = "wav",
+    jobs: int = None,
+    keep_source: bool = False,
+    archive: DownloadArchive = None,
+) -> list:
+    """
+    Convert URLs, local files and directories to speech-ready audio in parallel.
+
+    Args:
+        sources: URLs, media files or directories of media files
+        output_dir: Directory for converted audio
+        codec: 'wav', 'flac' or 'opus'
+        jobs: Concurrent conversions (default: CPU count)
+        keep_source: Keep downloaded audio streams after conversion
+        archive: Download archive for URL sources
+
+    Returns:
+        List of result dicts, in completion order
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 4
+
+    local = [Path(source) for source in sources if Path(source).exists()]
+    tasks = [(convert_file, media, dest, codec) for media, dest in plan_conversions(local, output_dir, codec)]
+    tasks.extend(
+        (download_speech_audio, source, output_dir, codec, keep_source, archive)
+        for source in sources if not Path(source).exists()
+    )
+
+    total = len(tasks)
+    print(f"Processing {total} items with {jobs} workers -> {codec}, {SPEECH_SAMPLE_RATE} Hz mono", file=sys.stderr)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(*task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results.append(result)
+            if "error" in result:
+                print(f"   [{done}/{total}] FAILED: {result['source']} - {result['error']}", file=sys.stderr)
+            elif result["skipped"]:
+                print(f"   [{done}/{total}] Up to date: {result['output']}", file=sys.stderr)
+            else:
+                print(f"   [{done}/{total}] Converted: {result['output']}", file=sys.stderr)
+
+    return results
 
 
 def main():
-    print("ERROR: extract_audio.py is a stub - not yet implemented", file=sys.stderr)
-    print("   Use: download_youtube.py --audio-only <url>", file=sys.stderr)
-    sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Extract speech-ready audio (16 kHz mono) for transcription"
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Video URLs, media files, or directories of media files"
+    )
+    parser.add_argument(
+        "-o", "--output-dir",
+        type=Path,
+        default=DEFAULT_OUTPUT_DIR,
+        help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})"
+    )
+    parser.add_argument(
+        "-f", "--format",
+        choices=sorted(CODEC_ARGS),
+        default="wav",
+        help="Output format (default: wav)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="Concurrent conversions (default: CPU count)"
+    )
+    parser.add_argument(
+        "--keep-source",
+        action="store_true",
+        help="Keep downloaded audio streams after conversion"
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Ignore the download archive for URL sources"
+    )
+
+    args = parser.parse_args()
+
+    archive = None
+    if not args.no_archive:
+        archive = DownloadArchive(args.output_dir / ARCHIVE_FILENAME)
+
+    try:
+        results = extract_audio(
+            args.sources,
+            args.output_dir,
+            codec=args.format,
+            jobs=args.jobs,
+            keep_source=args.keep_source,
+            archive=archive,
+        )
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if archive:
+            archive.close()
+
+    failed = [r for r in results if "error" in r]
+    converted = [r for r in results if "error" not in r and not r["skipped"]]
+    skipped = len(results) - len(failed) - len(converted)
+
+    print(f"SUCCESS: Converted {len(converted)} items", file=sys.stderr)
+    print(f"   Output: {args.output_dir}", file=sys.stderr)
+    print(f"   Total: {sum(r['bytes'] for r in converted) / 1024 / 1024:.1f} MB", file=sys.stderr)
+    if skipped:
+        print(f"   Skipped (up to date): {skipped}", file=sys.stderr)
+    if failed:
+        print(f"FAILED: {len(failed)} items", file=sys.stderr)
+        for r in failed:
+            print(f"   - {r['source']}: {r['error']}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,25 +1,348 @@
 """
 Extract metadata JSON without downloading media.
 
-STATUS: STUB - Not yet implemented
+Bulk, network-light metadata harvester. Sources can be single video URLs,
+playlists or channels, given on the command line or in a URL file.
+Playlists and channels are flat-extracted (one request per listing page), then
+full per-video info is fetched concurrently on a worker pool. Each record is
+projected to a field subset and streamed to a single JSONL file as it
+completes; .parquet output is also supported when pyarrow is installed.
+
+With --flat, no per-video requests are made at all: playlist records carry
+only the fields the flat listing provides (id, title, duration, channel,
+view_count, ... depending on the site).
 
 Usage:
-    python extract_metadata.py <url>
-    python extract_metadata.py <url> --output metadata.json
+    python extract_metadata.py <url> [<url> ...] [options]
+    python extract_metadata.py --input urls.txt [options]
 
-Expected functionality:
-    - Extract full metadata from URL
-    - Output JSON to stdout or file
-    - Support for playlists (list all video metadata)
+Examples:
+    python extract_metadata.py https://youtube.com/watch?v=VIDEO_ID --output -
+    python extract_metadata.py https://youtube.com/@CHANNEL/videos --jobs 8
+    python extract_metadata.py https://youtube.com/@CHANNEL/videos --flat
+    python extract_metadata.py --input urls.txt --fields id,title,duration,tags
+    python extract_metadata.py --input urls.txt --output catalogue.parquet
+    python extract_metadata.py --input urls.txt --resume
 """
 
+import argparse
+import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from yt_dlp import YoutubeDL
+
+from batch_download import load_urls_from_file
+from download_archive import url_video_key
+from download_youtube import DEFAULT_OUTPUT_DIR, list_playlist_entries
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # Parquet output needs pyarrow; JSONL works without it
+    pyarrow = None
+
+
+# Fields kept by default (yt-dlp info dict keys)
+DEFAULT_FIELDS = [
+    "id",
+    "title",
+    "webpage_url",
+    "duration",
+    "upload_date",
+    "uploader",
+    "channel",
+    "channel_id",
+    "view_count",
+    "like_count",
+    "description",
+    "tags",
+    "categories",
+]
+
+DEFAULT_OUTPUT = DEFAULT_OUTPUT_DIR / "metadata.jsonl"
+
+# One YoutubeDL instance per worker thread (instances are not thread-safe)
+_thread_local = threading.local()
+
+
+def project(info: dict, fields: list) -> dict:
+    """Keep only the requested fields (missing ones become None)."""
+    record = {field: info.get(field) for field in fields}
+    if "webpage_url" in record and record["webpage_url"] is None:
+        record["webpage_url"] = info.get("url")
+    return record
+
+
+def expand_sources(sources: list) -> tuple[list, list]:
+    """
+    Turn source URLs into per-video entries.
+
+    URLs with a video ID readable from the URL are kept as-is; anything else
+    (playlists, channels) is flat-extracted into its entries. Entries are
+    deduplicated by video ID. A source whose listing fails is reported and
+    skipped, so one bad playlist does not stop the harvest.
+
+    Returns:
+        (entries, failed): entries are dicts with at least 'id' (or None)
+        and 'url', playlist entries also carry the flat listing fields;
+        failed lists {'url', 'error'} per source that could not be listed
+    """
+    entries = []
+    failed = []
+    seen = set()
+
+    def add(entry: dict) -> None:
+        key = entry.get("id") or entry["url"]
+        if key not in seen:
+            seen.add(key)
+            entries.append(entry)
+
+    for url in sources:
+        video_key = url_video_key(url)
+        if video_key:
+            add({"id": video_key[1], "url": url})
+            continue
+
+        try:
+            listed = list_playlist_entries(url)
+        except Exception as e:  # Isolate failures to this source
+            failed.append({"url": url, "error": str(e)})
+            print(f"   FAILED to list: {url} - {e}", file=sys.stderr)
+            continue
+        if listed:
+            print(f"Listed {len(listed)} entries: {url}", file=sys.stderr)
+            for entry in listed:
+                add(entry)
+        else:
+            add({"id": None, "url": url})
+
+    return entries, failed
+
+
+def fetch_info(url: str) -> dict:
+    """Fetch full info for one video, reusing this thread's YoutubeDL."""
+    ydl = getattr(_thread_local, "ydl", None)
+    if ydl is None:
+        ydl = YoutubeDL({
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+            "noplaylist": True,
+        })
+        _thread_local.ydl = ydl
+    return ydl.extract_info(url, download=False)
+
+
+def load_done_ids(output: Path) -> set:
+    """IDs already present in an existing JSONL output."""
+    done = set()
+    if not output.exists():
+        return done
+    with open(output, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Partial last line from an interrupted write
+                continue
+            if record.get("id"):
+                done.add(record["id"])
+    return done
+
+
+class RecordWriter:
+    """Streams records to JSONL (flushed per record) or buffers them for Parquet."""
+
+    def __init__(self, output: Path | None, append: bool = False):
+        self.output = output
+        self.count = 0
+        self._rows = None
+        self._file = None
+
+        if output is None:
+            self._file = sys.stdout
+        elif output.suffix.lower() == ".parquet":
+            if pyarrow is None:
+                raise RuntimeError("pyarrow is required for Parquet output (uv pip install pyarrow)")
+            self._rows = []
+        else:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(output, "a" if append else "w", encoding="utf-8")
+
+    def write(self, record: dict) -> None:
+        self.count += 1
+        if self._rows is not None:
+            self._rows.append(record)
+            return
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._rows is not None:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            pyarrow.parquet.write_table(pyarrow.Table.from_pylist(self._rows), self.output)
+        elif self._file is not sys.stdout:
+            self._file.close()
+
+
+def harvest_metadata(
+    sources: list,
+    output: Path | None = DEFAULT_OUTPUT,
+    fields: list = DEFAULT_FIELDS,
+    jobs: int = 8,
+    flat: bool = False,
+    resume: bool = False,
+) -> dict:
+    """
+    Harvest metadata for videos, playlists and channels.
+
+    Args:
+        sources: Video, playlist or channel URLs
+        output: .jsonl or .parquet path; None writes JSONL to stdout
+        fields: Fields to keep from each info dict
+        jobs: Concurrent per-video info fetches
+        flat: Use flat listing fields only for playlist entries (no
+              per-video requests)
+        resume: Append to an existing JSONL output, skipping IDs already in it
+
+    Returns:
+        dict with 'written', 'skipped' and 'failed' (list of {'url', 'error'})
+    """
+    entries, failed = expand_sources(sources)
+
+    skipped = 0
+    append = resume and output is not None and output.suffix.lower() != ".parquet"
+    if append:
+        done = load_done_ids(output)
+        pending = [e for e in entries if e.get("id") not in done]
+        skipped = len(entries) - len(pending)
+        entries = pending
+        if skipped:
+            print(f"Resuming: skipping {skipped} videos already in {output}", file=sys.stderr)
+
+    writer = RecordWriter(output, append=append)
+
+    try:
+        # Playlist entries carry listing fields; with --flat those are enough
+        if flat:
+            to_fetch = []
+            for entry in entries:
+                if "extractor" in entry:
+                    writer.write(project(entry, fields))
+                else:
+                    to_fetch.append(entry)
+        else:
+            to_fetch = entries
+
+        total = len(to_fetch)
+        if total:
+            print(f"Fetching info for {total} videos with {jobs} workers", file=sys.stderr)
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(fetch_info, entry["url"]): entry for entry in to_fetch}
+            for done, future in enumerate(as_completed(futures), 1):
+                entry = futures[future]
+                try:
+                    writer.write(project(future.result(), fields))
+                except Exception as e:  # Isolate failures to this video
+                    failed.append({"url": entry["url"], "error": str(e)})
+                    print(f"   [{done}/{total}] FAILED: {entry['url']} - {e}", file=sys.stderr)
+                    continue
+                if done % 100 == 0:
+                    print(f"   [{done}/{total}] fetched", file=sys.stderr)
+    finally:
+        writer.close()
+
+    return {
+        "written": writer.count,
+        "skipped": skipped,
+        "failed": failed,
+    }
 
 
 def main():
-    print("ERROR: extract_metadata.py is a stub - not yet implemented", file=sys.stderr)
-    print("   Use: download_youtube.py --metadata-only <url>", file=sys.stderr)
-    sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Extract video metadata in bulk without downloading media"
+    )
+    parser.add_argument(
+        "urls",
+        nargs="*",
+        help="Video, playlist or channel URLs"
+    )
+    parser.add_argument(
+        "-i", "--input",
+        help="Text file with one URL per line (# for comments)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Output .jsonl or .parquet file, or - for stdout (default: {DEFAULT_OUTPUT})"
+    )
+    parser.add_argument(
+        "--fields",
+        default=",".join(DEFAULT_FIELDS),
+        help="Comma-separated fields to keep (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=8,
+        help="Concurrent per-video info fetches (default: 8)"
+    )
+    parser.add_argument(
+        "--flat",
+        action="store_true",
+        help="Use flat playlist listing fields only; no per-video requests"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Append to an existing JSONL output, skipping IDs already in it"
+    )
+
+    args = parser.parse_args()
+
+    sources = list(args.urls)
+    if args.input:
+        try:
+            sources.extend(load_urls_from_file(args.input))
+        except FileNotFoundError:
+            print(f"ERROR: URL file not found: {args.input}", file=sys.stderr)
+            sys.exit(1)
+
+    if not sources:
+        print("ERROR: No URLs given (pass URLs or --input)", file=sys.stderr)
+        sys.exit(1)
+
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()]
+    output = None if args.output == "-" else Path(args.output)
+
+    try:
+        summary = harvest_metadata(
+            sources,
+            output,
+            fields=fields,
+            jobs=args.jobs,
+            flat=args.flat,
+            resume=args.resume,
+        )
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"SUCCESS: Wrote {summary['written']} records", file=sys.stderr)
+    if output:
+        print(f"   Output: {output}", file=sys.stderr)
+    if summary["skipped"]:
+        print(f"   Skipped (already in output): {summary['skipped']}", file=sys.stderr)
+    if summary["failed"]:
+        print(f"FAILED: {len(summary['failed'])} videos", file=sys.stderr)
+        for r in summary["failed"]:
+            print(f"   - {r['url']}: {r['error']}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,251 @@
+"""
+Stream audio to a consumer as fixed-size PCM chunks, without writing media to disk.
+
+yt-dlp writes the best audio stream to a pipe, ffmpeg decodes it to 16 kHz
+mono signed 16-bit little-endian PCM on another pipe, and the chunks are
+exposed as a generator (iter_pcm_chunks) or async iterator
+(aiter_pcm_chunks). A transcriber can start on minute one while the
+download is still in progress, and memory/disk use is bounded by the chunk
+size and the OS pipe buffers, not by the media length.
+
+Each chunk is chunk_seconds of audio (the last one may be shorter):
+chunk_seconds * sample_rate * 2 bytes.
+
+Usage:
+    from stream_audio import iter_pcm_chunks, aiter_pcm_chunks
+
+    for chunk in iter_pcm_chunks(url, chunk_seconds=30):
+        transcriber.feed(chunk)
+
+    async for chunk in aiter_pcm_chunks(url):
+        await transcriber.feed(chunk)
+
+CLI (raw PCM to stdout, progress to stderr):
+    python stream_audio.py <url> [--chunk-seconds 30] | <consumer>
+
+Examples:
+    python stream_audio.py https://youtube.com/watch?v=VIDEO_ID > talk.pcm
+    python stream_audio.py https://youtube.com/watch?v=VIDEO_ID | whisper-stream --pcm-16k
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+from typing import AsyncIterator, Iterator
+
+from extract_audio import SPEECH_SAMPLE_RATE
+
+
+# Bytes per sample (s16le)
+SAMPLE_WIDTH = 2
+
+# Best audio-only stream; muxed formats as a fallback
+STREAM_FORMAT = "bestaudio/best"
+
+
+def _ytdlp_cmd(url: str, audio_format: str) -> list:
+    return [
+        sys.executable, "-m", "yt_dlp",
+        "--format", audio_format,
+        "--output", "-",
+        "--quiet", "--no-warnings", "--no-part", "--no-playlist",
+        url,
+    ]
+
+
+def _ffmpeg_cmd(sample_rate: int) -> list:
+    return [
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-i", "pipe:0",
+        "-vn", "-ac", "1", "-ar", str(sample_rate),
+        "-f", "s16le", "pipe:1",
+    ]
+
+
+def _check_exit(name: str, returncode: int, stderr: bytes) -> None:
+    if returncode not in (0, None):
+        message = stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"{name} exited with {returncode}: {message}")
+
+
+def iter_pcm_chunks(
+    url: str,
+    chunk_seconds: float = 30.0,
+    sample_rate: int = SPEECH_SAMPLE_RATE,
+    audio_format: str = STREAM_FORMAT,
+) -> Iterator[bytes]:
+    """
+    Stream a URL's audio as mono s16le PCM chunks.
+
+    Args:
+        url: Video or audio URL
+        chunk_seconds: Audio duration per chunk
+        sample_rate: Output sample rate
+        audio_format: yt-dlp format selector
+
+    Yields:
+        PCM bytes, chunk_seconds long (the last chunk may be shorter)
+
+    Raises:
+        RuntimeError: yt-dlp or ffmpeg failed
+
+    Closing the generator early (break, exception) stops both processes.
+    """
+    chunk_bytes = int(chunk_seconds * sample_rate) * SAMPLE_WIDTH
+
+    # stderr goes to temporary files, not pipes: a process logging one line
+    # per bad packet would fill a pipe nobody reads until stdout hits EOF,
+    # block on it, and hang the stream
+    downloader_log = tempfile.TemporaryFile()
+    decoder_log = tempfile.TemporaryFile()
+    try:
+        downloader = subprocess.Popen(
+            _ytdlp_cmd(url, audio_format), stdout=subprocess.PIPE, stderr=downloader_log
+        )
+        decoder = subprocess.Popen(
+            _ffmpeg_cmd(sample_rate), stdin=downloader.stdout,
+            stdout=subprocess.PIPE, stderr=decoder_log
+        )
+        # Only ffmpeg should hold the read end, so yt-dlp sees EPIPE if ffmpeg dies
+        downloader.stdout.close()
+
+        try:
+            while True:
+                chunk = decoder.stdout.read(chunk_bytes)
+                if not chunk:
+                    break
+                yield chunk
+
+            decoder.wait()
+            downloader.wait()
+        finally:
+            # No-op after a normal finish; stops both on early close
+            for proc in (decoder, downloader):
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+            decoder.stdout.close()
+
+        downloader_log.seek(0)
+        downloader_err = downloader_log.read()
+        decoder_log.seek(0)
+        decoder_err = decoder_log.read()
+    finally:
+        downloader_log.close()
+        decoder_log.close()
+
+    _check_exit("yt-dlp", downloader.returncode, downloader_err)
+    _check_exit("ffmpeg", decoder.returncode, decoder_err)
+
+
+async def aiter_pcm_chunks(
+    url: str,
+    chunk_seconds: float = 30.0,
+    sample_rate: int = SPEECH_SAMPLE_RATE,
+    audio_format: str = STREAM_FORMAT,
+) -> AsyncIterator[bytes]:
+    """
+    Async version of iter_pcm_chunks(), built on asyncio subprocesses.
+
+    Yields:
+        PCM bytes, chunk_seconds long (the last chunk may be shorter)
+    """
+    chunk_bytes = int(chunk_seconds * sample_rate) * SAMPLE_WIDTH
+
+    read_fd, write_fd = os.pipe()
+    try:
+        downloader = await asyncio.create_subprocess_exec(
+            *_ytdlp_cmd(url, audio_format), stdout=write_fd, stderr=asyncio.subprocess.PIPE
+        )
+        decoder = await asyncio.create_subprocess_exec(
+            *_ffmpeg_cmd(sample_rate), stdin=read_fd,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+    # Drain stderr concurrently so a chatty process can never block on it
+    downloader_err = asyncio.ensure_future(downloader.stderr.read())
+    decoder_err = asyncio.ensure_future(decoder.stderr.read())
+
+    try:
+        while True:
+            try:
+                chunk = await decoder.stdout.readexactly(chunk_bytes)
+            except asyncio.IncompleteReadError as e:
+                if e.partial:
+                    yield e.partial
+                break
+            yield chunk
+
+        await decoder.wait()
+        await downloader.wait()
+        # stderr hits EOF once both have exited; let the readers finish
+        downloader_stderr, decoder_stderr = await asyncio.gather(downloader_err, decoder_err)
+    finally:
+        # No-op after a normal finish; stops both on early close
+        for proc in (decoder, downloader):
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        for task in (downloader_err, decoder_err):
+            if not task.done():
+                task.cancel()
+
+    _check_exit("yt-dlp", downloader.returncode, downloader_stderr)
+    _check_exit("ffmpeg", decoder.returncode, decoder_stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Stream audio as 16 kHz mono s16le PCM to stdout"
+    )
+    parser.add_argument(
+        "url",
+        help="Video or audio URL"
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=30.0,
+        help="Audio per chunk written to stdout (default: 30)"
+    )
+    parser.add_argument(
+        "--sample-rate",
+        type=int,
+        default=SPEECH_SAMPLE_RATE,
+        help=f"Output sample rate (default: {SPEECH_SAMPLE_RATE})"
+    )
+
+    args = parser.parse_args()
+
+    if sys.stdout.isatty():
+        print("ERROR: Refusing to write raw PCM to a terminal; pipe or redirect stdout", file=sys.stderr)
+        sys.exit(1)
+
+    out = sys.stdout.buffer
+    seconds = 0.0
+    try:
+        for chunk in iter_pcm_chunks(args.url, args.chunk_seconds, args.sample_rate):
+            out.write(chunk)
+            out.flush()
+            seconds += len(chunk) / (args.sample_rate * SAMPLE_WIDTH)
+            print(f"   Streamed {seconds:.0f}s", file=sys.stderr)
+    except BrokenPipeError:
+        # Consumer stopped reading; not an error. Point stdout at devnull so
+        # the interpreter's final flush doesn't raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"SUCCESS: Streamed {seconds:.1f}s of audio", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
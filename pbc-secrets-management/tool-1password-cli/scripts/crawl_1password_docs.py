@@ -16,23 +16,45 @@ Purpose:
 
 Usage:
     python crawl_1password_docs.py [--input discovery.json] [--output-dir ../docs]
+    python crawl_1password_docs.py --engine auto   # plain HTTP, browser only for SPA shells
+    python crawl_1password_docs.py --incremental   # refresh: skip and keep unchanged pages
 
 Output:
     ../docs/*.md files with YAML front matter
+    ../docs/_crawl_manifest.json (per-URL file, content hash, ETag/Last-Modified)
+
+Incremental mode:
+    Pages whose sitemap lastmod is unchanged, or that answer a conditional
+    request (If-None-Match / If-Modified-Since) with 304, are not fetched.
+    Fetched pages are rewritten in place only when their markdown changed.
+    The run reports added/changed/unchanged/removed counts.
 """
 
 import argparse
 import asyncio
+import hashlib
 import json
 import re
 from datetime import date
 from pathlib import Path
 from urllib.parse import urlparse
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+import aiohttp
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
 from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
 
 
+# Fetch engines: browser (Chromium), http (no browser), auto (http, browser fallback)
+ENGINES = ('browser', 'http', 'auto')
+
+# Fewer words than this in the extracted markdown suggests a client-rendered shell
+SPA_SHELL_MIN_WORDS = 50
+
+# Incremental crawl manifest, written inside the output directory
+MANIFEST_FILENAME = '_crawl_manifest.json'
+
+
 def should_include_url(url: str) -> bool:
     """
     Filter URLs to exclude individual shell plugin pages.
@@ -123,6 +145,22 @@ def url_to_filename(url: str) -> str:
         return f"{slugify('-'.join(segments))}.md"
 
 
+def assign_filename(url: str, owners: dict) -> str:
+    """
+    Claim a filename for a URL that has none yet.
+
+    Uses url_to_filename(); if another URL already owns that name, a short
+    hash of the URL is appended, so the result is the same on every run.
+    owners ({filename: url}) is updated in place.
+    """
+    filename = url_to_filename(url)
+    if owners.get(filename, url) != url:
+        stem = filename.removesuffix('.md')
+        filename = f"{stem}-{hashlib.sha256(url.encode('utf-8')).hexdigest()[:8]}.md"
+    owners[filename] = url
+    return filename
+
+
 def categorize_url(url: str, title: str) -> str:
     """
     Determine category based on URL and title.
@@ -223,15 +261,149 @@ related: []
 """
 
 
-async def crawl_urls(urls: list, output_dir: Path, concurrent: int = 5):
+def create_crawler(engine: str) -> AsyncWebCrawler:
+    """Create a browser-backed or plain-HTTP (pooled, no browser) crawler."""
+    if engine == 'http':
+        strategy = AsyncHTTPCrawlerStrategy(
+            browser_config=HTTPCrawlerConfig(method="GET", follow_redirects=True),
+            max_connections=50
+        )
+        return AsyncWebCrawler(crawler_strategy=strategy)
+
+    return AsyncWebCrawler(config=BrowserConfig())
+
+
+def needs_browser(result) -> bool:
+    """True if an HTTP-fetched page failed or rendered (almost) no text."""
+    if not result.success or not result.markdown:
+        return True
+    markdown = result.markdown.fit_markdown or result.markdown.raw_markdown or ''
+    return len(markdown.split()) < SPA_SHELL_MIN_WORDS
+
+
+async def fetch_all(url_list: list, run_config, engine: str) -> list:
+    """
+    Fetch URLs with the selected engine.
+
+    In auto mode, pages are fetched over plain HTTP first and only those that
+    fail or come back as empty SPA shells are re-fetched with the browser.
+    """
+    if engine == 'browser':
+        async with create_crawler('browser') as crawler:
+            return await crawler.arun_many(url_list, config=run_config)
+
+    async with create_crawler('http') as crawler:
+        results = await crawler.arun_many(url_list, config=run_config)
+
+    if engine == 'http':
+        return results
+
+    retry_urls = [r.url for r in results if needs_browser(r)]
+    if not retry_urls:
+        return results
+
+    print(f"Escalating {len(retry_urls)} URLs to browser")
+    async with create_crawler('browser') as crawler:
+        browser_results = await crawler.arun_many(retry_urls, config=run_config)
+
+    retried = set(retry_urls)
+    return [r for r in results if r.url not in retried] + list(browser_results)
+
+
+def load_manifest(output_dir: Path) -> dict:
+    """Load the crawl manifest ({url: record}), or {} if absent."""
+    manifest_path = output_dir / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('pages', {})
+
+
+def save_manifest(output_dir: Path, pages: dict):
+    """Write the crawl manifest."""
+    output = {
+        'updated': date.today().isoformat(),
+        'total_pages': len(pages),
+        'pages': pages
+    }
+    manifest_path = output_dir / MANIFEST_FILENAME
+    manifest_path.write_text(json.dumps(output, indent=2, sort_keys=True), encoding='utf-8')
+
+
+def get_header(headers: dict, name: str) -> str | None:
+    """Case-insensitive response header lookup."""
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+async def find_unchanged_urls(urls: list, manifest: dict, output_dir: Path, concurrent: int) -> set:
+    """
+    Find URLs that need no re-crawl.
+
+    A page is unchanged if its sitemap lastmod matches the manifest, or if a
+    conditional GET with its stored ETag / Last-Modified returns 304.
+    Pages without stored validators are always re-crawled.
+    """
+    unchanged = set()
+    to_check = []
+
+    for u in urls:
+        record = manifest.get(u['url'])
+        if not record or not (output_dir / record['file']).exists():
+            continue
+        if u.get('lastmod') and u['lastmod'] == record.get('lastmod'):
+            unchanged.add(u['url'])
+        elif record.get('etag') or record.get('last_modified'):
+            to_check.append((u['url'], record))
+
+    if not to_check:
+        return unchanged
+
+    async def check(session, url, record):
+        headers = {}
+        if record.get('etag'):
+            headers['If-None-Match'] = record['etag']
+        if record.get('last_modified'):
+            headers['If-Modified-Since'] = record['last_modified']
+        try:
+            async with session.get(url, headers=headers, allow_redirects=True) as response:
+                if response.status == 304:
+                    unchanged.add(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass  # Fall back to a full crawl
+
+    connector = aiohttp.TCPConnector(limit=concurrent)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await asyncio.gather(*(check(session, url, record) for url, record in to_check))
+
+    return unchanged
+
+
+async def crawl_urls(
+    urls: list,
+    output_dir: Path,
+    concurrent: int = 5,
+    engine: str = 'browser',
+    incremental: bool = False
+):
     """
     Crawl URLs and save as markdown with YAML front matter.
+
+    engine selects 'browser', 'http' (no browser) or 'auto' (HTTP with
+    browser fallback for pages that need JavaScript).
+
+    Each URL keeps one file across runs (recorded in the manifest), so a
+    re-crawl overwrites the same file instead of creating '-N' duplicates.
+
+    With incremental=True, unchanged pages are skipped (sitemap lastmod or a
+    304 on a conditional request) or left untouched (same markdown hash).
     """
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    browser_config = BrowserConfig()
-
     run_config = CrawlerRunConfig(
         scraping_strategy=LXMLWebScrapingStrategy(),
         word_count_threshold=10,
@@ -247,65 +419,103 @@ async def crawl_urls(urls: list, output_dir: Path, concurrent: int = 5):
         'saved': 0,
         'failed': 0,
         'skipped': 0,
-        'files': []
+        'files': [],
+        'added': 0,
+        'changed': 0,
+        'unchanged': 0,
+        'removed': []
     }
 
     # Extract just URLs for crawling
     url_list = [u['url'] for u in urls]
     url_metadata = {u['url']: u for u in urls}
 
-    print(f"Crawling {len(url_list)} URLs...")
-
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        results = await crawler.arun_many(url_list, config=run_config)
-
-        for result in results:
-            stats['crawled'] += 1
-
-            if result.success:
-                url = result.url
-                meta = url_metadata.get(url, {})
-
-                # Get content
-                markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
-                title = result.metadata.get('title', meta.get('title', 'Untitled'))
-
-                # Generate metadata
-                category = categorize_url(url, title)
-                keywords = extract_keywords(markdown, title)
-                relevance = extract_relevance(markdown, title)
-
-                # Build front matter
-                front_matter = build_yaml_front_matter(
-                    title=title,
-                    source_url=url,
-                    category=category,
-                    relevance=relevance,
-                    keywords=keywords
-                )
-
-                # Build full document
-                doc_content = front_matter + f"# {title}\n\n{markdown}"
-
-                # Generate filename
-                filename = url_to_filename(url)
-                filepath = output_dir / filename
-
-                # Avoid overwriting
-                if filepath.exists():
-                    stem = filepath.stem
-                    filepath = output_dir / f"{stem}-{stats['crawled']}.md"
-
-                filepath.write_text(doc_content, encoding='utf-8')
-
-                stats['saved'] += 1
-                stats['files'].append(str(filepath.name))
-
-                print(f"  [{stats['crawled']}/{len(url_list)}] Saved: {filepath.name}")
-
-            else:
-                stats['failed'] += 1
-                print(f"  [{stats['crawled']}/{len(url_list)}] Failed: {result.url}")
+    manifest = load_manifest(output_dir)
+
+    # Files already owned by a URL: a URL keeps its file, new pages never take another's
+    owners = {record['file']: url for url, record in manifest.items()}
+
+    if incremental:
+        unchanged = await find_unchanged_urls(urls, manifest, output_dir, concurrent)
+        stats['unchanged'] += len(unchanged)
+        stats['skipped'] += len(unchanged)
+        url_list = [url for url in url_list if url not in unchanged]
+        print(f"Incremental: {len(unchanged)} unchanged pages skipped")
+
+    print(f"Crawling {len(url_list)} URLs (engine: {engine})...")
+
+    results = await fetch_all(url_list, run_config, engine) if url_list else []
+
+    for result in results:
+        stats['crawled'] += 1
+
+        if result.success:
+            url = result.url
+            meta = url_metadata.get(url, {})
+
+            # Get content
+            markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
+            title = result.metadata.get('title', meta.get('title', 'Untitled'))
+
+            # Generate metadata
+            category = categorize_url(url, title)
+            keywords = extract_keywords(markdown, title)
+            relevance = extract_relevance(markdown, title)
+
+            # Build front matter
+            front_matter = build_yaml_front_matter(
+                title=title,
+                source_url=url,
+                category=category,
+                relevance=relevance,
+                keywords=keywords
+            )
+
+            # Build full document
+            doc_content = front_matter + f"# {title}\n\n{markdown}"
+
+            # The URL's existing file, or a newly claimed stable name
+            previous = manifest.get(url)
+            filename = previous['file'] if previous else assign_filename(url, owners)
+            filepath = output_dir / filename
+
+            sha256 = hashlib.sha256(markdown.encode('utf-8')).hexdigest()
+            record = {
+                'sha256': sha256,
+                'etag': get_header(result.response_headers, 'etag'),
+                'last_modified': get_header(result.response_headers, 'last-modified'),
+                'lastmod': meta.get('lastmod'),
+                'file': filename
+            }
+            manifest[url] = record
+
+            if incremental:
+                if previous and previous['sha256'] == sha256 and filepath.exists():
+                    stats['unchanged'] += 1
+                    print(f"  [{stats['crawled']}/{len(url_list)}] Unchanged: {filename}")
+                    continue
+                stats['changed' if previous else 'added'] += 1
+
+            # Same URL, same file: re-crawls overwrite in place
+            filepath.write_text(doc_content, encoding='utf-8')
+
+            stats['saved'] += 1
+            stats['files'].append(str(filepath.name))
+
+            print(f"  [{stats['crawled']}/{len(url_list)}] Saved: {filepath.name}")
+
+        else:
+            stats['failed'] += 1
+            print(f"  [{stats['crawled']}/{len(url_list)}] Failed: {result.url}")
+
+    if incremental:
+        # Pages dropped from discovery; their files are kept for review
+        current = set(url_metadata)
+        for url in [url for url in manifest if url not in current]:
+            stats['removed'].append({'url': url, 'file': manifest.pop(url)['file']})
+
+    # Saved on every run, so file names stay pinned to their URLs
+    save_manifest(output_dir, manifest)
 
     return stats
 
@@ -330,6 +540,17 @@ def main():
         default=5,
         help='Concurrent crawl workers'
     )
+    parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default='browser',
+        help='Fetch engine: browser, http (no browser), auto (http with browser fallback)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip unchanged pages and rewrite changed pages in place (uses _crawl_manifest.json)'
+    )
     parser.add_argument(
         '--no-filter',
         action='store_true',
@@ -367,7 +588,7 @@ def main():
         return
 
     # Run crawl
-    stats = asyncio.run(crawl_urls(urls, output_dir, args.concurrent))
+    stats = asyncio.run(crawl_urls(urls, output_dir, args.concurrent, args.engine, args.incremental))
 
     # Summary
     print(f"\n{'='*60}")
@@ -376,6 +597,13 @@ def main():
     print(f"URLs crawled: {stats['crawled']}")
     print(f"Files saved: {stats['saved']}")
     print(f"Failed: {stats['failed']}")
+    if args.incremental:
+        print(f"Added: {stats['added']}")
+        print(f"Changed: {stats['changed']}")
+        print(f"Unchanged: {stats['unchanged']}")
+        print(f"Removed: {len(stats['removed'])}")
+        for page in stats['removed']:
+            print(f"  - {page['file']} ({page['url']})")
     print(f"Output directory: {output_dir}")
 
 
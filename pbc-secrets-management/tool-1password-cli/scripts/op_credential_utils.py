@@ -29,6 +29,24 @@ Example - Retrieve credentials:
     response = api_call(token)  # Use directly - NEVER print
     print("API call successful")  # Only status messages
 
+Example - Retrieve many credentials in one op call:
+    secrets = get_fields([
+        "op://Credentials-Workflow Tools/google-calendar-personal/client-id",
+        "op://Credentials-Workflow Tools/google-calendar-personal/client-secret",
+        "op://Credentials-Workflow Tools/notion-api/token",
+    ])
+    client_id = secrets["op://Credentials-Workflow Tools/google-calendar-personal/client-id"]
+
+Example - Cache secrets in a long-running worker (opt-in):
+    enable_cache(ttl_seconds=300, max_entries=64)
+    token = get_field("google-calendar-personal", "access-token")  # op call
+    token = get_field("google-calendar-personal", "access-token")  # from memory
+    print(cache_stats())  # {'hits': 1, 'misses': 1, ...} - counters only
+
+Example - Async (from asyncio code, e.g. crawl4ai scripts):
+    token = await aget_field("google-calendar-personal", "access-token")
+    tokens = await asyncio.gather(*(aget_credential(ref) for ref in refs))
+
 Example - Import OAuth credentials from Google:
     # After downloading credentials JSON from Google Cloud Console
     create_oauth_client_item(
@@ -40,13 +58,24 @@ Example - Import OAuth credentials from Google:
 
 CLI Usage:
     python op_credential_utils.py import-oauth <credentials.json> <item-title> [--vault <vault>]
+    python op_credential_utils.py import-oauth-batch <dir-or-glob> [...] [--vault <vault>] [--prefix <p>] [--jobs N]
 """
 
 import argparse
+import asyncio
+import functools
+import glob
 import json
 import os
+import re
+import secrets
 import subprocess
 import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -55,45 +84,328 @@ from typing import Optional
 VAULT_WORKFLOW_TOOLS = "Credentials-Workflow Tools"
 VAULT_DEV_PROJECT = "Credentials-Dev Project"
 
+# Path -> vault rules for get_default_vault(). Absolute paths match as
+# prefixes of the working directory; relative paths ("work/dev") match a run
+# of path segments anywhere in it. The longest matching rule wins.
+# Override with set_vault_mapping() or the OP_VAULT_MAP environment variable
+# (JSON object, e.g. {"C:/Users/drewa/work/dev": "Credentials-Dev Project"}).
+VAULT_PATH_RULES = {
+    "work/dev": VAULT_DEV_PROJECT,
+}
+
+# Vault used when no rule matches (override with OP_DEFAULT_VAULT)
+DEFAULT_VAULT = VAULT_WORKFLOW_TOOLS
+
+
+def _normalize_path(path: str) -> str:
+    return path.replace("\\", "/").lower().rstrip("/")
+
+
+def _load_vault_rules() -> tuple[dict, str]:
+    rules = dict(VAULT_PATH_RULES)
+    env_rules = os.environ.get("OP_VAULT_MAP")
+    if env_rules:
+        rules.update(json.loads(env_rules))
+    default = os.environ.get("OP_DEFAULT_VAULT", DEFAULT_VAULT)
+    return {_normalize_path(path): vault for path, vault in rules.items()}, default
+
+
+_vault_rules, _default_vault = _load_vault_rules()
+
+
+def set_vault_mapping(rules: dict[str, str], default: Optional[str] = None) -> None:
+    """
+    Replace the path -> vault rules used by get_default_vault().
+
+    Args:
+        rules: {path: vault}; absolute paths match as working-directory
+               prefixes, relative paths as segments anywhere in it
+        default: Vault when no rule matches (default: DEFAULT_VAULT)
+    """
+    global _vault_rules, _default_vault
+    _vault_rules = {_normalize_path(path): vault for path, vault in rules.items()}
+    _default_vault = default or DEFAULT_VAULT
+    _resolve_vault.cache_clear()
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_vault(cwd: str) -> str:
+    """Resolve the vault for a working directory (memoized per directory)."""
+    path = _normalize_path(cwd)
+    best, best_len = _default_vault, -1
+
+    for rule, vault in _vault_rules.items():
+        if rule.startswith("/") or re.match(r"^[a-z]:", rule):
+            matched = path == rule or path.startswith(rule + "/")
+        else:
+            matched = f"/{rule}/" in f"/{path}/"
+        if matched and len(rule) > best_len:
+            best, best_len = vault, len(rule)
+
+    return best
+
 
 def get_default_vault() -> str:
     """
     Auto-detect which vault to use based on current working directory.
 
+    Rules come from VAULT_PATH_RULES, OP_VAULT_MAP or set_vault_mapping();
+    the result is memoized per working directory.
+
     Returns:
         - "Credentials-Dev Project" if cwd contains "work/dev" or "work\\dev"
+          (default rules)
         - "Credentials-Workflow Tools" otherwise
     """
-    cwd = os.getcwd().lower()
+    return _resolve_vault(os.getcwd())
 
-    if "work\\dev" in cwd or "work/dev" in cwd:
-        return VAULT_DEV_PROJECT
-    else:
-        return VAULT_WORKFLOW_TOOLS
 
+# =============================================================================
+# Sign-In State
+# =============================================================================
 
-def check_signed_in() -> bool:
-    """
-    Check if 1Password CLI is authenticated.
 
-    Returns:
-        True if signed in, False otherwise
+# Seconds a successful `op whoami` is trusted before checking again
+WHOAMI_TTL_SECONDS = 60.0
 
-    Note:
-        On Windows, uses shell=True to inherit the terminal context required
-        for 1Password desktop app integration (biometric/Windows Hello auth).
-    """
+# Fraction of the TTL after which a cached session is refreshed in the background
+WHOAMI_REFRESH_AHEAD = 0.8
+
+_session: Optional[dict] = None
+_session_lock = threading.Lock()
+_session_refreshing = False
+
+
+def _whoami_command() -> list[str]:
+    return ["op", "whoami", "--format", "json"]
+
+
+def _store_session(stdout: str) -> dict:
+    """Cache a successful whoami result."""
+    global _session
+    try:
+        info = json.loads(stdout)
+    except json.JSONDecodeError:
+        info = {}
+    now = time.time()
+    session = {
+        "account": info.get("url"),
+        "user": info.get("email"),
+        "user_uuid": info.get("user_uuid"),
+        "account_uuid": info.get("account_uuid"),
+        "checked_at": now,
+        "expires_at": now + WHOAMI_TTL_SECONDS,
+    }
+    with _session_lock:
+        _session = session
+    return session
+
+
+def clear_session() -> None:
+    """Forget the cached sign-in state (next check runs `op whoami`)."""
+    global _session
+    with _session_lock:
+        _session = None
+
+
+def _run_whoami() -> Optional[dict]:
     # On Windows, shell=True is required for 1Password desktop app integration
     # to recognize the session and trigger biometric auth if needed
     use_shell = sys.platform == "win32"
 
     result = subprocess.run(
-        ["op", "whoami"] if not use_shell else "op whoami",
+        _whoami_command() if not use_shell else subprocess.list2cmdline(_whoami_command()),
         capture_output=True,
         text=True,
         shell=use_shell
     )
-    return result.returncode == 0
+    if result.returncode != 0:
+        clear_session()
+        return None
+    return _store_session(result.stdout)
+
+
+def _background_refresh() -> None:
+    global _session_refreshing
+    try:
+        _run_whoami()
+    finally:
+        _session_refreshing = False
+
+
+def _cached_session() -> Optional[dict]:
+    """
+    Return the cached session if still valid, starting a background refresh
+    once it is WHOAMI_REFRESH_AHEAD of the way to expiry.
+    """
+    global _session_refreshing
+    with _session_lock:
+        session = _session
+        if session is None or time.time() >= session["expires_at"]:
+            return None
+
+        refresh_at = session["checked_at"] + WHOAMI_TTL_SECONDS * WHOAMI_REFRESH_AHEAD
+        if time.time() >= refresh_at and not _session_refreshing:
+            _session_refreshing = True
+            threading.Thread(target=_background_refresh, daemon=True).start()
+
+    return session
+
+
+def get_session(force: bool = False) -> Optional[dict]:
+    """
+    Return the current 1Password CLI session, memoized for WHOAMI_TTL_SECONDS.
+
+    Args:
+        force: Ignore the cached result and run `op whoami`
+
+    Returns:
+        Dict with 'account', 'user', 'user_uuid', 'account_uuid',
+        'checked_at', 'expires_at', or None if not signed in
+    """
+    if not force:
+        session = _cached_session()
+        if session is not None:
+            return session
+    return _run_whoami()
+
+
+# =============================================================================
+# In-Process Secret Cache (opt-in)
+# =============================================================================
+
+
+class SecretCache:
+    """
+    TTL-bounded, LRU-evicted in-memory cache of secret values keyed by op:// reference.
+
+    Values are held in bytearrays so they can be overwritten with zeros when
+    evicted, expired or invalidated. This is best effort: the str returned
+    to callers (and any copies Python made along the way) cannot be wiped.
+
+    Only counters are exposed (stats()); there is no way to list values.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 128):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # ref -> (bytearray, expires_at)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _wipe(buffer: bytearray) -> None:
+        for i in range(len(buffer)):
+            buffer[i] = 0
+
+    def _drop(self, ref: str) -> None:
+        buffer, _ = self._entries.pop(ref)
+        self._wipe(buffer)
+
+    def get(self, ref: str) -> Optional[str]:
+        """Return the cached value, or None on a miss (absent or expired)."""
+        with self._lock:
+            entry = self._entries.get(ref)
+            if entry is None:
+                self._misses += 1
+                return None
+            buffer, expires_at = entry
+            if time.monotonic() >= expires_at:
+                self._drop(ref)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(ref)
+            self._hits += 1
+            return buffer.decode("utf-8")
+
+    def put(self, ref: str, value: str) -> None:
+        """Cache a value, evicting least recently used entries beyond max_entries."""
+        with self._lock:
+            if ref in self._entries:
+                self._drop(ref)
+            self._entries[ref] = (
+                bytearray(value.encode("utf-8")),
+                time.monotonic() + self.ttl_seconds
+            )
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, ref: Optional[str] = None) -> None:
+        """Wipe and drop one reference, or every entry if ref is None."""
+        with self._lock:
+            refs = [ref] if ref is not None else list(self._entries)
+            for r in refs:
+                if r in self._entries:
+                    self._drop(r)
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters and current size (never values)."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+
+# Module-level cache; None until enable_cache() is called
+_secret_cache: Optional[SecretCache] = None
+
+
+def enable_cache(ttl_seconds: float = 300, max_entries: int = 128) -> None:
+    """
+    Enable in-process caching for get_credential(), get_field() and get_fields().
+
+    Args:
+        ttl_seconds: Seconds a value stays valid after it is fetched
+        max_entries: Maximum cached references (least recently used evicted first)
+    """
+    global _secret_cache
+    disable_cache()
+    _secret_cache = SecretCache(ttl_seconds, max_entries)
+
+
+def disable_cache() -> None:
+    """Disable caching and wipe every cached value."""
+    global _secret_cache
+    if _secret_cache is not None:
+        _secret_cache.invalidate()
+    _secret_cache = None
+
+
+def invalidate(ref: Optional[str] = None) -> None:
+    """Wipe one cached op:// reference, or the whole cache if ref is None."""
+    if _secret_cache is not None:
+        _secret_cache.invalidate(ref)
+
+
+def cache_stats() -> dict:
+    """Cache counters ({'hits', 'misses', 'evictions', 'size'}), or {} if disabled."""
+    return _secret_cache.stats() if _secret_cache is not None else {}
+
+
+def check_signed_in(force: bool = False) -> bool:
+    """
+    Check if 1Password CLI is authenticated.
+
+    A successful check is memoized for WHOAMI_TTL_SECONDS (see get_session()),
+    so repeated calls do not spawn `op whoami`.
+
+    Args:
+        force: Ignore the cached result and run `op whoami`
+
+    Returns:
+        True if signed in, False otherwise
+
+    Note:
+        On Windows, uses shell=True to inherit the terminal context required
+        for 1Password desktop app integration (biometric/Windows Hello auth).
+    """
+    return get_session(force) is not None
 
 
 def _handle_op_error(e: subprocess.CalledProcessError) -> None:
@@ -106,6 +418,7 @@ def _handle_op_error(e: subprocess.CalledProcessError) -> None:
     stderr = e.stderr.lower() if e.stderr else ""
 
     if "not signed in" in stderr or "session expired" in stderr:
+        clear_session()
         raise RuntimeError("1Password CLI not signed in. Run 'op signin' first.")
     elif "could not find item" in stderr or "item not found" in stderr:
         # Don't raise for missing items - let caller handle via None return
@@ -134,6 +447,11 @@ def get_credential(secret_ref: str) -> Optional[str]:
     Raises:
         RuntimeError: If 1Password CLI is not signed in or other errors occur
     """
+    if _secret_cache is not None:
+        cached = _secret_cache.get(secret_ref)
+        if cached is not None:
+            return cached
+
     # On Windows, shell=True is required for 1Password desktop app integration
     use_shell = sys.platform == "win32"
 
@@ -145,12 +463,86 @@ def get_credential(secret_ref: str) -> Optional[str]:
             check=True,
             shell=use_shell
         )
-        return result.stdout.strip()
+        value = result.stdout.strip()
+        if _secret_cache is not None:
+            _secret_cache.put(secret_ref, value)
+        return value
     except subprocess.CalledProcessError as e:
         _handle_op_error(e)
         return None
 
 
+def get_fields(refs: list[str]) -> dict[str, Optional[str]]:
+    """
+    Retrieve many credentials with a single 1Password CLI call.
+
+    Builds an `op inject` template with one delimited placeholder per
+    reference, pipes it through stdin and splits the resolved output back
+    out, so N secrets cost one process spawn and one round trip instead of N.
+    Secrets never touch disk or command-line arguments.
+
+    Args:
+        refs: Full op:// references (duplicates are resolved once)
+
+    Returns:
+        Dict mapping each reference to its value, or None if not found.
+        NEVER print or log the values.
+
+    Raises:
+        RuntimeError: If 1Password CLI is not signed in or other errors occur
+
+    Note:
+        `op inject` fails as a whole if any reference is missing; in that case
+        each reference is resolved individually so the others still succeed.
+    """
+    all_refs = list(dict.fromkeys(refs))
+
+    values = {}
+    if _secret_cache is not None:
+        for ref in all_refs:
+            cached = _secret_cache.get(ref)
+            if cached is not None:
+                values[ref] = cached
+
+    unique_refs = [ref for ref in all_refs if ref not in values]
+    if not unique_refs:
+        return values
+
+    # Random per-call delimiter: cannot appear in a secret value by accident
+    marker = f"__op_{secrets.token_hex(16)}__"
+    template = "".join(
+        f"{marker}{i}:{{{{ {ref} }}}}\n" for i, ref in enumerate(unique_refs)
+    )
+
+    # On Windows, shell=True is required for 1Password desktop app integration
+    use_shell = sys.platform == "win32"
+
+    try:
+        result = subprocess.run(
+            ["op", "inject"] if not use_shell else "op inject",
+            input=template,
+            capture_output=True,
+            text=True,
+            check=True,
+            shell=use_shell
+        )
+    except subprocess.CalledProcessError as e:
+        _handle_op_error(e)
+        # A reference is missing - resolve one by one so the rest still work
+        for ref in unique_refs:
+            values[ref] = get_credential(ref)
+        return {ref: values[ref] for ref in all_refs}
+
+    parts = re.split(f"{marker}(\\d+):", result.stdout)
+    for index, value in zip(parts[1::2], parts[2::2]):
+        ref = unique_refs[int(index)]
+        values[ref] = value.strip()
+        if _secret_cache is not None:
+            _secret_cache.put(ref, values[ref])
+
+    return {ref: values.get(ref) for ref in all_refs}
+
+
 def get_field(item: str, field: str, vault: Optional[str] = None) -> Optional[str]:
     """
     Retrieve a field from a 1Password item.
@@ -213,6 +605,9 @@ def store_field(item: str, field: str, value: str, vault: Optional[str] = None)
     if vault is None:
         vault = get_default_vault()
 
+    # Drop any cached copy first so a failed write never leaves a stale value
+    invalidate(f"op://{vault}/{item}/{field}")
+
     # On Windows, shell=True is required for 1Password desktop app integration
     use_shell = sys.platform == "win32"
 
@@ -242,6 +637,152 @@ def store_field(item: str, field: str, value: str, vault: Optional[str] = None)
         raise RuntimeError(f"Failed to store field '{field}' in item '{item}'")
 
 
+# =============================================================================
+# Async API (asyncio subprocesses)
+# =============================================================================
+
+
+# Maximum concurrent op processes started by the async API
+OP_MAX_CONCURRENCY = 4
+
+# One semaphore per event loop (asyncio primitives are bound to their loop)
+_op_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_async_concurrency(limit: int) -> None:
+    """Set the maximum number of concurrent op processes for the async API."""
+    global OP_MAX_CONCURRENCY
+    OP_MAX_CONCURRENCY = limit
+    _op_semaphores.clear()
+
+
+def _op_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _op_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(OP_MAX_CONCURRENCY)
+        _op_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _arun_op(args: list[str], input: Optional[str] = None) -> str:
+    """
+    Run an op command without blocking the event loop.
+
+    Returns:
+        stdout as text
+
+    Raises:
+        subprocess.CalledProcessError: On non-zero exit, so callers share
+            _handle_op_error() with the sync API
+    """
+    # On Windows, a shell is required for 1Password desktop app integration
+    use_shell = sys.platform == "win32"
+
+    async with _op_semaphore():
+        if use_shell:
+            proc = await asyncio.create_subprocess_shell(
+                subprocess.list2cmdline(args),
+                stdin=asyncio.subprocess.PIPE if input is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        else:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE if input is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        stdout, stderr = await proc.communicate(
+            input.encode("utf-8") if input is not None else None
+        )
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(
+            proc.returncode, args[:2],
+            output=stdout.decode("utf-8", "replace"),
+            stderr=stderr.decode("utf-8", "replace")
+        )
+    return stdout.decode("utf-8")
+
+
+async def acheck_signed_in(force: bool = False) -> bool:
+    """Async version of check_signed_in(); shares its memoized session."""
+    if not force and _cached_session() is not None:
+        return True
+    try:
+        _store_session(await _arun_op(_whoami_command()))
+        return True
+    except subprocess.CalledProcessError:
+        clear_session()
+        return False
+
+
+async def aget_credential(secret_ref: str) -> Optional[str]:
+    """
+    Async version of get_credential().
+
+    Returns:
+        The credential value, or None if not found.
+        NEVER print or log the return value.
+
+    Raises:
+        RuntimeError: If 1Password CLI is not signed in or other errors occur
+    """
+    if _secret_cache is not None:
+        cached = _secret_cache.get(secret_ref)
+        if cached is not None:
+            return cached
+
+    try:
+        value = (await _arun_op(["op", "read", secret_ref])).strip()
+    except subprocess.CalledProcessError as e:
+        _handle_op_error(e)
+        return None
+
+    if _secret_cache is not None:
+        _secret_cache.put(secret_ref, value)
+    return value
+
+
+async def aget_field(item: str, field: str, vault: Optional[str] = None) -> Optional[str]:
+    """
+    Async version of get_field().
+
+    Returns:
+        The field value, or None if not found.
+        NEVER print or log the return value.
+    """
+    if vault is None:
+        vault = get_default_vault()
+
+    return await aget_credential(f"op://{vault}/{item}/{field}")
+
+
+async def astore_field(item: str, field: str, value: str, vault: Optional[str] = None) -> bool:
+    """
+    Async version of store_field().
+
+    Returns:
+        True on success
+
+    Raises:
+        RuntimeError: If item doesn't exist, not signed in, or other errors occur
+    """
+    if vault is None:
+        vault = get_default_vault()
+
+    invalidate(f"op://{vault}/{item}/{field}")
+
+    try:
+        await _arun_op(["op", "item", "edit", item, f"{field}={value}", "--vault", vault])
+        return True
+    except subprocess.CalledProcessError as e:
+        _handle_op_error(e)
+        raise RuntimeError(f"Failed to store field '{field}' in item '{item}'")
+
+
 # =============================================================================
 # OAuth Client Credential Import Functions
 # =============================================================================
@@ -402,6 +943,58 @@ def _build_oauth_item_template(
     }
 
 
+def _create_item(template: dict, item_title: str) -> str:
+    """
+    Create a 1Password item from a JSON template piped via stdin.
+
+    Returns:
+        ID of the created item (confirms creation)
+
+    Raises:
+        RuntimeError: If creation failed or op did not confirm it
+    """
+    # Create the item via stdin (secrets never appear in command line)
+    # On Windows, shell=True is required for 1Password desktop app integration
+    use_shell = sys.platform == "win32"
+
+    try:
+        if use_shell:
+            result = subprocess.run(
+                'op item create - --format json',
+                input=json.dumps(template),
+                capture_output=True,
+                text=True,
+                check=True,
+                shell=True
+            )
+        else:
+            result = subprocess.run(
+                ["op", "item", "create", "-", "--format", "json"],
+                input=json.dumps(template),
+                capture_output=True,
+                text=True,
+                check=True
+            )
+    except subprocess.CalledProcessError as e:
+        # Don't delete the file if creation failed
+        _handle_op_error(e)
+        raise RuntimeError(
+            f"Failed to create 1Password item '{item_title}'. "
+            f"Credentials file was NOT deleted."
+        )
+
+    try:
+        item_id = json.loads(result.stdout).get("id")
+    except json.JSONDecodeError:
+        item_id = None
+    if not item_id:
+        raise RuntimeError(
+            f"1Password did not confirm creation of item '{item_title}'. "
+            f"Credentials file was NOT deleted."
+        )
+    return item_id
+
+
 def create_oauth_client_item(
     credentials_file: str,
     item_title: str,
@@ -450,35 +1043,8 @@ def create_oauth_client_item(
     # Build the 1Password item template
     template = _build_oauth_item_template(item_title, credentials, vault)
 
-    # Create the item via stdin (secrets never appear in command line)
-    # On Windows, shell=True is required for 1Password desktop app integration
-    use_shell = sys.platform == "win32"
-
-    try:
-        if use_shell:
-            result = subprocess.run(
-                'op item create - --format json',
-                input=json.dumps(template),
-                capture_output=True,
-                text=True,
-                check=True,
-                shell=True
-            )
-        else:
-            result = subprocess.run(
-                ["op", "item", "create", "-", "--format", "json"],
-                input=json.dumps(template),
-                capture_output=True,
-                text=True,
-                check=True
-            )
-    except subprocess.CalledProcessError as e:
-        # Don't delete the file if creation failed
-        _handle_op_error(e)
-        raise RuntimeError(
-            f"Failed to create 1Password item '{item_title}'. "
-            f"Credentials file was NOT deleted."
-        )
+    # Create the item (raises, and the file is NOT deleted, if creation fails)
+    _create_item(template, item_title)
 
     # Success - now securely delete the source file
     _secure_delete(file_path)
@@ -486,11 +1052,145 @@ def create_oauth_client_item(
     return True
 
 
+def _find_credential_files(patterns: list[str]) -> list[Path]:
+    """Expand directories (*.json inside) and glob patterns into a sorted, unique file list."""
+    files = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            files.update(path.glob("*.json"))
+        elif path.is_file():
+            files.add(path)
+        else:
+            files.update(Path(p) for p in glob.glob(pattern) if Path(p).is_file())
+    return sorted(files)
+
+
+def import_oauth_client_batch(
+    files: list[Path],
+    vault: Optional[str] = None,
+    title_prefix: str = "",
+    max_workers: int = 4
+) -> list[dict]:
+    """
+    Create 1Password items from many OAuth client credentials JSON files.
+
+    Every file is parsed and validated before anything is created; if any
+    file is invalid (or two files map to the same item title), nothing is
+    created and nothing is deleted. Sign-in is checked once, items are
+    created with bounded concurrency, and only files whose item creation
+    was confirmed by op are securely deleted.
+
+    Item titles are the file stems (e.g. google-calendar-personal.json ->
+    "google-calendar-personal"), with title_prefix prepended.
+
+    Args:
+        files: Credentials JSON files
+        vault: Vault name. If None, auto-detects based on working directory.
+        title_prefix: Prefix for every item title
+        max_workers: Concurrent `op item create` processes
+
+    Returns:
+        One dict per file with 'file', 'title', 'status' ('created',
+        'failed', 'invalid' or 'skipped'), 'item_id', 'deleted' and 'error'.
+        Never contains credential values.
+
+    Raises:
+        RuntimeError: If 1Password CLI is not signed in
+    """
+    if vault is None:
+        vault = get_default_vault()
+
+    results = []
+    templates = {}
+    for file_path in files:
+        title = f"{title_prefix}{file_path.stem}"
+        result = {
+            "file": str(file_path), "title": title, "status": "skipped",
+            "item_id": None, "deleted": False, "error": None,
+        }
+        try:
+            credentials = _parse_google_credentials(file_path)
+            templates[str(file_path)] = _build_oauth_item_template(title, credentials, vault)
+        except (OSError, ValueError, TypeError) as e:
+            # JSON errors are ValueErrors; messages name fields, never values
+            result.update({"status": "invalid", "error": str(e)})
+        results.append(result)
+
+    titles = [r["title"] for r in results]
+    for r in results:
+        if r["status"] != "invalid" and titles.count(r["title"]) > 1:
+            r.update({"status": "invalid", "error": "Duplicate item title in batch"})
+
+    if any(r["status"] == "invalid" for r in results):
+        return results
+
+    if not check_signed_in(force=True):
+        raise RuntimeError("1Password CLI not signed in. Run 'op signin' first.")
+
+    def create(result: dict) -> dict:
+        template = templates.pop(result["file"])
+        try:
+            result["item_id"] = _create_item(template, result["title"])
+        except RuntimeError as e:
+            result.update({"status": "failed", "error": str(e)})
+            return result
+
+        result["status"] = "created"
+        try:
+            _secure_delete(Path(result["file"]))
+            result["deleted"] = True
+        except RuntimeError as e:
+            result["error"] = str(e)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(create, results))
+
+    return results
+
+
 # =============================================================================
 # CLI Entry Point
 # =============================================================================
 
 
+def _cli_import_oauth_batch(args) -> int:
+    """Handle the import-oauth-batch CLI command."""
+    files = _find_credential_files(args.paths)
+    if not files:
+        print("Error: No credentials JSON files found", file=sys.stderr)
+        return 1
+
+    try:
+        results = import_oauth_client_batch(
+            files,
+            vault=args.vault,
+            title_prefix=args.prefix,
+            max_workers=args.jobs
+        )
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    # Table of file / title / status only - never credential values
+    file_width = max(len("File"), *(len(Path(r["file"]).name) for r in results))
+    title_width = max(len("Item"), *(len(r["title"]) for r in results))
+    print(f"{'File':<{file_width}}  {'Item':<{title_width}}  {'Status':<8}  {'Deleted':<7}  Error")
+    for r in results:
+        print(
+            f"{Path(r['file']).name:<{file_width}}  {r['title']:<{title_width}}  "
+            f"{r['status']:<8}  {'yes' if r['deleted'] else 'no':<7}  {r['error'] or ''}"
+        )
+
+    created = sum(1 for r in results if r["status"] == "created")
+    print(f"\nCreated {created} of {len(results)} items")
+    if any(r["status"] == "invalid" for r in results):
+        print("Validation failed - no items were created and no files were deleted", file=sys.stderr)
+
+    return 0 if created == len(results) and all(r["deleted"] for r in results) else 1
+
+
 def _cli_import_oauth(args) -> int:
     """Handle the import-oauth CLI command."""
     try:
@@ -525,6 +1225,12 @@ Examples:
 
   Import with specific vault:
     python op_credential_utils.py import-oauth credentials.json google-calendar-work --vault "Credentials-Dev Project"
+
+  Import every JSON file in a directory (item titles = file names):
+    python op_credential_utils.py import-oauth-batch C:/Users/drewa/Downloads/oauth-clients
+
+  Import files matching a glob:
+    python op_credential_utils.py import-oauth-batch "exports/google-*.json" --prefix "gcp-"
         """
     )
 
@@ -549,10 +1255,39 @@ Examples:
         help="Vault name (default: auto-detect based on working directory)"
     )
 
+    # import-oauth-batch command
+    batch_parser = subparsers.add_parser(
+        "import-oauth-batch",
+        help="Import many OAuth client credentials JSON files into 1Password"
+    )
+    batch_parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Directories (all *.json inside), files, or glob patterns"
+    )
+    batch_parser.add_argument(
+        "--vault",
+        default=None,
+        help="Vault name (default: auto-detect based on working directory)"
+    )
+    batch_parser.add_argument(
+        "--prefix",
+        default="",
+        help="Prefix for item titles (titles are the file names without .json)"
+    )
+    batch_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=4,
+        help="Concurrent item creations (default: 4)"
+    )
+
     args = parser.parse_args()
 
     if args.command == "import-oauth":
         return _cli_import_oauth(args)
+    if args.command == "import-oauth-batch":
+        return _cli_import_oauth_batch(args)
 
     return 0
 
@@ -9,6 +9,9 @@ Type: Maintenance
 Purpose:
     Discovers all CLI documentation URLs from developer.1password.com using
     Crawl4AI's AsyncUrlSeeder. Outputs a JSON file for review before crawling.
+    Each URL carries its sitemap <lastmod> (read from the sitemap directly; the
+    seeder does not report it), which lets incremental crawls skip unchanged
+    pages without a request.
     Run this as the first step when refreshing documentation, then follow up
     with crawl_1password_docs.py to fetch the actual content.
 
@@ -21,12 +24,90 @@ Output:
 
 import asyncio
 import json
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
 
+import aiohttp
 from crawl4ai import AsyncUrlSeeder, SeedingConfig
 
 
+DOCS_DOMAIN = "developer.1password.com"
+
+# Upper bound on nested sitemap indexes followed when collecting lastmod dates
+MAX_SITEMAPS = 50
+
+
+def lastmod_key(url: str) -> str:
+    """Match sitemap and seeder URLs that differ only by a trailing slash."""
+    return url.rstrip('/')
+
+
+async def fetch_sitemap_lastmods(domain: str) -> dict:
+    """
+    Collect <lastmod> dates from a domain's sitemaps.
+
+    Sitemaps come from robots.txt 'Sitemap:' lines (falling back to
+    /sitemap.xml); sitemap indexes are followed. Each sitemap is parsed as it
+    downloads. Fetch or parse errors skip that sitemap.
+
+    Returns:
+        Dict mapping lastmod_key(url) to its lastmod string
+    """
+    base = f"https://{domain}"
+    lastmods = {}
+
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        pending = []
+        try:
+            async with session.get(f"{base}/robots.txt") as response:
+                if response.status == 200:
+                    for line in (await response.text()).splitlines():
+                        if line.lower().startswith('sitemap:'):
+                            pending.append(line.split(':', 1)[1].strip())
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+            pass
+
+        if not pending:
+            pending.append(f"{base}/sitemap.xml")
+
+        seen = set()
+        while pending and len(seen) < MAX_SITEMAPS:
+            sitemap_url = pending.pop()
+            if sitemap_url in seen:
+                continue
+            seen.add(sitemap_url)
+
+            parser = ET.XMLPullParser(events=('end',))
+            loc = lastmod = None
+            try:
+                async with session.get(sitemap_url) as response:
+                    if response.status != 200:
+                        continue
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        parser.feed(chunk)
+                        for _, elem in parser.read_events():
+                            tag = elem.tag.rsplit('}', 1)[-1]
+                            if tag == 'loc':
+                                loc = (elem.text or '').strip()
+                            elif tag == 'lastmod':
+                                lastmod = (elem.text or '').strip()
+                            elif tag == 'url' and loc:
+                                if lastmod:
+                                    lastmods[lastmod_key(loc)] = lastmod
+                                loc = lastmod = None
+                            elif tag == 'sitemap' and loc:
+                                pending.append(loc)
+                                loc = lastmod = None
+                            elem.clear()
+            except (aiohttp.ClientError, asyncio.TimeoutError, ET.ParseError) as e:
+                print(f"  Skipping sitemap {sitemap_url}: {e}")
+
+    print(f"Sitemap lastmod dates: {len(lastmods)} URLs ({len(seen)} sitemaps)")
+    return lastmods
+
+
 async def discover_1password_cli_docs():
     """
     Discover 1Password CLI documentation URLs using sitemap seeding.
@@ -60,10 +141,12 @@ async def discover_1password_cli_docs():
     discovered_urls = []
 
     async with AsyncUrlSeeder() as seeder:
-        urls = await seeder.urls("developer.1password.com", config)
+        urls = await seeder.urls(DOCS_DOMAIN, config)
 
         print(f"\nDiscovered {len(urls)} URLs")
 
+        lastmods = await fetch_sitemap_lastmods(DOCS_DOMAIN)
+
         for url_data in urls:
             url = url_data.get('url', '')
             head_data = url_data.get('head_data', {})
@@ -73,7 +156,9 @@ async def discover_1password_cli_docs():
                 'title': head_data.get('title', 'No title'),
                 'description': head_data.get('meta', {}).get('description', ''),
                 'relevance_score': url_data.get('relevance_score', 0),
-                'status': url_data.get('status', 'unknown')
+                'status': url_data.get('status', 'unknown'),
+                # Sitemap lastmod, when provided; lets incremental crawls skip unchanged pages
+                'lastmod': lastmods.get(lastmod_key(url))
             })
 
     # Sort by relevance score descending
@@ -87,7 +172,7 @@ def save_discovery_results(urls: list, output_path: Path):
 
     output = {
         'discovered_at': datetime.now().isoformat(),
-        'source': 'developer.1password.com',
+        'source': DOCS_DOMAIN,
         'pattern': '*/docs/cli/*',
         'total_urls': len(urls),
         'urls': urls
@@ -9,9 +9,15 @@ Key features:
 - Session-based navigation: initializes SPA router first, then navigates
 - Uses js_only mode to navigate without full page reloads
 - Custom JavaScript wait conditions that verify page-specific content
-- Sequential processing to avoid SPA routing race conditions
+- Sequential navigation per session to avoid SPA routing race conditions
+- Optional parallel workers, each with its own independently initialized session
 - Longer delays and timeouts for React/Vue hydration
-- Content validation to detect routing failures
+- Optional adaptive readiness: returns as soon as the DOM stops changing,
+  with --delay only as an upper bound
+- Content validation to detect routing failures, with rules loadable from
+  a YAML/JSON file (see configs/spa-validators.yaml)
+- URL aliases are collapsed before crawling, and pages whose content nearly
+  duplicates an earlier page are not stored again (see crawl_urls, crawl_dedupe)
 
 Usage:
     python batch_spa_to_markdown.py --urls <url1> <url2> ... --output-dir <directory>
@@ -23,16 +29,41 @@ Examples:
 
     # Specify an init URL to bootstrap the SPA router
     python batch_spa_to_markdown.py urls.txt -o ./output --init-url https://developers.notion.com/reference/intro
+
+    # Validate against site-specific rules from a file
+    python batch_spa_to_markdown.py urls.txt -o ./output --validators ../configs/spa-validators.yaml
+
+    # Return as soon as content settles instead of always waiting --delay
+    python batch_spa_to_markdown.py urls.txt -o ./output --adaptive
+
+    # Four parallel browser sessions (each navigates sequentially)
+    python batch_spa_to_markdown.py urls.txt -o ./output --workers 4
+
+    # Collect pages into one JSONL corpus instead of a file per page
+    python batch_spa_to_markdown.py urls.txt -o ./output --sink jsonl
+
+    # Reuse a warm browser from the shared pool service (python crawl_server.py)
+    python batch_spa_to_markdown.py urls.txt -o ./output --server
 """
 
 import argparse
 import asyncio
+import json
 import re
+import secrets
+import statistics
 import sys
 from pathlib import Path
 from urllib.parse import urlparse
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from crawl4ai import BrowserConfig, CrawlerRunConfig, CacheMode
+
+from crawl_client import DEFAULT_SERVER_URL
+from crawl_dedupe import NearDuplicateIndex
+from crawl_engine import create_crawler
+from crawl_sink import SINKS, make_page, open_sink
+from crawl_urls import load_url_rules, load_urls_from_file
+from spa_validators import SpaValidatorRegistry
 
 
 # URL-to-expected-content mapping for SPA validation
@@ -44,39 +75,63 @@ SPA_CONTENT_VALIDATORS = {
     'retrieve-a-data-source': ['retrieve', 'data source'],
     'retrieve-a-database': ['retrieve', 'database'],
     'create-a-data-source': ['create', 'data source'],
-    # Add more patterns as needed
+    # Add more patterns here, or load site rules with --validators
 }
 
-
-def slugify(text: str) -> str:
-    """Convert text to a safe filename slug."""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_-]+', '-', text)
-    text = text.strip('-')
-    return text[:60] or 'untitled'
-
-
-def get_filename_from_url(url: str) -> str:
-    """Generate filename from URL path (not page title)."""
-    parsed = urlparse(url)
-    # Get last path segment
-    path_parts = [p for p in parsed.path.strip('/').split('/') if p]
-    if path_parts:
-        return f"{path_parts[-1]}.md"
-    return f"{slugify(parsed.netloc)}.md"
-
-
-def get_content_validator_for_url(url: str) -> list[str] | None:
+# Built-in rules, compiled once
+DEFAULT_VALIDATORS = SpaValidatorRegistry.from_keyword_map(SPA_CONTENT_VALIDATORS)
+
+
+# Adaptive readiness: sample main-content text length every interval and
+# consider the page settled after this many consecutive unchanged samples
+READY_SAMPLE_INTERVAL_MS = 150
+READY_STABLE_SAMPLES = 3
+
+# JS wait condition for adaptive readiness. Placeholders are substituted in
+# build_adaptive_wait_condition(). State lives on window, keyed by target path,
+# so it resets on every real navigation. The observed settle time is written to
+# <body data-pbc-ready-ms> so it can be read back from the captured HTML.
+ADAPTIVE_READY_JS = """js:() => {
+    const target = '__TARGET__';
+    const now = performance.now();
+    const all = window.__pbcReady = window.__pbcReady || {};
+    const s = all[target] = all[target] || {first: now, start: null, last: 0, size: -1, stable: 0};
+    const onTarget = location.pathname.replace(/\\/+$/, '') === target;
+    if (!onTarget && now - s.first < __MAX_MS__) return false;
+    const base = __BASE__;
+    if (!base()) return false;
+    if (s.start === null) s.start = now;
+    if (now - s.last < __INTERVAL_MS__) return false;
+    s.last = now;
+    const el = document.querySelector('main, article, [role="main"]') || document.body;
+    const size = el ? el.innerText.length : 0;
+    s.stable = (size > 0 && size === s.size) ? s.stable + 1 : 0;
+    s.size = size;
+    const done = s.stable >= __SAMPLES__ || now - s.start >= __MAX_MS__;
+    if (done && document.body) document.body.setAttribute('data-pbc-ready-ms', String(Math.round(now - s.start)));
+    return done;
+}"""
+
+READY_MS_PATTERN = re.compile(r'data-pbc-ready-ms="(\d+)"')
+
+
+def load_validators(rules_file: str | None = None) -> SpaValidatorRegistry:
+    """Built-in validators, preceded by rules from rules_file if given."""
+    if not rules_file:
+        return DEFAULT_VALIDATORS
+    return SpaValidatorRegistry.from_file(rules_file).extend(DEFAULT_VALIDATORS)
+
+
+def get_content_validator_for_url(
+    url: str,
+    registry: SpaValidatorRegistry | None = None
+) -> list[str] | None:
     """Get expected content keywords for a URL."""
-    url_lower = url.lower()
-    for pattern, keywords in SPA_CONTENT_VALIDATORS.items():
-        if pattern in url_lower:
-            return keywords
-    return None
+    rule = (registry or DEFAULT_VALIDATORS).lookup(url)
+    return rule['h1_keywords'] if rule else None
 
 
-def build_spa_wait_condition(url: str) -> str:
+def build_spa_wait_condition(url: str, registry: SpaValidatorRegistry | None = None) -> str:
     """
     Build a JavaScript wait condition that verifies the SPA has rendered
     the correct content for the requested URL.
@@ -84,12 +139,12 @@ def build_spa_wait_condition(url: str) -> str:
     This is crucial for React/Vue SPAs where client-side routing may
     render the wrong page content when accessing URLs directly.
     """
-    validators = get_content_validator_for_url(url)
+    validators = get_content_validator_for_url(url, registry)
 
     if validators:
         # Build condition that checks H1 contains expected keywords
         keyword_checks = ' && '.join([
-            f"h1Text.includes('{kw}')" for kw in validators
+            f"h1Text.includes({json.dumps(kw)})" for kw in validators
         ])
 
         return f"""js:() => {{
@@ -103,22 +158,58 @@ def build_spa_wait_condition(url: str) -> str:
     return "js:() => document.querySelector('h1') !== null"
 
 
-def validate_content(markdown: str, url: str) -> tuple[bool, str]:
+def build_adaptive_wait_condition(url: str, base_condition: str, max_delay: float) -> str:
+    """
+    Wrap a "js:" wait condition so it also waits for the DOM to settle.
+
+    Once base_condition holds on the target path, main-content text length is
+    sampled every READY_SAMPLE_INTERVAL_MS; the condition passes after
+    READY_STABLE_SAMPLES unchanged samples, or after max_delay seconds at most.
+    """
+    target = urlparse(url).path.rstrip('/').replace('\\', '').replace("'", "\\'")
+    base = base_condition[len('js:'):] if base_condition.startswith('js:') else base_condition
+
+    return (
+        ADAPTIVE_READY_JS
+        .replace('__TARGET__', target)
+        .replace('__BASE__', base.strip())
+        .replace('__MAX_MS__', str(int(max_delay * 1000)))
+        .replace('__INTERVAL_MS__', str(READY_SAMPLE_INTERVAL_MS))
+        .replace('__SAMPLES__', str(READY_STABLE_SAMPLES))
+    )
+
+
+def get_ready_ms(html: str | None) -> int | None:
+    """Read the observed readiness time written by the adaptive wait condition."""
+    match = READY_MS_PATTERN.search(html or '')
+    return int(match.group(1)) if match else None
+
+
+def validate_content(
+    markdown: str,
+    url: str,
+    registry: SpaValidatorRegistry | None = None
+) -> tuple[bool, str]:
     """
     Validate that crawled content matches expected content for the URL.
     Returns (is_valid, reason).
     """
-    validators = get_content_validator_for_url(url)
+    rule = (registry or DEFAULT_VALIDATORS).lookup(url)
 
-    if not validators:
+    if not rule:
         return True, "No validation rules for this URL"
 
     markdown_lower = markdown.lower()
-    missing = [kw for kw in validators if kw not in markdown_lower]
+    missing = [kw for kw in rule['h1_keywords'] if kw not in markdown_lower]
+    missing += [marker for marker in rule['required'] if marker not in markdown]
 
     if missing:
         return False, f"Missing expected content: {missing}"
 
+    present = [marker for marker in rule['forbidden'] if marker in markdown]
+    if present:
+        return False, f"Found forbidden content: {present}"
+
     return True, "Content validated successfully"
 
 
@@ -157,24 +248,48 @@ async def initialize_spa_session(
 async def crawl_spa_url(
     crawler,
     url: str,
-    output_dir: Path,
+    sink,
     delay: float,
     validate: bool,
     index: int,
     total: int,
     session_id: str,
-    use_session_nav: bool = True
+    use_session_nav: bool = True,
+    adaptive: bool = False,
+    validators: SpaValidatorRegistry | None = None,
+    near_duplicates: NearDuplicateIndex | None = None
 ) -> dict:
     """
     Crawl a single SPA URL with session-based navigation and content validation.
 
+    The page is written to sink (a crawl_sink sink), unless near_duplicates
+    finds an earlier page with nearly the same content.
+
     When use_session_nav is True, uses js_only mode to navigate the SPA
     without a full page reload, which avoids client-side routing issues.
 
-    Returns dict with 'success', 'url', 'file' or 'error', 'validation'.
+    When adaptive is True, the fixed delay is replaced by a DOM-stability
+    wait that returns as soon as content settles (delay is the upper bound).
+
+    Returns dict with 'success', 'url', 'file' or 'error', 'validation',
+    'ready_ms' (observed settle time in adaptive mode), and 'duplicate_of'
+    (the earlier URL) for a near-duplicate that was not stored.
     """
     print(f"[{index}/{total}] Crawling: {url}", file=sys.stderr)
 
+    # In adaptive mode the settle wait happens inside wait_for instead, so
+    # its timeout gets room for the target-path wait plus the settle window
+    capture_delay = 0.0 if adaptive else delay
+    settle_budget_ms = int(delay * 2000) if adaptive else 0
+
+    if use_session_nav:
+        wait_condition = "js:() => document.querySelector('h1') !== null"
+    else:
+        wait_condition = build_spa_wait_condition(url, validators)
+
+    if adaptive:
+        wait_condition = build_adaptive_wait_condition(url, wait_condition, delay)
+
     if use_session_nav:
         # Session-based navigation: use JS to navigate within existing session
         config = CrawlerRunConfig(
@@ -190,9 +305,9 @@ async def crawl_spa_url(
 
             # Wait for content to render
             wait_until="networkidle",
-            delay_before_return_html=delay,
-            wait_for="js:() => document.querySelector('h1') !== null",
-            wait_for_timeout=20000,
+            delay_before_return_html=capture_delay,
+            wait_for=wait_condition,
+            wait_for_timeout=20000 + settle_budget_ms,
 
             # Page interaction
             page_timeout=60000,
@@ -200,7 +315,6 @@ async def crawl_spa_url(
         print(f"  Mode: session-based navigation (js_only)", file=sys.stderr)
     else:
         # Direct URL access (fallback)
-        wait_condition = build_spa_wait_condition(url)
         config = CrawlerRunConfig(
             session_id=session_id,
 
@@ -213,12 +327,12 @@ async def crawl_spa_url(
             # SPA-specific settings
             wait_until="networkidle",
             scan_full_page=True,
-            delay_before_return_html=delay,
+            delay_before_return_html=capture_delay,
             magic=True,
 
             # Custom wait condition for content verification
             wait_for=wait_condition,
-            wait_for_timeout=30000,
+            wait_for_timeout=30000 + settle_budget_ms,
 
             # Page interaction
             page_timeout=60000,
@@ -238,45 +352,46 @@ async def crawl_spa_url(
     # Get markdown content
     markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
     title = result.metadata.get('title', 'Untitled')
+    ready_ms = get_ready_ms(result.html) if adaptive else None
 
     # Validate content if requested
     validation_result = None
     if validate:
-        is_valid, reason = validate_content(markdown, url)
+        is_valid, reason = validate_content(markdown, url, validators)
         validation_result = {'valid': is_valid, 'reason': reason}
 
         if not is_valid:
             print(f"  WARNING: Content validation failed - {reason}", file=sys.stderr)
 
-    # Build output with metadata
-    output = f"# {title}\n\n"
-    output += f"- **Source:** {url}\n"
-    output += f"- **Status:** {result.status_code}\n"
-    if validation_result:
-        status = "PASS" if validation_result['valid'] else "FAIL"
-        output += f"- **Validation:** {status}\n"
-    output += "\n---\n\n"
-    output += markdown
-
-    # Save to file (use URL-based filename, not title)
-    filename = get_filename_from_url(url)
-    filepath = output_dir / filename
-
-    # Avoid overwriting
-    if filepath.exists():
-        stem = filepath.stem
-        filepath = output_dir / f"{stem}-{index}.md"
+    original = near_duplicates.check(markdown, url) if near_duplicates else None
+    if original:
+        print(f"  Near-duplicate of {original}, not stored", file=sys.stderr)
+        return {
+            'success': True,
+            'url': url,
+            'file': None,
+            'title': title,
+            'validation': validation_result,
+            'ready_ms': ready_ms,
+            'duplicate_of': original
+        }
 
-    filepath.write_text(output, encoding='utf-8')
+    # Save to the sink (markdown files are named by URL, not title)
+    filepath = sink.write(make_page(url, title, result.status_code, markdown, validation=validation_result))
+    filename = Path(filepath).name if sink.per_page_files else url
 
-    print(f"  Saved: {filename} ({len(markdown)} chars)", file=sys.stderr)
+    if ready_ms is not None:
+        print(f"  Saved: {filename} ({len(markdown)} chars, ready in {ready_ms}ms)", file=sys.stderr)
+    else:
+        print(f"  Saved: {filename} ({len(markdown)} chars)", file=sys.stderr)
 
     return {
         'success': True,
         'url': url,
-        'file': str(filepath),
+        'file': filepath,
         'title': title,
-        'validation': validation_result
+        'validation': validation_result,
+        'ready_ms': ready_ms
     }
 
 
@@ -315,7 +430,14 @@ async def batch_spa_to_markdown(
     init_url: str = None,
     delay: float = 3.0,
     validate: bool = True,
-    inter_request_delay: float = 2.0
+    inter_request_delay: float = 2.0,
+    workers: int = 1,
+    adaptive: bool = False,
+    validators_file: str | None = None,
+    server: str | None = None,
+    sink: str = 'markdown',
+    url_rules_file: str | None = None,
+    keep_near_duplicates: bool = False
 ) -> dict:
     """
     Convert multiple SPA URLs to markdown files using session-based navigation.
@@ -329,14 +451,34 @@ async def batch_spa_to_markdown(
         init_url: URL to load first to initialize SPA router (auto-derived if None)
         delay: Delay before capturing content (default: 3.0s for SPAs)
         validate: Enable content validation
-        inter_request_delay: Delay between requests (default: 2.0s)
+        inter_request_delay: Delay between requests within a session (default: 2.0s)
+        workers: Number of parallel sessions, each initialized at init_url (default: 1)
+        adaptive: Return as soon as the DOM settles, using delay as the upper bound
+        validators_file: YAML/JSON validation rules, checked before the built-in rules
+        server: Browser pool service URL (crawl_server.py); None launches a browser here
+        sink: 'markdown' (file per page), 'jsonl' or 'sqlite' (one corpus in output_dir)
+        url_rules_file: YAML/JSON per-domain URL normalization rules (see crawl_urls)
+        keep_near_duplicates: Store pages whose content nearly duplicates an earlier page
 
     Returns:
-        Dict with 'successful', 'failed', and 'validation_failures' lists
+        Dict with 'successful', 'failed', 'validation_failures' and 'duplicates'
+        (near-duplicate pages not stored) lists, and 'duplicate_urls' (URL
+        aliases dropped before crawling)
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Aliases of one page (utm tags, fragments, http/https, ...) collapse to one URL
+    unique_urls = load_url_rules(url_rules_file).dedupe(urls)
+    duplicate_urls = len(urls) - len(unique_urls)
+    if duplicate_urls:
+        print(f"Normalized URLs: {duplicate_urls} duplicates dropped, {len(unique_urls)} remaining", file=sys.stderr)
+    urls = unique_urls
+
+    validators = load_validators(validators_file)
+    page_sink = open_sink(sink, output_path, slug_from_title=False)
+    near_duplicates = None if keep_near_duplicates else NearDuplicateIndex()
+
     # Derive init URL if not provided
     if not init_url:
         init_url = derive_init_url(urls)
@@ -350,67 +492,99 @@ async def batch_spa_to_markdown(
     results = {
         'successful': [],
         'failed': [],
-        'validation_failures': []
+        'validation_failures': [],
+        'duplicates': [],
+        'duplicate_urls': duplicate_urls
     }
 
-    session_id = "spa_batch_session"
+    workers = max(1, min(workers, len(urls)))
+    queue = asyncio.Queue()
+    for index, url in enumerate(urls, 1):
+        queue.put_nowait((index, url))
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        # Initialize SPA session first
+    # Results are stored by position so the summary keeps input order
+    ordered = [None] * len(urls)
+
+    async def worker(crawler, session_id: str) -> None:
+        """Drain the queue, navigating one URL at a time within a single session."""
+        # Initialize this worker's SPA session first
         if init_url:
-            init_success = await initialize_spa_session(crawler, init_url, session_id)
+            try:
+                init_success = await initialize_spa_session(crawler, init_url, session_id)
+            except Exception as e:
+                # The worker must still drain its share of the queue, so each
+                # of its URLs gets a result (a failure if the session is broken)
+                print(f"  ERROR: SPA init raised for {session_id}: {e}", file=sys.stderr)
+                init_success = False
             if not init_success:
-                print("WARNING: SPA initialization failed, falling back to direct access", file=sys.stderr)
+                print(f"WARNING: SPA initialization failed for {session_id}, falling back to direct access", file=sys.stderr)
+
+        while True:
+            try:
+                index, url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
-        # Crawl each URL using session navigation
-        for index, url in enumerate(urls, 1):
             try:
-                result = await crawl_spa_url(
+                ordered[index - 1] = await crawl_spa_url(
                     crawler=crawler,
                     url=url,
-                    output_dir=output_path,
+                    sink=page_sink,
                     delay=delay,
                     validate=validate,
                     index=index,
                     total=len(urls),
                     session_id=session_id,
-                    use_session_nav=True  # Use session-based navigation
+                    use_session_nav=True,  # Use session-based navigation
+                    adaptive=adaptive,
+                    validators=validators,
+                    near_duplicates=near_duplicates
                 )
-
-                if result['success']:
-                    results['successful'].append(result)
-
-                    # Track validation failures separately
-                    if result.get('validation') and not result['validation']['valid']:
-                        results['validation_failures'].append(result)
-                else:
-                    results['failed'].append(result)
-
             except Exception as e:
-                results['failed'].append({
+                ordered[index - 1] = {
                     'success': False,
                     'url': url,
                     'error': str(e),
                     'validation': None
-                })
+                }
                 print(f"  ERROR: {e}", file=sys.stderr)
 
             # Delay between requests to let SPA state settle
-            if index < len(urls):
+            if not queue.empty():
                 await asyncio.sleep(inter_request_delay)
 
-    return results
-
+    try:
+        async with create_crawler('browser', browser_config, server) as crawler:
+            if workers == 1:
+                session_ids = ["spa_batch_session"]
+            else:
+                session_ids = [f"spa_batch_session_{i}" for i in range(1, workers + 1)]
+                print(f"Starting {workers} parallel SPA sessions", file=sys.stderr)
+
+            # A pooled browser may be running other batches' sessions at the same time
+            if server:
+                run_id = secrets.token_hex(4)
+                session_ids = [f"{sid}_{run_id}" for sid in session_ids]
+
+            await asyncio.gather(*(worker(crawler, sid) for sid in session_ids))
+    finally:
+        page_sink.close()
+
+    for result in ordered:
+        if result['success']:
+            # Near-duplicates were crawled but not stored
+            if result.get('duplicate_of'):
+                results['duplicates'].append(result)
+            else:
+                results['successful'].append(result)
+
+            # Track validation failures separately
+            if result.get('validation') and not result['validation']['valid']:
+                results['validation_failures'].append(result)
+        else:
+            results['failed'].append(result)
 
-def load_urls_from_file(filepath: str) -> list[str]:
-    """Load URLs from a text file (one per line)."""
-    urls = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                urls.append(line)
-    return urls
+    return results
 
 
 def main():
@@ -448,17 +622,58 @@ def main():
         default=2.0,
         help='Delay between requests (default: 2.0s)'
     )
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        help='Capture as soon as page content stops changing (--delay becomes the upper bound)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Parallel browser sessions, each navigating sequentially (default: 1)'
+    )
     parser.add_argument(
         '--validate-content',
         action='store_true',
         default=True,
         help='Enable content validation (default: True)'
     )
+    parser.add_argument(
+        '--validators',
+        help='YAML/JSON file of content validation rules (see configs/spa-validators.yaml)'
+    )
     parser.add_argument(
         '--no-validate',
         action='store_true',
         help='Disable content validation'
     )
+    parser.add_argument(
+        '--sink',
+        choices=SINKS,
+        default='markdown',
+        help='Output format: markdown (file per page), jsonl (_corpus.jsonl) or '
+             'sqlite (_corpus.sqlite3) in --output-dir (default: markdown)'
+    )
+    parser.add_argument(
+        '--url-rules',
+        help='YAML/JSON per-domain URL normalization rules (see configs/url-rules.yaml)'
+    )
+    parser.add_argument(
+        '--keep-near-duplicates',
+        action='store_true',
+        help='Store pages even when their content nearly duplicates an earlier page'
+    )
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Crawl through the shared browser pool service (start it with crawl_server.py)'
+    )
+    parser.add_argument(
+        '--server-url',
+        default=DEFAULT_SERVER_URL,
+        help=f'Browser pool service URL (default: {DEFAULT_SERVER_URL})'
+    )
 
     args = parser.parse_args()
 
@@ -479,8 +694,9 @@ def main():
     print(f"SPA Batch Crawler (Session-Based Navigation)", file=sys.stderr)
     print(f"  URLs: {len(urls)}", file=sys.stderr)
     print(f"  Init URL: {args.init_url or '(auto-derived)'}", file=sys.stderr)
-    print(f"  Delay: {args.delay}s", file=sys.stderr)
+    print(f"  Delay: {args.delay}s{' (max, adaptive)' if args.adaptive else ''}", file=sys.stderr)
     print(f"  Inter-request delay: {args.inter_delay}s", file=sys.stderr)
+    print(f"  Workers: {args.workers}", file=sys.stderr)
     print(f"  Content validation: {validate}", file=sys.stderr)
     print(f"  Output: {args.output_dir}", file=sys.stderr)
     print("", file=sys.stderr)
@@ -492,7 +708,14 @@ def main():
             init_url=args.init_url,
             delay=args.delay,
             validate=validate,
-            inter_request_delay=args.inter_delay
+            inter_request_delay=args.inter_delay,
+            workers=args.workers,
+            adaptive=args.adaptive,
+            validators_file=args.validators,
+            server=args.server_url if args.server else None,
+            sink=args.sink,
+            url_rules_file=args.url_rules,
+            keep_near_duplicates=args.keep_near_duplicates
         ))
 
         # Summary
@@ -503,6 +726,18 @@ def main():
 
         if validate:
             print(f"  Validation failures: {len(results['validation_failures'])}", file=sys.stderr)
+        if results['duplicate_urls']:
+            print(f"  Duplicate URLs dropped: {results['duplicate_urls']}", file=sys.stderr)
+        if results['duplicates']:
+            print(f"  Near-duplicates not stored: {len(results['duplicates'])}", file=sys.stderr)
+
+        ready_times = [r['ready_ms'] for r in results['successful'] if r.get('ready_ms') is not None]
+        if ready_times:
+            print(
+                f"  Readiness: median {statistics.median(ready_times):.0f}ms, "
+                f"max {max(ready_times)}ms (fixed delay: {args.delay * 1000:.0f}ms)",
+                file=sys.stderr
+            )
 
         if results['failed']:
             print("\nFailed URLs:", file=sys.stderr)
@@ -3,6 +3,11 @@ Batch URL to Markdown converter using Crawl4AI.
 
 Converts multiple URLs to markdown files with concurrent processing.
 
+Requests are scheduled per host (see crawl_scheduler.py): each host has its
+own queue, concurrency cap and spacing (robots.txt Crawl-delay honored,
+backoff on 429/503 with Retry-After), and hosts are served round-robin, so
+a list mixing several sites crawls them in parallel without hammering any.
+
 Usage:
     python batch_urls_to_markdown.py <urls_file> --output-dir <directory>
     python batch_urls_to_markdown.py --urls <url1> <url2> ... --output-dir <directory>
@@ -14,47 +19,80 @@ Examples:
     # For JavaScript-rendered sites (React, Vue, etc.)
     python batch_urls_to_markdown.py urls.txt -o ./output --js-render
     python batch_urls_to_markdown.py urls.txt -o ./output --wait-for "css:.content" --delay 2.0
+
+    # Re-run after failures: cached pages are reused, only stale/failed URLs are fetched
+    python batch_urls_to_markdown.py urls.txt -o ./output --cache-ttl 48 --cache-max-mb 1000
+    python batch_urls_to_markdown.py urls.txt -o ./output --no-cache
+
+    # Static docs sites: plain HTTP, escalate to the browser only for SPA shells
+    python batch_urls_to_markdown.py urls.txt -o ./output --engine auto
+
+    # Resume an interrupted run: skips URLs the job journal records as done
+    python batch_urls_to_markdown.py urls.txt -o ./output --resume
+
+    # One JSONL corpus (or SQLite database) instead of a file per page
+    python batch_urls_to_markdown.py urls.txt -o ./output --sink jsonl
+
+    # Reuse warm browsers from the shared pool service (python crawl_server.py)
+    python batch_urls_to_markdown.py urls.txt -o ./output --server
+
+    # URL aliases (utm tags, fragments, http/https) are crawled once and mirrored
+    # pages stored once; site-specific normalization rules come from a file
+    python batch_urls_to_markdown.py urls.txt -o ./output --url-rules ../configs/url-rules.yaml
+    python batch_urls_to_markdown.py urls.txt -o ./output --keep-near-duplicates
+
+    # Mixed-site lists: 20 requests in flight overall, at most 2 per host
+    python batch_urls_to_markdown.py urls.txt -o ./output -c 20 --per-host 2
 """
 
 import argparse
 import asyncio
-import re
 import sys
 from pathlib import Path
-from urllib.parse import urlparse
-
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-from crawl4ai import MemoryAdaptiveDispatcher, RateLimiter
 
+from crawl4ai import BrowserConfig, CrawlerRunConfig, CacheMode
 
-def slugify(text: str) -> str:
-    """Convert text to a safe filename slug."""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_-]+', '-', text)
-    text = text.strip('-')
-    return text[:60] or 'untitled'
+from crawl_cache import CrawlCache, DEFAULT_CACHE_DIR
+from crawl_client import DEFAULT_SERVER_URL
+from crawl_dedupe import NearDuplicateIndex
+from crawl_engine import ENGINES, crawl_many
+from crawl_journal import CrawlJournal, JOURNAL_FILENAME
+from crawl_scheduler import PolitenessScheduler
+from crawl_sink import SINKS, make_page, open_sink
+from crawl_urls import load_url_rules, load_urls_from_file
 
 
-def get_filename_from_result(result, index: int) -> str:
-    """Generate a filename from crawl result."""
-    title = result.metadata.get('title', '')
-    if title:
-        return f"{slugify(title)}.md"
+def get_elapsed_seconds(result) -> float | None:
+    """Per-URL crawl time from the dispatcher, if it was recorded."""
+    dispatch = getattr(result, 'dispatch_result', None)
+    if not dispatch or not dispatch.start_time or not dispatch.end_time:
+        return None
 
-    # Fall back to URL path
-    parsed = urlparse(result.url)
-    path_slug = slugify(parsed.path) or slugify(parsed.netloc)
-    return f"{path_slug}-{index}.md"
+    elapsed = dispatch.end_time - dispatch.start_time
+    if isinstance(elapsed, (int, float)):
+        return float(elapsed)
+    return elapsed.total_seconds()
 
 
 async def batch_urls_to_markdown(
     urls: list[str],
     output_dir: str,
     max_concurrent: int = 5,
+    per_host: int = 2,
+    respect_crawl_delay: bool = True,
     js_render: bool = False,
     wait_for: str = None,
-    delay: float = 0.0
+    delay: float = 0.0,
+    use_cache: bool = True,
+    cache_ttl_hours: float = 24.0,
+    cache_max_mb: float = 500.0,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    resume: bool = False,
+    engine: str = 'browser',
+    server: str | None = None,
+    sink: str = 'markdown',
+    url_rules_file: str | None = None,
+    keep_near_duplicates: bool = False
 ) -> dict:
     """
     Convert multiple URLs to markdown files.
@@ -62,17 +100,53 @@ async def batch_urls_to_markdown(
     Args:
         urls: List of URLs to crawl
         output_dir: Directory to save markdown files
-        max_concurrent: Maximum concurrent crawls
+        max_concurrent: Maximum concurrent crawls across all hosts
+        per_host: Maximum concurrent crawls per host (default: 2)
+        respect_crawl_delay: Space requests by robots.txt Crawl-delay (default: True)
         js_render: Enable JavaScript rendering mode (for SPAs)
         wait_for: CSS selector to wait for before capturing
         delay: Delay in seconds before capturing content
+        use_cache: Reuse cached results from previous runs (default: True)
+        cache_ttl_hours: Age after which cached pages are refetched (default: 24)
+        cache_max_mb: Cache size limit; least recently used pages are evicted (default: 500)
+        cache_dir: Cache directory (default: <tool>/.crawl-cache)
+        resume: Skip URLs the job journal records as completed (default: False)
+        engine: 'browser', 'http' (no browser) or 'auto' (HTTP, browser for SPA shells)
+        server: Browser pool service URL (crawl_server.py); None launches browsers here
+        sink: 'markdown' (file per page), 'jsonl' or 'sqlite' (one corpus in output_dir)
+        url_rules_file: YAML/JSON per-domain URL normalization rules (see crawl_urls)
+        keep_near_duplicates: Store pages whose content nearly duplicates an earlier page
 
     Returns:
-        Dict with 'successful' and 'failed' lists
+        Dict with 'successful', 'failed', 'skipped' and 'duplicates' (near-duplicate
+        pages not stored) lists, 'duplicate_urls' (URL aliases dropped before
+        crawling), 'cache' hit/miss counts and 'domains' (per-host pages, rate
+        and backoff events, see PolitenessScheduler.host_stats)
+
+    URLs are normalized and de-duplicated before crawling. Every URL outcome is
+    appended to <output_dir>/_crawl_journal.jsonl, so an interrupted run can be
+    continued with resume=True.
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Aliases of one page (utm tags, fragments, http/https, ...) collapse to one URL
+    unique_urls = load_url_rules(url_rules_file).dedupe(urls)
+    duplicate_urls = len(urls) - len(unique_urls)
+    if duplicate_urls:
+        print(f"Normalized URLs: {duplicate_urls} duplicates dropped, {len(unique_urls)} remaining", file=sys.stderr)
+    urls = unique_urls
+
+    journal = CrawlJournal(output_path / JOURNAL_FILENAME)
+    page_sink = open_sink(sink, output_path)
+    near_duplicates = None if keep_near_duplicates else NearDuplicateIndex()
+    skipped = []
+    if resume:
+        completed = journal.completed_urls()
+        skipped = [url for url in urls if url in completed]
+        urls = [url for url in urls if url not in completed]
+        print(f"Resuming: {len(skipped)} URLs already completed, {len(urls)} remaining", file=sys.stderr)
+
     browser_config = BrowserConfig()
 
     # Build run config with optional JS rendering support
@@ -104,82 +178,139 @@ async def batch_urls_to_markdown(
     if delay > 0 and not js_render:
         config_kwargs["delay_before_return_html"] = delay
 
-    run_config = CrawlerRunConfig(**config_kwargs)
+    if engine == 'http' and (js_render or wait_for):
+        print("WARNING: --js-render/--wait-for are ignored by the http engine", file=sys.stderr)
 
-    rate_limiter = RateLimiter(
-        base_delay=(0.5, 1.5),
-        max_delay=30.0,
-        max_retries=2
-    )
+    # Pages rendered by different engines may differ, so the engine is part of the cache key
+    cache_knobs = {**config_kwargs, 'engine': engine}
 
-    dispatcher = MemoryAdaptiveDispatcher(
-        memory_threshold_percent=80.0,
-        max_session_permit=max_concurrent,
-        rate_limiter=rate_limiter
-    )
+    run_config = CrawlerRunConfig(**config_kwargs)
 
-    results = {'successful': [], 'failed': []}
+    results = {
+        'successful': [],
+        'failed': [],
+        'skipped': skipped,
+        'duplicates': [],
+        'duplicate_urls': duplicate_urls,
+        'cache': {'hits': 0, 'misses': 0},
+        'domains': []
+    }
+    index = 0
+    saved_files = {}
+
+    def skip_near_duplicate(url: str, markdown: str, elapsed: float | None) -> bool:
+        """Record url as a near-duplicate of a stored page; False if its content is new."""
+        original = near_duplicates.check(markdown, url) if near_duplicates else None
+        if original is None:
+            return False
+
+        results['duplicates'].append({'url': url, 'duplicate_of': original})
+        journal.record(url, 'duplicate', file=saved_files.get(original), markdown=markdown, elapsed=elapsed)
+        print(f"[{index}/{len(urls)}] Near-duplicate of {original}: {url}", file=sys.stderr)
+        return True
+
+    # Serve fresh cache entries first; only misses go to the browser
+    cache = None
+    cache_keys = {}
+    pending_urls = urls
+    if use_cache:
+        cache = CrawlCache(
+            cache_dir,
+            ttl_seconds=cache_ttl_hours * 3600,
+            max_bytes=int(cache_max_mb * 1024 * 1024)
+        )
+        pending_urls = []
+        for url in urls:
+            key = cache.make_key(url, cache_knobs)
+            entry = cache.get(key)
+            if entry is None:
+                cache_keys[url] = key
+                pending_urls.append(url)
+                continue
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        index = 0
-        async for result in await crawler.arun_many(
-            urls=urls,
-            config=run_config,
-            dispatcher=dispatcher
-        ):
             index += 1
+            if skip_near_duplicate(url, entry['markdown'], 0.0):
+                continue
+
+            title = entry['title'] or 'Untitled'
+            filepath = page_sink.write(make_page(url, title, entry['status_code'], entry['markdown']))
+            saved_files[url] = filepath
+            results['successful'].append({
+                'url': url,
+                'file': filepath,
+                'title': title,
+                'cached': True
+            })
+            journal.record(url, 'done', file=filepath, markdown=entry['markdown'], elapsed=0.0)
+            print(f"[{index}/{len(urls)}] Cached: {Path(filepath).name if page_sink.per_page_files else url}", file=sys.stderr)
+
+    scheduler = PolitenessScheduler(
+        max_concurrent=max_concurrent,
+        per_host=per_host,
+        respect_crawl_delay=respect_crawl_delay
+    )
 
-            if result.success:
-                # Get markdown content
-                markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
-                title = result.metadata.get('title', 'Untitled')
-
-                # Build output with metadata
-                output = f"# {title}\n\n"
-                output += f"- **Source:** {result.url}\n"
-                output += f"- **Status:** {result.status_code}\n\n"
-                output += "---\n\n"
-                output += markdown
-
-                # Save to file
-                filename = get_filename_from_result(result, index)
-                filepath = output_path / filename
-
-                # Avoid overwriting
-                if filepath.exists():
-                    stem = filepath.stem
-                    filepath = output_path / f"{stem}-{index}.md"
-
-                filepath.write_text(output, encoding='utf-8')
-
-                results['successful'].append({
-                    'url': result.url,
-                    'file': str(filepath),
-                    'title': title
-                })
-                print(f"[{index}/{len(urls)}] Saved: {filename}", file=sys.stderr)
-
-            else:
-                results['failed'].append({
-                    'url': result.url,
-                    'error': result.error_message
-                })
-                print(f"[{index}/{len(urls)}] Failed: {result.url} - {result.error_message}", file=sys.stderr)
+    try:
+        if pending_urls:
+            async for result in crawl_many(
+                pending_urls,
+                run_config,
+                engine=engine,
+                browser_config=browser_config,
+                scheduler=scheduler,
+                server=server
+            ):
+                index += 1
+
+                if result.success:
+                    # Get markdown content
+                    markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
+                    title = result.metadata.get('title', 'Untitled')
+
+                    # Only successful pages are cached, so failures are retried next run
+                    if cache:
+                        key = cache_keys.get(result.url) or cache.make_key(result.url, cache_knobs)
+                        cache.put(key, result.url, title, result.status_code, markdown)
+
+                    if skip_near_duplicate(result.url, markdown, get_elapsed_seconds(result)):
+                        continue
+
+                    # Save to the sink (one file per URL, or a corpus record)
+                    filepath = page_sink.write(make_page(result.url, title, result.status_code, markdown))
+                    saved_files[result.url] = filepath
+
+                    results['successful'].append({
+                        'url': result.url,
+                        'file': filepath,
+                        'title': title
+                    })
+                    journal.record(
+                        result.url, 'done', file=filepath,
+                        markdown=markdown, elapsed=get_elapsed_seconds(result)
+                    )
+                    print(f"[{index}/{len(urls)}] Saved: {Path(filepath).name if page_sink.per_page_files else result.url}", file=sys.stderr)
+
+                else:
+                    results['failed'].append({
+                        'url': result.url,
+                        'error': result.error_message
+                    })
+                    journal.record(
+                        result.url, 'failed', elapsed=get_elapsed_seconds(result),
+                        error=result.error_message
+                    )
+                    print(f"[{index}/{len(urls)}] Failed: {result.url} - {result.error_message}", file=sys.stderr)
+    finally:
+        results['domains'] = scheduler.host_stats()
+        journal.close()
+        page_sink.close()
+        if cache:
+            results['cache'] = {'hits': cache.hits, 'misses': cache.misses}
+            cache.close()
 
     return results
 
 
-def load_urls_from_file(filepath: str) -> list[str]:
-    """Load URLs from a text file (one per line)."""
-    urls = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                urls.append(line)
-    return urls
-
-
 def main():
     parser = argparse.ArgumentParser(
         description='Convert multiple URLs to markdown files using Crawl4AI'
@@ -203,7 +334,18 @@ def main():
         '-c', '--concurrent',
         type=int,
         default=5,
-        help='Maximum concurrent crawls (default: 5)'
+        help='Maximum concurrent crawls across all hosts (default: 5)'
+    )
+    parser.add_argument(
+        '--per-host',
+        type=int,
+        default=2,
+        help='Maximum concurrent crawls per host (default: 2; 1 when robots.txt sets a Crawl-delay)'
+    )
+    parser.add_argument(
+        '--ignore-crawl-delay',
+        action='store_true',
+        help='Do not read robots.txt Crawl-delay (use only on sites you are allowed to crawl faster)'
     )
     parser.add_argument(
         '--js-render',
@@ -220,6 +362,61 @@ def main():
         default=0.0,
         help='Delay in seconds before capturing content (default: 0)'
     )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=24.0,
+        help='Hours before a cached page is refetched (default: 24)'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=float,
+        default=500.0,
+        help='Maximum cache size in MB, least recently used pages evicted first (default: 500)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the crawl cache (always fetch every URL)'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default='browser',
+        help='Fetch engine: browser (Chromium), http (no browser, static pages), '
+             'auto (http, escalating SPA shells to browser) (default: browser)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip URLs already completed according to the job journal in --output-dir'
+    )
+    parser.add_argument(
+        '--sink',
+        choices=SINKS,
+        default='markdown',
+        help='Output format: markdown (file per page), jsonl (_corpus.jsonl) or '
+             'sqlite (_corpus.sqlite3) in --output-dir (default: markdown)'
+    )
+    parser.add_argument(
+        '--url-rules',
+        help='YAML/JSON per-domain URL normalization rules (see configs/url-rules.yaml)'
+    )
+    parser.add_argument(
+        '--keep-near-duplicates',
+        action='store_true',
+        help='Store pages even when their content nearly duplicates an earlier page'
+    )
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Crawl through the shared browser pool service (start it with crawl_server.py)'
+    )
+    parser.add_argument(
+        '--server-url',
+        default=DEFAULT_SERVER_URL,
+        help=f'Browser pool service URL (default: {DEFAULT_SERVER_URL})'
+    )
 
     args = parser.parse_args()
 
@@ -242,13 +439,47 @@ def main():
             urls=urls,
             output_dir=args.output_dir,
             max_concurrent=args.concurrent,
+            per_host=args.per_host,
+            respect_crawl_delay=not args.ignore_crawl_delay,
             js_render=args.js_render,
             wait_for=args.wait_for,
-            delay=args.delay
+            delay=args.delay,
+            use_cache=not args.no_cache,
+            cache_ttl_hours=args.cache_ttl,
+            cache_max_mb=args.cache_max_mb,
+            resume=args.resume,
+            engine=args.engine,
+            server=args.server_url if args.server else None,
+            sink=args.sink,
+            url_rules_file=args.url_rules,
+            keep_near_duplicates=args.keep_near_duplicates
         ))
 
         # Summary
         print(f"\nCompleted: {len(results['successful'])} successful, {len(results['failed'])} failed", file=sys.stderr)
+        if args.resume:
+            print(f"Skipped (already completed): {len(results['skipped'])}", file=sys.stderr)
+        if results['duplicate_urls']:
+            print(f"Duplicate URLs dropped after normalization: {results['duplicate_urls']}", file=sys.stderr)
+        if results['duplicates']:
+            print(f"Near-duplicate pages not stored: {len(results['duplicates'])}", file=sys.stderr)
+        if not args.no_cache:
+            cache = results['cache']
+            print(f"Cache: {cache['hits']} hits, {cache['misses']} misses", file=sys.stderr)
+
+        if results['domains']:
+            print("\nPer-domain:", file=sys.stderr)
+            for domain in results['domains']:
+                rate = f"{domain['pages_per_minute']}/min" if domain['pages_per_minute'] else '-'
+                delay = f", crawl-delay {domain['crawl_delay']:g}s" if domain['crawl_delay'] else ''
+                print(
+                    f"  {domain['host']}: {domain['pages']} pages ({domain['failed']} failed), {rate}{delay}, "
+                    f"{domain['backoffs']} backoffs, {domain['retries']} retries",
+                    file=sys.stderr
+                )
+                for event in domain['backoff_events']:
+                    source = 'Retry-After' if event['retry_after'] else 'exponential'
+                    print(f"    HTTP {event['status']}: waited {event['wait']}s ({source}) {event['url']}", file=sys.stderr)
 
         if results['failed']:
             print("\nFailed URLs:", file=sys.stderr)
@@ -0,0 +1,231 @@
+"""
+Persistent on-disk crawl cache for Crawl4AI scripts.
+
+Stores successful crawl results so repeat runs over the same URL list only
+hit the network for stale, failed, or never-seen URLs.
+
+Layout:
+    <cache_dir>/index.sqlite3      - entry index (key, url, timestamps, size)
+    <cache_dir>/objects/ab/abcd... - markdown blobs, named by SHA-256 of content
+
+Entries are keyed by the normalized URL plus the effective crawl settings
+(excluded_tags, js_render, wait_for, ...), so changing a setting never
+returns content rendered under different settings. Blobs are content-addressed:
+identical pages share one blob on disk.
+
+Eviction:
+    - Entries older than ttl_seconds are treated as misses and replaced
+    - When total blob size exceeds max_bytes, least recently used entries
+      are evicted until the cache fits again
+
+Usage:
+    from crawl_cache import CrawlCache
+
+    cache = CrawlCache(DEFAULT_CACHE_DIR, ttl_seconds=86400, max_bytes=500 * 1024 * 1024)
+    key = cache.make_key(url, config_kwargs)
+    entry = cache.get(key)
+    if entry is None:
+        ...crawl...
+        cache.put(key, url, title, status_code, markdown)
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from urllib.parse import urlparse, urlunparse
+
+
+# Default cache location (shared by all scripts in this tool)
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".crawl-cache"
+
+# Config keys that never change page content and are left out of cache keys
+_IGNORED_CONFIG_KEYS = {'cache_mode', 'stream', 'verbose'}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for cache lookups.
+
+    Lowercases scheme and host, drops default ports and fragments, and
+    strips a trailing slash from non-root paths.
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+
+    if (scheme == 'http' and netloc.endswith(':80')) or \
+            (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parsed.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    return urlunparse((scheme, netloc, path, parsed.params, parsed.query, ''))
+
+
+class CrawlCache:
+    """SQLite-indexed, content-addressed markdown cache with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        ttl_seconds: float = 86400,
+        max_bytes: int = 500 * 1024 * 1024
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / 'objects'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._db = sqlite3.connect(str(self.cache_dir / 'index.sqlite3'))
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                title TEXT,
+                status_code INTEGER,
+                content_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)"
+        )
+        self._db.commit()
+
+    def make_key(self, url: str, config: dict | None = None) -> str:
+        """Build a cache key from the normalized URL and effective crawl settings."""
+        knobs = {
+            k: v for k, v in (config or {}).items()
+            if k not in _IGNORED_CONFIG_KEYS
+        }
+        payload = json.dumps(
+            {'url': normalize_url(url), 'config': knobs},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.objects_dir / content_hash[:2] / content_hash
+
+    def get(self, key: str) -> dict | None:
+        """
+        Look up a cached entry.
+
+        Returns:
+            Dict with 'url', 'title', 'status_code', 'markdown', 'fetched_at',
+            or None on a miss (absent, expired, or blob missing)
+        """
+        row = self._db.execute(
+            "SELECT url, title, status_code, content_hash, fetched_at FROM entries WHERE key = ?",
+            (key,)
+        ).fetchone()
+
+        now = time.time()
+        if row is None or now - row[4] > self.ttl_seconds:
+            self.misses += 1
+            return None
+
+        blob = self._blob_path(row[3])
+        try:
+            markdown = blob.read_text(encoding='utf-8')
+        except OSError:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._db.commit()
+            self.misses += 1
+            return None
+
+        self._db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        self.hits += 1
+
+        return {
+            'url': row[0],
+            'title': row[1],
+            'status_code': row[2],
+            'markdown': markdown,
+            'fetched_at': row[4]
+        }
+
+    def put(self, key: str, url: str, title: str, status_code: int, markdown: str) -> None:
+        """Store a successful crawl result, then evict down to max_bytes."""
+        data = markdown.encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        blob = self._blob_path(content_hash)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_suffix('.tmp')
+            tmp.write_bytes(data)
+            tmp.replace(blob)
+
+        previous = self._db.execute(
+            "SELECT content_hash FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, title, status_code, content_hash, len(data), now, now)
+        )
+        self._db.commit()
+
+        if previous and previous[0] != content_hash:
+            self._drop_blob_if_unreferenced(previous[0])
+
+        self._evict()
+
+    def _drop_blob_if_unreferenced(self, content_hash: str) -> None:
+        in_use = self._db.execute(
+            "SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        if not in_use:
+            self._blob_path(content_hash).unlink(missing_ok=True)
+
+    def _total_bytes(self) -> int:
+        # Blobs are shared between entries, so count each content hash once
+        row = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT content_hash, MAX(size) AS size FROM entries GROUP BY content_hash)"
+        ).fetchone()
+        return row[0]
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+
+        rows = self._db.execute(
+            "SELECT key, content_hash FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+
+        for key, content_hash in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            in_use = self._db.execute(
+                "SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)
+            ).fetchone()
+            if not in_use:
+                blob = self._blob_path(content_hash)
+                try:
+                    total -= blob.stat().st_size
+                    blob.unlink()
+                except OSError:
+                    pass
+
+        self._db.commit()
+
+    def close(self) -> None:
+        """Close the index database."""
+        self._db.close()
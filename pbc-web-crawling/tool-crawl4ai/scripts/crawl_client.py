@@ -0,0 +1,173 @@
+"""
+Client for the shared browser pool service (crawl_server.py).
+
+RemoteCrawler has the slice of the AsyncWebCrawler interface the crawl
+scripts use (async context manager, arun, arun_many), but sends the work to
+a long-lived local daemon that keeps browsers warm between runs. Configs
+travel as BrowserConfig/CrawlerRunConfig .dump() dicts; results come back
+as lightweight objects with the CrawlResult attributes the scripts read
+(url, success, status_code, error_message, metadata, markdown, html,
+response_headers, dispatch_result).
+
+Usage:
+    from crawl_client import DEFAULT_SERVER_URL, RemoteCrawler
+
+    async with RemoteCrawler(DEFAULT_SERVER_URL, browser_config=browser_config) as crawler:
+        result = await crawler.arun(url, config=run_config)
+"""
+
+import json
+import os
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+
+import aiohttp
+from crawl4ai import BrowserConfig
+
+
+# Daemon address; override with CRAWL_SERVER_URL or --server <url>
+DEFAULT_SERVER_URL = os.environ.get('CRAWL_SERVER_URL', 'http://127.0.0.1:11240')
+
+# Crawls can legitimately run for a long time; only connecting is bounded
+CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10)
+
+
+class RemoteMarkdown(str):
+    """Markdown that reads like crawl4ai's: a str with raw/fit attributes."""
+
+    def __new__(cls, raw_markdown: str = '', fit_markdown: str = ''):
+        obj = super().__new__(cls, raw_markdown or '')
+        obj.raw_markdown = raw_markdown or ''
+        obj.fit_markdown = fit_markdown or ''
+        return obj
+
+
+def result_from_dict(data: dict) -> SimpleNamespace:
+    """Rebuild a CrawlResult-like object from a server response record."""
+    markdown = data.get('markdown')
+    dispatch = data.get('dispatch_result')
+    return SimpleNamespace(
+        url=data.get('url'),
+        success=data.get('success', False),
+        status_code=data.get('status_code'),
+        error_message=data.get('error_message'),
+        metadata=data.get('metadata') or {},
+        markdown=RemoteMarkdown(**markdown) if markdown else None,
+        html=data.get('html'),
+        response_headers=data.get('response_headers') or {},
+        redirected_url=data.get('redirected_url'),
+        session_id=data.get('session_id'),
+        dispatch_result=SimpleNamespace(**dispatch) if dispatch else None,
+    )
+
+
+def dispatcher_settings(dispatcher) -> dict | None:
+    """
+    Settings of a MemoryAdaptiveDispatcher/RateLimiter pair, for the server.
+
+    Dispatchers cannot be serialized, so the server rebuilds one from these.
+    """
+    if dispatcher is None:
+        return None
+
+    settings = {}
+    for name in ('max_session_permit', 'memory_threshold_percent'):
+        value = getattr(dispatcher, name, None)
+        if value is not None:
+            settings[name] = value
+
+    rate_limiter = getattr(dispatcher, 'rate_limiter', None)
+    if rate_limiter is not None:
+        settings['rate_limiter'] = {
+            name: getattr(rate_limiter, name)
+            for name in ('base_delay', 'max_delay', 'max_retries')
+            if getattr(rate_limiter, name, None) is not None
+        }
+    return settings
+
+
+class RemoteCrawler:
+    """AsyncWebCrawler stand-in that crawls through the browser pool service."""
+
+    def __init__(
+        self,
+        server_url: str = DEFAULT_SERVER_URL,
+        engine: str = 'browser',
+        browser_config: BrowserConfig | None = None
+    ):
+        self.server_url = server_url.rstrip('/')
+        self.engine = engine
+        self.browser_config = browser_config or BrowserConfig()
+        self._session = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(timeout=CLIENT_TIMEOUT)
+        try:
+            async with self._session.get(f'{self.server_url}/health') as response:
+                response.raise_for_status()
+        except aiohttp.ClientError as e:
+            await self._session.close()
+            raise RuntimeError(
+                f"Crawl server not reachable at {self.server_url} "
+                f"(start it with: python crawl_server.py): {e}"
+            ) from e
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    async def _stream(self, endpoint: str, payload: dict) -> AsyncIterator:
+        """POST a job and yield results from the NDJSON response as they arrive."""
+        payload = {
+            'engine': self.engine,
+            'browser_config': self.browser_config.dump(),
+            **payload,
+        }
+        async with self._session.post(f'{self.server_url}{endpoint}', json=payload) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Crawl server error {response.status}: {await response.text()}")
+
+            # Split lines ourselves: a page's HTML easily exceeds aiohttp's readline limit
+            buffer = b''
+            async for chunk in response.content.iter_any():
+                buffer += chunk
+                *lines, buffer = buffer.split(b'\n')
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if 'error' in record:
+                        raise RuntimeError(f"Crawl server error: {record['error']}")
+                    yield result_from_dict(record['result'])
+
+    async def arun(self, url: str, config=None):
+        """
+        Crawl one URL. Like AsyncWebCrawler.arun, a deep crawl returns an
+        async iterator (config.stream) or a list; otherwise a single result.
+        """
+        results = self._stream('/arun', {
+            'url': url,
+            'run_config': config.dump() if config else None,
+        })
+
+        if config is not None and getattr(config, 'deep_crawl_strategy', None):
+            if config.stream:
+                return results
+            return [result async for result in results]
+
+        async for result in results:
+            await results.aclose()
+            return result
+        raise RuntimeError(f"Crawl server returned no result for {url}")
+
+    async def arun_many(self, urls: list[str], config=None, dispatcher=None):
+        """Crawl URLs; an async iterator if config.stream, else a list."""
+        results = self._stream('/arun_many', {
+            'urls': list(urls),
+            'run_config': config.dump() if config else None,
+            'dispatcher': dispatcher_settings(dispatcher),
+        })
+
+        if config is not None and config.stream:
+            return results
+        return [result async for result in results]
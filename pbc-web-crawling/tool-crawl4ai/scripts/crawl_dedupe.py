@@ -0,0 +1,108 @@
+"""
+Near-duplicate page detection for crawl scripts.
+
+Mirrored pages (syndicated articles, print/AMP views, docs served under two
+paths) have different URLs, so URL normalization cannot catch them. Each
+page's markdown gets a 64-bit SimHash over word shingles; pages whose
+fingerprints differ in at most max_distance bits are near-duplicates, and
+only the first one seen is stored.
+
+Fingerprints are split into max_distance + 1 bands. Two fingerprints within
+max_distance bits agree exactly on at least one band, so a lookup compares
+only against pages sharing a band instead of every page seen, which keeps
+lookups fast on 100k-page crawls.
+
+Pages with fewer than MIN_WORDS words are never matched; short stubs (login
+walls, "page moved") look alike without being mirrors.
+
+Usage:
+    from crawl_dedupe import NearDuplicateIndex
+
+    near_duplicates = NearDuplicateIndex()
+    original = near_duplicates.check(markdown, url)
+    if original:
+        ...skip, url mirrors original...
+"""
+
+import hashlib
+import re
+import threading
+
+
+# Fingerprint size in bits
+SIMHASH_BITS = 64
+
+# Words per shingle
+SHINGLE_WORDS = 3
+
+# Pages shorter than this are not fingerprinted
+MIN_WORDS = 50
+
+# Differing bits still counted as the same page: absorbs a few edited
+# sentences, while distinct pages sharing half their text differ in 12+ bits
+DEFAULT_MAX_DISTANCE = 6
+
+_WORD_RE = re.compile(r'\w+')
+
+# Link and image targets differ between mirrors; only their text is compared
+_LINK_TARGET_RE = re.compile(r'\]\([^)]*\)')
+
+
+def simhash(markdown: str) -> int | None:
+    """64-bit SimHash of the page text, or None if it is under MIN_WORDS words."""
+    words = _WORD_RE.findall(_LINK_TARGET_RE.sub(']', markdown).lower())
+    if len(words) < MIN_WORDS:
+        return None
+
+    shingles = {' '.join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for shingle in shingles
+    ]
+
+    # Each bit is set when most shingle hashes have it set
+    half = len(hashes) / 2
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        mask = 1 << bit
+        if sum(1 for h in hashes if h & mask) > half:
+            fingerprint |= mask
+    return fingerprint
+
+
+class NearDuplicateIndex:
+    """SimHash fingerprints of stored pages, banded for fast lookups."""
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = SIMHASH_BITS // bands
+        # (shift, mask) per band; the last band takes the leftover bits
+        self._bands = [
+            (i * width, (1 << (width if i < bands - 1 else SIMHASH_BITS - i * width)) - 1)
+            for i in range(bands)
+        ]
+        self._buckets: dict[tuple[int, int], list[tuple[int, str]]] = {}
+        self._lock = threading.Lock()
+
+    def check(self, markdown: str, ref: str) -> str | None:
+        """
+        Return the ref of an earlier near-duplicate of this page, or None.
+
+        A page that is not a near-duplicate is added to the index under ref
+        (typically its URL).
+        """
+        fingerprint = simhash(markdown)
+        if fingerprint is None:
+            return None
+
+        keys = [(i, (fingerprint >> shift) & mask) for i, (shift, mask) in enumerate(self._bands)]
+        with self._lock:
+            for key in keys:
+                for other, other_ref in self._buckets.get(key, ()):
+                    if (fingerprint ^ other).bit_count() <= self.max_distance:
+                        return other_ref
+
+            for key in keys:
+                self._buckets.setdefault(key, []).append((fingerprint, ref))
+        return None
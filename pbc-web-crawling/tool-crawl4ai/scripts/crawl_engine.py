@@ -0,0 +1,189 @@
+"""
+Crawl engine selection for Crawl4AI scripts.
+
+Engines:
+    browser - Chromium via AsyncWebCrawler (default; required for JS-rendered pages)
+    http    - Pooled async HTTP GET via AsyncHTTPCrawlerStrategy, no browser.
+              Same CrawlerRunConfig markdown generation and filtering
+              (excluded_tags, word_count_threshold, fit_markdown), but browser-only
+              options (wait_for, js_code, scan_full_page, ...) are ignored.
+    auto    - HTTP first; pages that fail or look like an empty SPA shell are
+              re-crawled with the browser
+
+Static documentation pages are typically 10-50x cheaper over plain HTTP than
+through a headless browser.
+
+Pass server=<url> to run either engine on the shared browser pool service
+(crawl_server.py) instead of launching crawlers in this process.
+
+Pass scheduler=<PolitenessScheduler> to crawl_many for per-host queues and
+rate limits (see crawl_scheduler.py) instead of one arun_many dispatcher.
+
+Usage:
+    from crawl_engine import ENGINES, crawl_one, crawl_many
+
+    result = await crawl_one(url, run_config, engine="auto")
+
+    async for result in crawl_many(urls, run_config, engine="auto"):
+        ...
+"""
+
+import re
+import sys
+from collections.abc import AsyncIterator, Callable
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+from crawl_client import RemoteCrawler
+
+
+ENGINES = ('browser', 'http', 'auto')
+
+# Connection pool size for the HTTP engine
+HTTP_MAX_CONNECTIONS = 50
+
+# Fewer words than this in the extracted markdown suggests a client-rendered shell
+SPA_SHELL_MIN_WORDS = 50
+
+# Markers of client-side rendering frameworks in the raw HTML
+SPA_SHELL_MARKERS = re.compile(
+    r'<div[^>]+id=["\'](?:root|app|__next|__nuxt|svelte)["\'][^>]*>\s*</div>'
+    r'|<noscript>[^<]*(?:enable|requires?)\s+javascript'
+    r'|window\.__(?:NEXT_DATA|NUXT|INITIAL_STATE)__',
+    re.IGNORECASE
+)
+
+
+def create_crawler(
+    engine: str,
+    browser_config: BrowserConfig | None = None,
+    server: str | None = None
+) -> AsyncWebCrawler:
+    """
+    Create an AsyncWebCrawler for the given engine ('http' or 'browser').
+
+    With server, returns a RemoteCrawler that runs the same engine and
+    BrowserConfig on the shared browser pool service.
+    """
+    if server:
+        return RemoteCrawler(server, engine=engine, browser_config=browser_config)
+
+    if engine == 'http':
+        strategy = AsyncHTTPCrawlerStrategy(
+            browser_config=HTTPCrawlerConfig(
+                method="GET",
+                verify_ssl=True,
+                follow_redirects=True
+            ),
+            max_connections=HTTP_MAX_CONNECTIONS
+        )
+        return AsyncWebCrawler(crawler_strategy=strategy)
+
+    return AsyncWebCrawler(config=browser_config or BrowserConfig())
+
+
+def looks_like_spa_shell(result) -> bool:
+    """
+    Check whether an HTTP-fetched page needs a browser to render.
+
+    True for failed fetches, and for pages with almost no extracted text
+    whose HTML carries client-side rendering markers (empty #root/#app
+    mount points, "enable JavaScript" notices, hydration state blobs).
+    """
+    if not result.success:
+        return True
+
+    markdown = ''
+    if result.markdown:
+        markdown = result.markdown.fit_markdown or result.markdown.raw_markdown or ''
+
+    if len(markdown.split()) >= SPA_SHELL_MIN_WORDS:
+        return False
+
+    html = result.html or ''
+    return bool(SPA_SHELL_MARKERS.search(html)) or len(markdown.split()) == 0
+
+
+async def _iterate(results) -> AsyncIterator:
+    """Iterate arun_many output in both stream and batch mode."""
+    if isinstance(results, list):
+        for result in results:
+            yield result
+    else:
+        async for result in results:
+            yield result
+
+
+async def crawl_one(
+    url: str,
+    run_config,
+    engine: str = 'browser',
+    browser_config: BrowserConfig | None = None,
+    server: str | None = None
+):
+    """Crawl a single URL with the selected engine. Returns a CrawlResult."""
+    if engine in ('http', 'auto'):
+        async with create_crawler('http', server=server) as crawler:
+            result = await crawler.arun(url=url, config=run_config)
+
+        if engine == 'http' or not looks_like_spa_shell(result):
+            return result
+
+        print(f"Escalating to browser: {url}", file=sys.stderr)
+
+    async with create_crawler('browser', browser_config, server) as crawler:
+        return await crawler.arun(url=url, config=run_config)
+
+
+async def crawl_many(
+    urls: list[str],
+    run_config,
+    engine: str = 'browser',
+    browser_config: BrowserConfig | None = None,
+    make_dispatcher: Callable | None = None,
+    server: str | None = None,
+    scheduler=None
+) -> AsyncIterator:
+    """
+    Crawl URLs with the selected engine, yielding CrawlResults as they complete.
+
+    Args:
+        urls: URLs to crawl
+        run_config: CrawlerRunConfig shared by both engines
+        engine: 'browser', 'http' or 'auto'
+        browser_config: BrowserConfig for the browser engine
+        make_dispatcher: Optional factory returning a fresh dispatcher per arun_many call
+        server: Browser pool service URL; None launches crawlers in-process
+        scheduler: Optional crawl_scheduler.PolitenessScheduler; crawls URL by URL
+            with per-host limits instead of arun_many (make_dispatcher is ignored)
+
+    In auto mode, results that look like SPA shells are held back and
+    re-crawled with the browser once the HTTP pass finishes.
+    """
+    async def run_batch(crawler, batch: list[str]):
+        if scheduler:
+            return scheduler.run(crawler, batch, run_config)
+        kwargs = {'dispatcher': make_dispatcher()} if make_dispatcher else {}
+        return await crawler.arun_many(urls=batch, config=run_config, **kwargs)
+
+    browser_urls = urls
+
+    if engine in ('http', 'auto'):
+        browser_urls = []
+        async with create_crawler('http', server=server) as crawler:
+            results = await run_batch(crawler, urls)
+            async for result in _iterate(results):
+                if engine == 'auto' and looks_like_spa_shell(result):
+                    browser_urls.append(result.url)
+                    continue
+                yield result
+
+        if browser_urls:
+            print(f"Escalating {len(browser_urls)} URLs to browser", file=sys.stderr)
+
+    if browser_urls:
+        async with create_crawler('browser', browser_config, server) as crawler:
+            results = await run_batch(crawler, browser_urls)
+            async for result in _iterate(results):
+                yield result
@@ -0,0 +1,98 @@
+"""
+Append-only job journal for resumable batch crawls.
+
+Each processed URL appends one JSON line to the journal file:
+
+    {"url": "...", "status": "done", "file": "...", "sha256": "...",
+     "elapsed": 1.84, "error": null, "ts": "2025-12-18T10:15:02"}
+
+The file is only ever appended to and flushed after every record, so a run
+killed at any point (OOM, browser crash, Ctrl-C) leaves a complete record of
+every URL finished before the crash. When a URL appears more than once, the
+last record wins.
+
+Usage:
+    from crawl_journal import CrawlJournal
+
+    journal = CrawlJournal(output_path / JOURNAL_FILENAME)
+    done = journal.completed_urls()
+    urls = [u for u in urls if u not in done]
+    ...
+    journal.record(url, 'done', file=str(filepath), markdown=markdown, elapsed=1.2)
+    journal.close()
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+
+# Journal filename, written inside the output directory
+JOURNAL_FILENAME = '_crawl_journal.jsonl'
+
+
+class CrawlJournal:
+    """Append-only JSONL journal of per-URL crawl status."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def load(self) -> dict[str, dict]:
+        """Return the latest record for each URL in the journal."""
+        records = {}
+        if not self.path.exists():
+            return records
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partial last line from an interrupted write
+                    continue
+                records[record['url']] = record
+
+        return records
+
+    def completed_urls(self) -> set[str]:
+        """
+        URLs whose latest record is 'done' (or 'duplicate': a near-duplicate
+        of a stored page) and whose output file still exists.
+        """
+        return {
+            url for url, record in self.load().items()
+            if record.get('status') in ('done', 'duplicate')
+            and record.get('file') and Path(record['file']).exists()
+        }
+
+    def record(
+        self,
+        url: str,
+        status: str,
+        file: str | None = None,
+        markdown: str | None = None,
+        elapsed: float | None = None,
+        error: str | None = None
+    ) -> None:
+        """Append a status record for a URL and flush it to disk."""
+        entry = {
+            'url': url,
+            'status': status,
+            'file': file,
+            'sha256': hashlib.sha256(markdown.encode('utf-8')).hexdigest() if markdown is not None else None,
+            'elapsed': round(elapsed, 3) if elapsed is not None else None,
+            'error': error,
+            'ts': datetime.now().isoformat(timespec='seconds')
+        }
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
@@ -0,0 +1,164 @@
+"""
+Incremental crawl manifest for documentation re-crawls.
+
+Records, per URL, the output file, a SHA-256 of the page markdown and the
+HTTP validators (ETag, Last-Modified) from the last crawl, in a SQLite file
+inside the output directory. On the next crawl, pages whose markdown hash is
+unchanged are not rewritten, changed pages are rewritten in place (same file,
+no '-N' duplicates), and URLs no longer seen are reported as removed.
+
+SQLite keeps memory flat on large sites: nothing is loaded up front.
+
+Usage:
+    from crawl_manifest import CrawlManifest, content_hash
+
+    manifest = CrawlManifest(output_path / MANIFEST_DB_FILENAME)
+    manifest.begin_run()
+    status, previous = manifest.classify(url, content_hash(markdown))
+    ...
+    manifest.update(url, file, sha256, headers)
+    removed = manifest.finish_run()
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+
+# Manifest database filename, written inside the output directory
+MANIFEST_DB_FILENAME = '_incremental.sqlite3'
+
+
+def content_hash(markdown: str) -> str:
+    """SHA-256 of page markdown (metadata header excluded)."""
+    return hashlib.sha256(markdown.encode('utf-8')).hexdigest()
+
+
+def get_header(headers: dict | None, name: str) -> str | None:
+    """Case-insensitive response header lookup."""
+    if not headers:
+        return None
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CrawlManifest:
+    """Per-URL validators and content hashes from previous crawls."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.run_started = None
+        self.counts = {'added': 0, 'changed': 0, 'unchanged': 0, 'removed': 0}
+
+        self._db = sqlite3.connect(str(self.path))
+        # One small commit per page: WAL keeps that from fsyncing the whole file
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                file TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                lastmod TEXT,
+                fetched_at REAL NOT NULL,
+                seen_at REAL NOT NULL
+            )
+        """)
+        self._db.commit()
+
+    def begin_run(self) -> None:
+        """Start a crawl; URLs not touched before finish_run() count as removed."""
+        self.run_started = time.time()
+
+    def get(self, url: str) -> dict | None:
+        """Return the stored record for a URL, or None."""
+        row = self._db.execute(
+            "SELECT file, sha256, etag, last_modified, lastmod FROM pages WHERE url = ?",
+            (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'file': row[0],
+            'sha256': row[1],
+            'etag': row[2],
+            'last_modified': row[3],
+            'lastmod': row[4]
+        }
+
+    def classify(self, url: str, sha256: str) -> tuple[str, dict | None]:
+        """
+        Compare a freshly crawled page with the manifest.
+
+        Returns:
+            ('added' | 'changed' | 'unchanged', previous record or None)
+        """
+        previous = self.get(url)
+        if previous is None:
+            status = 'added'
+        elif previous['sha256'] != sha256 or not Path(previous['file']).exists():
+            status = 'changed'
+        else:
+            status = 'unchanged'
+
+        self.counts[status] += 1
+        return status, previous
+
+    def touch(self, url: str) -> None:
+        """Mark a URL as seen in this run without changing its record."""
+        self._db.execute("UPDATE pages SET seen_at = ? WHERE url = ?", (time.time(), url))
+        self._db.commit()
+
+    def update(
+        self,
+        url: str,
+        file: str,
+        sha256: str,
+        headers: dict | None = None,
+        lastmod: str | None = None
+    ) -> None:
+        """Store the latest file, hash and HTTP validators for a URL."""
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                url, file, sha256,
+                get_header(headers, 'etag'),
+                get_header(headers, 'last-modified'),
+                lastmod, now, now
+            )
+        )
+        self._db.commit()
+
+    def finish_run(self, delete: bool = False) -> list[dict]:
+        """
+        Report URLs in the manifest that were not seen during this run.
+
+        Args:
+            delete: Also drop them from the manifest (default: keep, so a
+                    partial crawl, e.g. one cut short by max_pages, loses nothing)
+
+        Returns:
+            List of {'url', 'file'} for removed URLs
+        """
+        rows = self._db.execute(
+            "SELECT url, file FROM pages WHERE seen_at < ?", (self.run_started,)
+        ).fetchall()
+        removed = [{'url': url, 'file': file} for url, file in rows]
+        self.counts['removed'] = len(removed)
+
+        if delete and removed:
+            self._db.execute("DELETE FROM pages WHERE seen_at < ?", (self.run_started,))
+            self._db.commit()
+
+        return removed
+
+    def close(self) -> None:
+        """Close the manifest database."""
+        self._db.close()
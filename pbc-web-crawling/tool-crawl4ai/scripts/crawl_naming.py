@@ -0,0 +1,140 @@
+"""
+URL-keyed output naming for crawl scripts.
+
+Maps each URL to one stable markdown path, '<slug>-<hash>.md', where hash is
+a short SHA-256 of the URL's canonical form. The same URL always gets the
+same file, so re-crawls and incremental refreshes overwrite it in place, and
+different URLs never race for a name: collisions are resolved in memory, by
+lengthening the hash, before anything is written.
+
+Assigned names are kept in a dict (O(1) lookups in both directions) and
+appended to <output_dir>/_names.jsonl, flushed per name. The index pins a
+URL's first name, so a page keeps its file even if its title changes.
+
+Layouts:
+    flat - every page directly in output_dir
+    tree - URL path directories are kept (docs/cli/get-started-1a2b3c4d.md)
+
+Usage:
+    from crawl_naming import OutputNamer
+
+    namer = OutputNamer(output_path, layout='tree')
+    filepath = namer.path_for(url, title)
+    namer.close()
+"""
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+from urllib.parse import urldefrag, urlsplit, urlunsplit
+
+
+LAYOUTS = ('flat', 'tree')
+
+# Name index filename, written inside the output directory
+NAME_INDEX_FILENAME = '_names.jsonl'
+
+# Hex digits of the URL hash in a name; lengthened only on a collision
+HASH_LENGTH = 8
+
+# Longest slug kept in a name
+MAX_SLUG_LENGTH = 60
+
+
+def slugify(text: str) -> str:
+    """Convert text to a safe filename slug."""
+    text = text.lower().strip()
+    text = re.sub(r'[^\w\s-]', '', text)
+    text = re.sub(r'[\s_-]+', '-', text)
+    text = text.strip('-')
+    return text[:MAX_SLUG_LENGTH].strip('-') or 'untitled'
+
+
+def canonical_url(url: str) -> str:
+    """URL key for naming: no fragment, lowercase scheme and host."""
+    parts = urlsplit(urldefrag(url)[0])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''))
+
+
+def url_hash(key: str) -> str:
+    """Full SHA-256 hex digest of a canonical URL."""
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+class OutputNamer:
+    """Assigns each canonical URL one path under output_dir, remembered on disk."""
+
+    def __init__(self, output_dir: Path, layout: str = 'flat'):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout} (choose from {', '.join(LAYOUTS)})")
+
+        self.output_dir = Path(output_dir)
+        self.layout = layout
+        self._by_url: dict[str, str] = {}
+        self._owners: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        index_path = self.output_dir / NAME_INDEX_FILENAME
+        if index_path.exists():
+            with open(index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Partial last line from an interrupted write
+                        continue
+                    self._by_url[record['url']] = record['file']
+                    self._owners[record['file']] = record['url']
+        self._index = open(index_path, 'a', encoding='utf-8')
+
+    def _stem(self, key: str, title: str | None) -> tuple[str, str]:
+        """(relative directory, slug) for a URL; the slug prefers the title."""
+        path = urlsplit(key).path
+        segments = [slugify(seg) for seg in path.split('/') if seg]
+
+        directory = ''
+        if self.layout == 'tree' and len(segments) > 1:
+            directory = '/'.join(segments[:-1])
+
+        if title:
+            slug = slugify(title)
+        elif segments:
+            slug = segments[-1]
+        else:
+            slug = 'index' if self.layout == 'tree' else slugify(urlsplit(key).hostname or '')
+        return directory, slug
+
+    def path_for(self, url: str, title: str | None = None) -> Path:
+        """
+        The output path for a URL: its existing name, or a new unique one.
+
+        title is only used for the slug of a URL seen for the first time.
+        """
+        key = canonical_url(url)
+        with self._lock:
+            name = self._by_url.get(key)
+            if name is None:
+                directory, slug = self._stem(key, title)
+                digest = url_hash(key)
+                length = HASH_LENGTH
+                while True:
+                    name = f"{slug}-{digest[:length]}.md"
+                    if directory:
+                        name = f"{directory}/{name}"
+                    if name not in self._owners or length >= len(digest):
+                        break
+                    length += 4
+
+                self._by_url[key] = name
+                self._owners[name] = key
+                self._index.write(json.dumps({'url': key, 'file': name}, ensure_ascii=False) + '\n')
+                self._index.flush()
+
+        return self.output_dir / name
+
+    def close(self) -> None:
+        """Close the name index."""
+        self._index.close()
@@ -0,0 +1,294 @@
+"""
+Per-host politeness scheduler for batch crawls.
+
+Replaces one global RateLimiter/MemoryAdaptiveDispatcher pair, which either
+throttles a mixed URL list as a whole or lets one host take every session.
+Each host gets its own queue, concurrency cap and request spacing; the
+scheduler starts requests round-robin across hosts, so total throughput
+grows with the number of distinct hosts while no single host sees more
+than its share.
+
+Per host:
+    - at most per_host requests in flight (1 when robots.txt sets a delay)
+    - request starts spaced by a random base_delay, or by the robots.txt
+      Crawl-delay / Request-rate when that is longer (capped at max_delay)
+    - 429/503 responses back the host off, for Retry-After when the server
+      sends it, else exponentially; the URL is retried up to max_retries
+      times. Successful responses halve the backoff again.
+
+URLs are crawled one arun() call each, so the scheduler works the same on
+an in-process crawler and on the shared browser pool service.
+
+Usage:
+    from crawl_scheduler import PolitenessScheduler
+
+    scheduler = PolitenessScheduler(max_concurrent=10, per_host=2)
+    async for result in scheduler.run(crawler, urls, run_config):
+        ...
+    print(scheduler.host_stats())
+"""
+
+import asyncio
+import random
+import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
+from crawl4ai.models import DispatchResult
+
+from crawl_manifest import get_header
+
+
+# Status codes that mean "slow down"
+BACKOFF_STATUS_CODES = (429, 503)
+
+# First backoff when the server sends no Retry-After, in seconds
+INITIAL_BACKOFF = 2.0
+
+# robots.txt fetches: per-request timeout and how many run at once
+ROBOTS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+ROBOTS_CONCURRENCY = 8
+
+# Backoff events kept per host for the summary
+MAX_EVENTS_PER_HOST = 5
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostState:
+    """Queue, limits and counters for one host."""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.queue: deque[tuple[str, int]] = deque()
+        self.active = 0
+        self.next_start = 0.0
+        self.crawl_delay: float | None = None
+        self.backoff = 0.0
+        self.fetched = 0
+        self.failed = 0
+        self.retries = 0
+        self.backoff_events: list[dict] = []
+        self.backoff_count = 0
+        self.first_start: float | None = None
+        self.last_end: float | None = None
+
+
+class PolitenessScheduler:
+    """Round-robin, per-host rate-limited crawling through crawler.arun()."""
+
+    def __init__(
+        self,
+        max_concurrent: int = 5,
+        per_host: int = 2,
+        base_delay: tuple[float, float] = (0.5, 1.5),
+        max_delay: float = 60.0,
+        max_retries: int = 2,
+        respect_crawl_delay: bool = True,
+        user_agent: str = '*'
+    ):
+        self.max_concurrent = max_concurrent
+        self.per_host = per_host
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.respect_crawl_delay = respect_crawl_delay
+        self.user_agent = user_agent
+        # Kept across run() calls, so an escalation pass reuses robots.txt and backoff
+        self._hosts: dict[str, HostState] = {}
+
+    async def _fetch_crawl_delay(self, session, base_url: str) -> float | None:
+        """Crawl-delay (or Request-rate interval) for user_agent from robots.txt."""
+        try:
+            async with session.get(f"{base_url}/robots.txt") as response:
+                if response.status != 200:
+                    return None
+                text = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+            return None
+
+        parser = RobotFileParser()
+        parser.parse(text.splitlines())
+        delay = parser.crawl_delay(self.user_agent)
+        rate = parser.request_rate(self.user_agent)
+        if rate and rate.requests:
+            delay = max(float(delay or 0), rate.seconds / rate.requests)
+        return min(float(delay), self.max_delay) if delay else None
+
+    async def _load_robots(self, new_hosts: dict[str, str]) -> None:
+        """Fetch robots.txt for hosts seen for the first time ({host: base URL})."""
+        semaphore = asyncio.Semaphore(ROBOTS_CONCURRENCY)
+
+        async def load(session, host: str, base_url: str) -> None:
+            async with semaphore:
+                delay = await self._fetch_crawl_delay(session, base_url)
+            if delay:
+                self._hosts[host].crawl_delay = delay
+                print(f"robots.txt: {host} Crawl-delay {delay:g}s", file=sys.stderr)
+
+        async with aiohttp.ClientSession(timeout=ROBOTS_TIMEOUT) as session:
+            await asyncio.gather(*(load(session, host, base) for host, base in new_hosts.items()))
+
+    def _spacing(self, state: HostState) -> float:
+        """Seconds between request starts on a host."""
+        return max(random.uniform(*self.base_delay), state.crawl_delay or 0.0, state.backoff)
+
+    def _cap(self, state: HostState) -> int:
+        return 1 if state.crawl_delay or state.backoff else self.per_host
+
+    def _back_off(self, state: HostState, url: str, result) -> float:
+        """Slow a host down after a 429/503; returns the wait in seconds."""
+        retry_after = parse_retry_after(get_header(result.response_headers, 'Retry-After'))
+        if retry_after is not None:
+            wait = retry_after
+        else:
+            wait = max(INITIAL_BACKOFF, state.backoff * 2)
+        wait = min(wait, self.max_delay)
+
+        state.backoff = wait
+        state.next_start = max(state.next_start, time.monotonic() + wait)
+        state.backoff_count += 1
+        if len(state.backoff_events) < MAX_EVENTS_PER_HOST:
+            state.backoff_events.append({
+                'url': url,
+                'status': result.status_code,
+                'wait': round(wait, 1),
+                'retry_after': retry_after is not None
+            })
+        print(f"Backing off {state.host} for {wait:.1f}s (HTTP {result.status_code})", file=sys.stderr)
+        return wait
+
+    async def _crawl(self, crawler, url: str, config):
+        """One arun() call; exceptions become failed results."""
+        start = time.time()
+        try:
+            result = await crawler.arun(url=url, config=config)
+        except Exception as e:  # One bad URL must not stop the batch
+            result = SimpleNamespace(
+                url=url, success=False, status_code=None, error_message=str(e),
+                metadata={}, markdown=None, html=None, response_headers={}
+            )
+        result.dispatch_result = DispatchResult(
+            task_id=url, memory_usage=0.0, peak_memory=0.0,
+            start_time=start, end_time=time.time()
+        )
+        return result
+
+    async def run(self, crawler, urls: list[str], config) -> AsyncIterator:
+        """Crawl urls, yielding each URL's final result as it completes."""
+        ring: deque[HostState] = deque()
+        new_hosts = {}
+        for url in urls:
+            parts = urlsplit(url)
+            host = parts.netloc.lower()
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = HostState(host)
+                new_hosts[host] = f"{parts.scheme}://{parts.netloc}"
+            if not state.queue:
+                ring.append(state)
+            state.queue.append((url, 0))
+
+        if self.respect_crawl_delay and new_hosts:
+            await self._load_robots(new_hosts)
+
+        in_flight: dict[asyncio.Task, tuple[HostState, str, int]] = {}
+        try:
+            while in_flight or any(state.queue for state in ring):
+                # One start per ready host per pass, in rotation
+                now = time.monotonic()
+                for _ in range(len(ring)):
+                    if len(in_flight) >= self.max_concurrent:
+                        break
+                    state = ring[0]
+                    ring.rotate(-1)
+                    if not state.queue or state.active >= self._cap(state) or state.next_start > now:
+                        continue
+
+                    url, attempt = state.queue.popleft()
+                    state.active += 1
+                    state.next_start = now + self._spacing(state)
+                    if state.first_start is None:
+                        state.first_start = now
+                    task = asyncio.create_task(self._crawl(crawler, url, config))
+                    in_flight[task] = (state, url, attempt)
+
+                # Sleep until a request finishes or the next host becomes ready
+                waiting = [
+                    state.next_start for state in ring
+                    if state.queue and state.active < self._cap(state)
+                ]
+                timeout = max(0.0, min(waiting) - time.monotonic()) if waiting else None
+                if len(in_flight) >= self.max_concurrent:
+                    timeout = None
+                if not in_flight:
+                    await asyncio.sleep(timeout or 0)
+                    continue
+
+                done, _ = await asyncio.wait(in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    state, url, attempt = in_flight.pop(task)
+                    state.active -= 1
+                    state.last_end = time.monotonic()
+                    result = task.result()
+
+                    if result.status_code in BACKOFF_STATUS_CODES:
+                        self._back_off(state, url, result)
+                        if attempt < self.max_retries:
+                            state.retries += 1
+                            state.queue.appendleft((url, attempt + 1))
+                            continue
+                        # A rate-limit page is not the page's content
+                        result.success = False
+                        result.error_message = f"HTTP {result.status_code} after {attempt} retries"
+                    elif result.success and state.backoff:
+                        state.backoff = state.backoff / 2 if state.backoff > self.base_delay[1] else 0.0
+
+                    if result.success:
+                        state.fetched += 1
+                    else:
+                        state.failed += 1
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def host_stats(self) -> list[dict]:
+        """Per-host pages, rate and backoff events, busiest host first."""
+        stats = []
+        for state in self._hosts.values():
+            pages = state.fetched + state.failed
+            elapsed = (state.last_end - state.first_start) if state.first_start and state.last_end else 0.0
+            stats.append({
+                'host': state.host,
+                'pages': pages,
+                'failed': state.failed,
+                'pages_per_minute': round(pages / elapsed * 60, 1) if elapsed > 0 else None,
+                'crawl_delay': state.crawl_delay,
+                'retries': state.retries,
+                'backoffs': state.backoff_count,
+                'backoff_events': state.backoff_events,
+            })
+        stats.sort(key=lambda s: s['pages'], reverse=True)
+        return stats
@@ -0,0 +1,394 @@
+"""
+Shared browser pool service for Crawl4AI scripts.
+
+A long-lived local daemon that keeps started crawlers warm across script
+runs, so repeated url_to_markdown / batch / deep crawl invocations skip
+Chromium launch and context setup. Crawlers are pooled per BrowserConfig:
+the same headless/viewport/user-agent/profile settings reuse one browser,
+and a persistent profile (e.g. the Medium session in ~/.crawl4ai/profiles)
+is only ever opened by one browser at a time: a job asking for the same
+profile with other settings closes the idle browser holding it, or is
+refused while that browser is busy. The HTTP engine gets a single pooled
+crawler of its own.
+
+Idle crawlers are closed after --idle-minutes; when --max-browsers is
+reached, the least recently used idle browser is closed to make room.
+
+Scripts opt in with --server (see crawl_client.py). Listens on localhost
+only; requests must be JSON and addressed to localhost, which keeps web
+pages open in a local browser from driving the pool.
+
+Endpoints:
+    GET  /health     Pool status
+    POST /arun       {engine, browser_config, run_config, url}  -> NDJSON results
+    POST /arun_many  {engine, browser_config, run_config, urls, dispatcher} -> NDJSON results
+    POST /shutdown   Close all browsers and exit
+
+Usage:
+    python crawl_server.py [--port 11240] [--max-browsers 4] [--idle-minutes 10]
+
+Examples:
+    python crawl_server.py &
+    python url_to_markdown.py https://example.com --server
+    python batch_urls_to_markdown.py urls.txt -o ./output --server
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from urllib.parse import urlparse
+
+from aiohttp import web
+from crawl4ai import BrowserConfig, CrawlerRunConfig
+from crawl4ai import MemoryAdaptiveDispatcher, RateLimiter
+
+from crawl_client import DEFAULT_SERVER_URL
+from crawl_engine import create_crawler
+
+
+# Host names accepted in the Host header (DNS rebinding guard)
+LOCAL_HOSTS = {'127.0.0.1', 'localhost', '::1'}
+
+# Seconds between idle-crawler sweeps
+REAP_INTERVAL = 30
+
+
+def pool_key(engine: str, browser_config: BrowserConfig) -> str:
+    """Pool key: one crawler per distinct BrowserConfig (the HTTP engine has one)."""
+    if engine == 'http':
+        return 'http'
+    return json.dumps(browser_config.dump(), sort_keys=True, default=str)
+
+
+def profile_dir(browser_config: BrowserConfig) -> str | None:
+    """The persistent profile directory a browser config opens, if any."""
+    user_data_dir = getattr(browser_config, 'user_data_dir', None)
+    if not user_data_dir:
+        return None
+    return os.path.realpath(os.path.expanduser(str(user_data_dir)))
+
+
+def _timestamp(value) -> float | None:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+def result_to_dict(result) -> dict:
+    """The CrawlResult fields the crawl scripts read, as JSON-safe values."""
+    markdown = result.markdown
+    dispatch = getattr(result, 'dispatch_result', None)
+    return {
+        'url': result.url,
+        'success': result.success,
+        'status_code': result.status_code,
+        'error_message': result.error_message,
+        'metadata': result.metadata,
+        'markdown': {
+            'raw_markdown': markdown.raw_markdown,
+            'fit_markdown': markdown.fit_markdown,
+        } if markdown else None,
+        'html': result.html,
+        'response_headers': result.response_headers,
+        'redirected_url': result.redirected_url,
+        'session_id': result.session_id,
+        'dispatch_result': {
+            'start_time': _timestamp(dispatch.start_time),
+            'end_time': _timestamp(dispatch.end_time),
+        } if dispatch else None,
+    }
+
+
+def make_dispatcher(settings: dict | None):
+    """Rebuild a client's dispatcher from crawl_client.dispatcher_settings()."""
+    if not settings:
+        return None
+
+    kwargs = {k: v for k, v in settings.items() if k != 'rate_limiter'}
+    if settings.get('rate_limiter'):
+        limiter = dict(settings['rate_limiter'])
+        if isinstance(limiter.get('base_delay'), list):
+            limiter['base_delay'] = tuple(limiter['base_delay'])
+        kwargs['rate_limiter'] = RateLimiter(**limiter)
+    return MemoryAdaptiveDispatcher(**kwargs)
+
+
+class PoolEntry:
+    """A started crawler plus its lease count and last use."""
+
+    def __init__(self, crawler, profile: str | None = None):
+        self.crawler = crawler
+        self.profile = profile
+        self.active = 0
+        self.last_used = time.monotonic()
+
+
+class CrawlerPool:
+    """Started crawlers keyed by pool_key(), least recently used first."""
+
+    def __init__(self, max_browsers: int = 4, idle_seconds: float = 600):
+        self.max_browsers = max_browsers
+        self.idle_seconds = idle_seconds
+        self._entries: OrderedDict[str, PoolEntry] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def lease(self, engine: str, browser_config: BrowserConfig):
+        """Borrow a started crawler for this config, starting one if needed."""
+        key = pool_key(engine, browser_config)
+
+        # Starting under the lock keeps two jobs from launching the same profile
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                profile = profile_dir(browser_config) if key != 'http' else None
+                if profile:
+                    await self._release_profile(profile)
+                if key != 'http':
+                    await self._make_room()
+                crawler = create_crawler(engine, browser_config)
+                await crawler.start()
+                entry = PoolEntry(crawler, profile)
+                self._entries[key] = entry
+                print(f"Started {engine} crawler ({len(self._entries)} pooled)", file=sys.stderr)
+            self._entries.move_to_end(key)
+            entry.active += 1
+
+        try:
+            yield entry.crawler
+        finally:
+            entry.active -= 1
+            entry.last_used = time.monotonic()
+
+    async def _release_profile(self, profile: str) -> None:
+        """
+        Close the idle browser that has profile open under other settings.
+
+        Chromium locks a profile directory, and two browsers writing to one
+        profile corrupt it, so a busy holder refuses the new job instead.
+        """
+        for key, entry in list(self._entries.items()):
+            if entry.profile != profile:
+                continue
+            if entry.active:
+                raise RuntimeError(
+                    f"Browser profile {profile} is in use by a job with different browser "
+                    f"settings; retry when it finishes"
+                )
+            print(f"Closing idle browser to reopen profile {profile} with new settings", file=sys.stderr)
+            await self._close(key)
+
+    async def _make_room(self) -> None:
+        """Close least recently used idle browsers while at capacity."""
+        browsers = [k for k in self._entries if k != 'http']
+        for key in list(browsers):
+            if len(browsers) < self.max_browsers:
+                return
+            if self._entries[key].active == 0:
+                await self._close(key)
+                browsers.remove(key)
+
+        if len(browsers) >= self.max_browsers:
+            print(f"WARNING: All {len(browsers)} browsers busy; starting one over --max-browsers", file=sys.stderr)
+
+    async def _close(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        try:
+            await entry.crawler.close()
+        except Exception as e:  # A browser that already died must not block the pool
+            print(f"WARNING: Error closing crawler: {e}", file=sys.stderr)
+
+    async def reap_idle(self) -> int:
+        """Close crawlers idle for longer than idle_seconds. Returns the count closed."""
+        now = time.monotonic()
+        async with self._lock:
+            idle = [
+                key for key, entry in self._entries.items()
+                if entry.active == 0 and now - entry.last_used > self.idle_seconds
+            ]
+            for key in idle:
+                await self._close(key)
+        return len(idle)
+
+    async def close_all(self) -> None:
+        async with self._lock:
+            for key in list(self._entries):
+                await self._close(key)
+
+    def status(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                'engine': 'http' if key == 'http' else 'browser',
+                'active': entry.active,
+                'idle_seconds': round(now - entry.last_used, 1),
+            }
+            for key, entry in self._entries.items()
+        ]
+
+
+async def _iterate(results):
+    """Iterate arun/arun_many output: result containers, lists, generators or one result."""
+    if hasattr(results, '__aiter__'):
+        async for result in results:
+            yield result
+    elif isinstance(results, list):
+        for result in results:
+            yield result
+    else:
+        yield results
+
+
+@web.middleware
+async def local_only(request, handler):
+    """Reject cross-site and rebound-DNS requests from web pages."""
+    if urlparse(f'//{request.host}').hostname not in LOCAL_HOSTS:
+        raise web.HTTPForbidden(text='Host not allowed')
+    if request.method == 'POST' and request.content_type != 'application/json':
+        raise web.HTTPUnsupportedMediaType(text='Expected application/json')
+    return await handler(request)
+
+
+async def _run_job(request: web.Request, crawl) -> web.StreamResponse:
+    """Parse a job, lease a crawler and stream results back as NDJSON."""
+    job = await request.json()
+    engine = job.get('engine', 'browser')
+    if engine not in ('browser', 'http'):
+        raise web.HTTPBadRequest(text=f"Unsupported engine: {engine}")
+
+    browser_config = BrowserConfig.load(job.get('browser_config') or {})
+    run_config = CrawlerRunConfig.load(job['run_config']) if job.get('run_config') else CrawlerRunConfig()
+
+    response = web.StreamResponse(headers={'Content-Type': 'application/x-ndjson'})
+    await response.prepare(request)
+
+    pool: CrawlerPool = request.app['pool']
+    try:
+        async with pool.lease(engine, browser_config) as crawler:
+            async for result in _iterate(await crawl(crawler, job, run_config)):
+                line = json.dumps({'result': result_to_dict(result)}, default=str)
+                await response.write(line.encode('utf-8') + b'\n')
+    except (ConnectionResetError, asyncio.CancelledError):
+        # Client went away; the lease is released by the context manager
+        raise
+    except Exception as e:  # Report to the client instead of dropping the stream
+        await response.write(json.dumps({'error': str(e)}).encode('utf-8') + b'\n')
+
+    await response.write_eof()
+    return response
+
+
+async def handle_arun(request: web.Request) -> web.StreamResponse:
+    async def crawl(crawler, job, run_config):
+        return await crawler.arun(job['url'], config=run_config)
+    return await _run_job(request, crawl)
+
+
+async def handle_arun_many(request: web.Request) -> web.StreamResponse:
+    async def crawl(crawler, job, run_config):
+        dispatcher = make_dispatcher(job.get('dispatcher'))
+        kwargs = {'dispatcher': dispatcher} if dispatcher else {}
+        return await crawler.arun_many(job['urls'], config=run_config, **kwargs)
+    return await _run_job(request, crawl)
+
+
+async def handle_health(request: web.Request) -> web.Response:
+    app = request.app
+    return web.json_response({
+        'status': 'ok',
+        'uptime_seconds': round(time.monotonic() - app['started_at'], 1),
+        'crawlers': app['pool'].status(),
+    })
+
+
+async def handle_shutdown(request: web.Request) -> web.Response:
+    request.app['stop'].set()
+    return web.json_response({'status': 'stopping'})
+
+
+async def _reaper(pool: CrawlerPool) -> None:
+    while True:
+        await asyncio.sleep(REAP_INTERVAL)
+        closed = await pool.reap_idle()
+        if closed:
+            print(f"Closed {closed} idle crawler(s)", file=sys.stderr)
+
+
+async def serve(host: str, port: int, max_browsers: int, idle_minutes: float) -> None:
+    """Run the pool service until /shutdown or Ctrl+C."""
+    pool = CrawlerPool(max_browsers=max_browsers, idle_seconds=idle_minutes * 60)
+
+    app = web.Application(middlewares=[local_only])
+    app['pool'] = pool
+    app['stop'] = asyncio.Event()
+    app['started_at'] = time.monotonic()
+    app.router.add_get('/health', handle_health)
+    app.router.add_post('/arun', handle_arun)
+    app.router.add_post('/arun_many', handle_arun_many)
+    app.router.add_post('/shutdown', handle_shutdown)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    print(f"Crawl server listening on http://{host}:{port}", file=sys.stderr)
+
+    reaper = asyncio.create_task(_reaper(pool))
+    try:
+        await app['stop'].wait()
+    finally:
+        reaper.cancel()
+        await pool.close_all()
+        await runner.cleanup()
+        print("Crawl server stopped", file=sys.stderr)
+
+
+def main():
+    default = urlparse(DEFAULT_SERVER_URL)
+
+    parser = argparse.ArgumentParser(
+        description='Shared browser pool service for Crawl4AI scripts'
+    )
+    parser.add_argument(
+        '--host',
+        default=default.hostname,
+        choices=['127.0.0.1', 'localhost'],
+        help=f'Interface to bind, localhost only (default: {default.hostname})'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=default.port,
+        help=f'Port to listen on (default: {default.port})'
+    )
+    parser.add_argument(
+        '--max-browsers',
+        type=int,
+        default=4,
+        help='Browsers kept warm; least recently used idle ones are closed beyond this (default: 4)'
+    )
+    parser.add_argument(
+        '--idle-minutes',
+        type=float,
+        default=10.0,
+        help='Close crawlers unused for this long (default: 10)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_browsers, args.idle_minutes))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Output sinks for crawled pages.
+
+Every crawl script hands its pages to a sink instead of writing files itself:
+
+    markdown - one .md file per page with a metadata header, named by
+               crawl_naming (one stable file per URL, overwritten on re-crawl)
+    jsonl    - one append-only JSONL corpus, one record per page, flushed per
+               record. A re-crawled URL is appended again; readers keep the
+               last record per URL.
+    sqlite   - one SQLite database, table `pages`, keyed by URL (a re-crawl
+               replaces the row)
+
+Corpus records carry url, title, status, depth, score, markdown, hash
+(SHA-256 of the markdown) and fetched_at (UTC, ISO 8601). For 100k-page
+crawls the corpus sinks avoid one tiny file per page, and downstream
+indexing is a single sequential read.
+
+Sinks are thread-safe, so they can be written from writer threads. A
+failed write raises OSError whatever the backend, so callers handle file
+and database sinks alike.
+
+Usage:
+    from crawl_sink import SINKS, make_page, open_sink
+
+    sink = open_sink('jsonl', output_path)
+    location = sink.write(make_page(url, title, 200, markdown))
+    sink.close()
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from crawl_manifest import content_hash
+from crawl_naming import OutputNamer
+
+
+SINKS = ('markdown', 'jsonl', 'sqlite')
+
+# Corpus filenames, written inside the output directory
+CORPUS_JSONL_FILENAME = '_corpus.jsonl'
+CORPUS_DB_FILENAME = '_corpus.sqlite3'
+
+
+def make_page(
+    url: str,
+    title: str,
+    status_code: int | None,
+    markdown: str,
+    depth: int | None = None,
+    score: float | None = None,
+    validation: dict | None = None
+) -> dict:
+    """Build a page record for a sink; adds the markdown hash and fetch time."""
+    page = {
+        'url': url,
+        'title': title,
+        'status': status_code,
+        'depth': depth,
+        'score': score,
+        'markdown': markdown,
+        'hash': content_hash(markdown),
+        'fetched_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+    if validation is not None:
+        page['validation'] = validation
+    return page
+
+
+def render_markdown(page: dict) -> str:
+    """Page markdown with the metadata header used by all crawl scripts."""
+    lines = [f"- **Source:** {page['url']}"]
+    if page.get('depth') is not None:
+        lines.append(f"- **Depth:** {page['depth']}")
+    if page.get('score'):
+        lines.append(f"- **Relevance Score:** {page['score']:.2f}")
+    lines.append(f"- **Status:** {page['status']}")
+    if page.get('validation'):
+        lines.append(f"- **Validation:** {'PASS' if page['validation']['valid'] else 'FAIL'}")
+
+    return f"# {page['title']}\n\n" + '\n'.join(lines) + "\n\n---\n\n" + page['markdown']
+
+
+def write_in_place(filepath: Path, content: str) -> Path:
+    """Atomically replace filepath with content (temp file + rename)."""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp = filepath.with_name(f".{filepath.name}.tmp")
+    tmp.write_text(content, encoding='utf-8')
+    tmp.replace(filepath)
+    return filepath
+
+
+class MarkdownSink:
+    """One markdown file per URL under output_dir."""
+
+    per_page_files = True
+
+    def __init__(self, output_dir: Path, layout: str = 'flat', slug_from_title: bool = True):
+        self.location = str(output_dir)
+        self.slug_from_title = slug_from_title
+        self._namer = OutputNamer(output_dir, layout)
+
+    def location_for(self, page: dict) -> str:
+        """The file this page is (or will be) written to."""
+        title = page.get('title') if self.slug_from_title else None
+        # 'Untitled' is the scripts' placeholder; name those pages by URL
+        if title == 'Untitled':
+            title = None
+        return str(self._namer.path_for(page['url'], title))
+
+    def write(self, page: dict) -> str:
+        """Write (or overwrite) the page's file; returns its path."""
+        filepath = Path(self.location_for(page))
+        write_in_place(filepath, render_markdown(page))
+        return str(filepath)
+
+    def close(self) -> None:
+        self._namer.close()
+
+
+class JsonlSink:
+    """Append-only JSONL corpus (path None writes to stdout)."""
+
+    per_page_files = False
+
+    def __init__(self, path: Path | None):
+        self.location = str(path) if path else '-'
+        self._lock = threading.Lock()
+        if path is None:
+            self._file = sys.stdout
+        else:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def location_for(self, page: dict) -> str:
+        return self.location
+
+    def write(self, page: dict) -> str:
+        """Append the page record; returns the corpus path."""
+        line = json.dumps(page, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+        return self.location
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class SqliteSink:
+    """SQLite corpus with one row per URL."""
+
+    per_page_files = False
+
+    def __init__(self, path: Path):
+        self.location = str(path)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        # One small commit per page: WAL keeps that from fsyncing the whole file
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                status INTEGER,
+                depth INTEGER,
+                score REAL,
+                markdown TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+        """)
+        self._db.commit()
+
+    def location_for(self, page: dict) -> str:
+        return self.location
+
+    def write(self, page: dict) -> str:
+        """Insert or replace the page row; returns the database path."""
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        page['url'], page['title'], page['status'], page['depth'],
+                        page['score'], page['markdown'], page['hash'], page['fetched_at']
+                    )
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                # Leave the connection usable for the next page
+                self._db.rollback()
+                raise OSError(f"SQLite write failed for {page['url']}: {e}") from e
+        return self.location
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def open_sink(kind: str, output_dir: Path, layout: str = 'flat', slug_from_title: bool = True):
+    """
+    Open a sink writing inside output_dir ('markdown', 'jsonl' or 'sqlite').
+
+    layout and slug_from_title only apply to markdown files (see crawl_naming).
+    """
+    output_dir = Path(output_dir)
+    if kind == 'jsonl':
+        return JsonlSink(output_dir / CORPUS_JSONL_FILENAME)
+    if kind == 'sqlite':
+        return SqliteSink(output_dir / CORPUS_DB_FILENAME)
+    if kind == 'markdown':
+        return MarkdownSink(output_dir, layout, slug_from_title)
+    raise ValueError(f"Unknown sink: {kind} (choose from {', '.join(SINKS)})")
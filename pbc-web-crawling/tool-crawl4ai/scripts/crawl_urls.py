@@ -0,0 +1,238 @@
+"""
+URL normalization and de-duplication before crawl dispatch.
+
+URL lists from feeds, sitemaps and hand-collected links are full of aliases
+of the same page: ?utm_* campaign tags, #fragments, trailing slashes,
+index.html, http and https. Crawling each alias fetches (and stores) the
+same page several times, so URLs are normalized and de-duplicated before
+they reach arun_many or a deep crawl.
+
+Two forms are computed per URL:
+    normalize(url) - the URL that is crawled: lowercase host, no default
+                     port, fragment, tracking parameters or index page,
+                     no trailing slash, remaining query parameters sorted
+    key(url)       - identity for de-duplication: the normalized URL with
+                     http folded into https, so the two schemes count once
+
+Per-domain rules adjust this; a domain rule applies to the domain and its
+subdomains, and the most specific domain wins. Rules file (YAML shown; JSON
+with the same structure also works; top-level keys apply to every host):
+
+    strip_params: [source]            # extra parameters to drop (globs allowed)
+    domains:
+      www.nytimes.com:
+        strip_params: [smid, smtyp]
+      news.example.com:
+        drop_query: true              # the query never selects content here
+        keep_params: [id]             # never dropped, even with drop_query
+        strip_www: true               # www.news.example.com == news.example.com
+        https: true                   # crawl http:// links over https
+      docs.example.com:
+        keep_trailing_slash: true
+        index_pages: [index.html, default.asp]
+
+Usage:
+    from crawl_urls import load_url_rules, load_urls_from_file
+
+    normalizer = load_url_rules("configs/url-rules.yaml")
+    urls = normalizer.dedupe(load_urls_from_file("urls.txt"))
+"""
+
+import fnmatch
+import json
+import re
+from pathlib import Path
+from urllib.parse import unquote_plus, urldefrag, urlsplit, urlunsplit
+
+try:
+    import yaml
+except ImportError:  # YAML rules files need PyYAML; JSON works without it
+    yaml = None
+
+
+# Query parameters that only tag the visit (analytics, ads, mail campaigns).
+# Bare "ref" is left out: it often selects content (a GitHub branch or tag)
+TRACKING_PARAMS = (
+    'utm_*', 'pk_*', 'mtm_*', 'hsa_*',
+    'gclid', 'gclsrc', 'dclid', 'gbraid', 'wbraid', 'fbclid', 'msclkid',
+    'yclid', 'twclid', 'ttclid', 'li_fat_id', 'igshid',
+    '_ga', '_gl', '_hsenc', '_hsmi', 'mc_cid', 'mc_eid', 'mkt_tok', 'vero_id',
+    'oly_anon_id', 'oly_enc_id', 'ref_src', 'ref_url', 'cmpid',
+    'ncid', 's_cid', 'sr_share', 'smid', 'spm',
+)
+
+# Directory index files served as aliases of their directory
+INDEX_PAGES = (
+    'index.html', 'index.htm', 'index.shtml', 'index.php',
+    'default.htm', 'default.html', 'default.aspx',
+)
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def load_urls_from_file(filepath: str) -> list[str]:
+    """Load URLs from a text file (one per line, '#' comments skipped)."""
+    urls = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                urls.append(line)
+    return urls
+
+
+def _fold_scheme(url: str) -> str:
+    """Treat http and https as the same page."""
+    if url.startswith('http://'):
+        return 'https://' + url[len('http://'):]
+    return url
+
+
+def _compile_rule(rule: dict) -> dict:
+    """Precompile one merged rule: parameter globs become a single regex."""
+    strip = [pattern.lower() for pattern in rule['strip_params']]
+    return {
+        'strip': re.compile('|'.join(fnmatch.translate(p) for p in strip)) if strip else None,
+        'keep': {name.lower() for name in rule['keep_params']},
+        'drop_query': bool(rule.get('drop_query')),
+        'keep_trailing_slash': bool(rule.get('keep_trailing_slash')),
+        'index_pages': {page.lower() for page in rule['index_pages']},
+        'strip_www': bool(rule.get('strip_www')),
+        'https': bool(rule.get('https')),
+    }
+
+
+def _merge(base: dict, override: dict) -> dict:
+    """A domain rule extends the parameter lists and overrides the flags."""
+    merged = {**base, **override}
+    merged['strip_params'] = list(base['strip_params']) + list(override.get('strip_params', []))
+    merged['keep_params'] = list(base['keep_params']) + list(override.get('keep_params', []))
+    return merged
+
+
+class UrlNormalizer:
+    """Canonical crawl URLs and de-duplication keys, with per-domain rules."""
+
+    def __init__(self, rules: dict | None = None):
+        rules = dict(rules or {})
+        domains = rules.pop('domains', None) or {}
+
+        defaults = _merge(
+            {'strip_params': list(TRACKING_PARAMS), 'keep_params': [], 'index_pages': list(INDEX_PAGES)},
+            rules
+        )
+        self._default = _compile_rule(defaults)
+        self._domains = {
+            domain.lower().lstrip('.'): _compile_rule(_merge(defaults, rule or {}))
+            for domain, rule in domains.items()
+        }
+        self._by_host = {}
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> 'UrlNormalizer':
+        """Load rules from a YAML (.yaml/.yml) or JSON file."""
+        path = Path(path)
+        text = path.read_text(encoding='utf-8')
+
+        if path.suffix.lower() in ('.yaml', '.yml'):
+            if yaml is None:
+                raise RuntimeError("PyYAML is required for YAML rules files (uv pip install pyyaml)")
+            data = yaml.safe_load(text) or {}
+        else:
+            data = json.loads(text)
+
+        return cls(data)
+
+    def _rule_for(self, host: str) -> dict:
+        """The most specific domain rule for a host (memoized per host)."""
+        rule = self._by_host.get(host)
+        if rule is None:
+            rule = self._default
+            labels = host.split('.')
+            for i in range(len(labels)):
+                candidate = '.'.join(labels[i:])
+                if candidate in self._domains:
+                    rule = self._domains[candidate]
+                    break
+            self._by_host[host] = rule
+        return rule
+
+    def _query(self, query: str, rule: dict) -> str:
+        """Drop tracking (or all non-kept) parameters; sort the rest by name."""
+        if not query:
+            return ''
+
+        kept = []
+        for part in query.split('&'):
+            if not part:
+                continue
+            name = unquote_plus(part.split('=', 1)[0]).lower()
+            if name in rule['keep']:
+                kept.append((name, part))
+            elif not rule['drop_query'] and not (rule['strip'] and rule['strip'].match(name)):
+                kept.append((name, part))
+
+        # Stable sort: repeated parameters keep their relative order
+        kept.sort(key=lambda item: item[0])
+        return '&'.join(part for _, part in kept)
+
+    def normalize(self, url: str) -> str:
+        """The canonical form of url, used as the URL that is crawled."""
+        url = urldefrag(url.strip())[0]
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or '').rstrip('.')
+        if not host:
+            return url
+
+        rule = self._rule_for(host)
+        if rule['strip_www'] and host.startswith('www.'):
+            host = host[len('www.'):]
+        if rule['https'] and scheme == 'http':
+            scheme = 'https'
+
+        netloc = f'[{host}]' if ':' in host else host
+        try:
+            port = parts.port
+        except ValueError:  # Malformed port: leave the URL as given
+            return url
+        if port is not None and str(port) != DEFAULT_PORTS.get(scheme):
+            netloc = f'{netloc}:{port}'
+        if '@' in parts.netloc:
+            netloc = f"{parts.netloc.rpartition('@')[0]}@{netloc}"
+
+        path = parts.path or '/'
+        head, _, last = path.rpartition('/')
+        if last.lower() in rule['index_pages']:
+            path = f'{head}/'
+        if not rule['keep_trailing_slash'] and len(path) > 1:
+            path = path.rstrip('/') or '/'
+
+        return urlunsplit((scheme, netloc, path, self._query(parts.query, rule), ''))
+
+    def key(self, url: str) -> str:
+        """De-duplication key: the normalized URL with http folded into https."""
+        return _fold_scheme(self.normalize(url))
+
+    def dedupe(self, urls: list[str]) -> list[str]:
+        """Normalized URLs in input order, keeping the first of each key."""
+        seen = set()
+        unique = []
+        for url in urls:
+            normalized = self.normalize(url)
+            key = _fold_scheme(normalized)
+            if key not in seen:
+                seen.add(key)
+                unique.append(normalized)
+        return unique
+
+
+# Built-in rules, compiled once
+DEFAULT_NORMALIZER = UrlNormalizer()
+
+
+def load_url_rules(rules_file: str | None = None) -> UrlNormalizer:
+    """Built-in normalizer, or one extended with rules from rules_file."""
+    if not rules_file:
+        return DEFAULT_NORMALIZER
+    return UrlNormalizer.from_file(rules_file)
@@ -4,6 +4,16 @@ Deep crawl documentation sites using Crawl4AI.
 Crawls nested documentation sites and saves pages as markdown files,
 preserving site structure.
 
+Pages are written by a bounded pool of background writer threads, so the
+crawler never waits on disk I/O, and every page outcome is streamed to
+<output_dir>/_manifest.jsonl instead of being held in memory. Memory stays
+flat on crawls of tens of thousands of pages.
+
+Discovered links are de-duplicated by normalized URL (see crawl_urls), so
+tracking-tagged, trailing-slash, index.html and http/https variants of a page
+are crawled once, and pages whose content nearly duplicates an earlier page
+are not stored again (see crawl_dedupe).
+
 Usage:
     python deep_crawl_docs.py <root_url> --output-dir <directory> [options]
 
@@ -11,50 +21,144 @@ Examples:
     python deep_crawl_docs.py https://docs.example.com -o ./docs
     python deep_crawl_docs.py https://docs.example.com -o ./docs --max-depth 3 --max-pages 100
     python deep_crawl_docs.py https://pipeline.groupthought.com -o ./pipeline-docs --pattern "*docs*"
+
+    # Refresh an existing corpus: only changed pages are rewritten (in place)
+    python deep_crawl_docs.py https://docs.example.com -o ./docs --incremental
+
+    # Store the whole site in one SQLite corpus instead of a file per page
+    python deep_crawl_docs.py https://docs.example.com -o ./docs --sink sqlite
+
+    # Run on a warm browser from the shared pool service (python crawl_server.py)
+    python deep_crawl_docs.py https://docs.example.com -o ./docs --server
+
+    # Site-specific URL normalization rules
+    python deep_crawl_docs.py https://docs.example.com -o ./docs --url-rules ../configs/url-rules.yaml
 """
 
 import argparse
 import asyncio
-import re
+import json
 import sys
+import threading
 from pathlib import Path
 from urllib.parse import urlparse
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from crawl4ai import BrowserConfig, CrawlerRunConfig, CacheMode
 from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, BestFirstCrawlingStrategy
-from crawl4ai.deep_crawling.filters import FilterChain, URLPatternFilter, DomainFilter
+from crawl4ai.deep_crawling.filters import FilterChain, URLFilter, URLPatternFilter, DomainFilter
 from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
 from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
 
+from crawl_client import DEFAULT_SERVER_URL
+from crawl_dedupe import NearDuplicateIndex
+from crawl_engine import create_crawler
+from crawl_manifest import CrawlManifest, MANIFEST_DB_FILENAME
+from crawl_sink import SINKS, make_page, open_sink
+from crawl_urls import UrlNormalizer, load_url_rules
 
-def slugify(text: str) -> str:
-    """Convert text to a safe filename slug."""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_-]+', '-', text)
-    text = text.strip('-')
-    return text[:60] or 'untitled'
 
+# Page manifest (one JSON record per crawled page), written inside output_dir
+MANIFEST_FILENAME = '_manifest.jsonl'
 
-def url_to_filepath(url: str, base_domain: str, output_dir: Path) -> Path:
-    """Convert URL to a file path preserving site structure."""
-    parsed = urlparse(url)
-    path = parsed.path.strip('/')
+# Failed URLs kept in memory for the end-of-run summary (full list is in the manifest)
+MAX_ERRORS_IN_SUMMARY = 10
 
-    if not path:
-        path = 'index'
 
-    # Clean up path segments
-    segments = [slugify(seg) for seg in path.split('/') if seg]
+class SeenUrlFilter(URLFilter):
+    """
+    Rejects links whose normalized URL was already accepted.
 
-    if not segments:
-        segments = ['index']
+    The deep crawl strategies only strip fragments from discovered links, so
+    every alias of a page would otherwise be fetched. Keep this filter last
+    in the chain: only links all other filters accepted are remembered.
+    """
 
-    # Add .md extension if not present
-    if not segments[-1].endswith('.md'):
-        segments[-1] = f"{segments[-1]}.md"
+    def __init__(self, normalizer: UrlNormalizer, seed_urls: list[str]):
+        super().__init__()
+        self._normalizer = normalizer
+        self._seen = {normalizer.key(url) for url in seed_urls}
 
-    return output_dir / '/'.join(segments)
+    def apply(self, url: str) -> bool:
+        key = self._normalizer.key(url)
+        passed = key not in self._seen
+        self._seen.add(key)
+        self._update_stats(passed)
+        return passed
+
+
+class PageWriter:
+    """
+    Bounded asynchronous page writer.
+
+    Pages are queued with submit() and written to the output sink by `workers`
+    tasks that run the blocking I/O in threads. The queue holds at most `max_pending` pages;
+    when disks fall behind, submit() waits, applying backpressure to the crawl
+    instead of buffering unbounded output in memory. Each outcome is appended
+    to a JSONL manifest as it happens. A page that fails to write is recorded
+    in `failures` and the workers keep draining the queue.
+    """
+
+    def __init__(self, manifest_path: Path, sink, workers: int = 4, max_pending: int = 64):
+        self._sink = sink
+        self._queue = asyncio.Queue(maxsize=max_pending)
+        self._manifest = open(manifest_path, 'a', encoding='utf-8')
+        self._manifest_lock = threading.Lock()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(workers)]
+        self.failures: list[dict] = []
+
+    def _append_manifest(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._manifest_lock:
+            self._manifest.write(line)
+            self._manifest.flush()
+
+    def _write_page(self, page: dict, record: dict) -> str:
+        location = self._sink.write(page)
+        self._append_manifest({**record, 'file': location})
+        return location
+
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    return
+                page, record, on_written = item
+                try:
+                    location = await asyncio.to_thread(self._write_page, page, record)
+                    if on_written:
+                        on_written(location)
+                except Exception as e:  # A worker that dies stops draining, deadlocking submit() and close()
+                    await self._record_failure(record, e)
+            finally:
+                self._queue.task_done()
+
+    async def _record_failure(self, record: dict, error: Exception) -> None:
+        failure = {'url': record['url'], 'error': f"Write failed: {error}", 'depth': record.get('depth', 0)}
+        self.failures.append(failure)
+        try:
+            await asyncio.to_thread(self._append_manifest, {**record, **failure, 'status': 'failed'})
+        except OSError:
+            pass  # Already in failures, which the summary reports
+
+    async def submit(self, page: dict, record: dict, on_written=None) -> None:
+        """
+        Queue a page (crawl_sink.make_page) for writing; waits while the queue is full.
+
+        on_written(location) is called once the page has been written.
+        """
+        await self._queue.put((page, record, on_written))
+
+    async def record(self, record: dict) -> None:
+        """Append a manifest record without writing a page (e.g. a failure)."""
+        await asyncio.to_thread(self._append_manifest, record)
+
+    async def close(self) -> None:
+        """Wait for queued pages to be written, then stop the workers."""
+        for _ in self._tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._tasks)
+        self._manifest.close()
 
 
 async def deep_crawl_docs(
@@ -64,7 +168,13 @@ async def deep_crawl_docs(
     max_pages: int = 50,
     url_pattern: str | None = None,
     keywords: list[str] | None = None,
-    use_best_first: bool = True
+    use_best_first: bool = True,
+    writer_threads: int = 4,
+    incremental: bool = False,
+    server: str | None = None,
+    sink: str = 'markdown',
+    url_rules_file: str | None = None,
+    keep_near_duplicates: bool = False
 ) -> dict:
     """
     Deep crawl a documentation site and save pages as markdown.
@@ -77,13 +187,24 @@ async def deep_crawl_docs(
         url_pattern: Optional URL pattern filter (e.g., "*docs*")
         keywords: Optional keywords for relevance scoring
         use_best_first: Use BestFirst strategy (True) or BFS (False)
+        writer_threads: Background threads writing pages to disk (default: 4)
+        incremental: Compare with the previous crawl in output_dir; rewrite only
+            changed pages, in place, and report added/changed/unchanged/removed
+        server: Browser pool service URL (crawl_server.py); None launches a browser here
+        sink: 'markdown' (file per page), 'jsonl' or 'sqlite' (one corpus in output_dir)
+        url_rules_file: YAML/JSON per-domain URL normalization rules (see crawl_urls)
+        keep_near_duplicates: Store pages whose content nearly duplicates an earlier page
 
     Returns:
-        Dict with crawl statistics
+        Dict with crawl statistics. 'errors' holds only the first few failures;
+        every page (saved or failed) is listed in the 'manifest' JSONL file.
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    normalizer = load_url_rules(url_rules_file)
+    root_url = normalizer.normalize(root_url)
+
     # Extract domain for filtering
     parsed_root = urlparse(root_url)
     base_domain = parsed_root.netloc
@@ -96,6 +217,11 @@ async def deep_crawl_docs(
     if url_pattern:
         filters.append(URLPatternFilter(patterns=[url_pattern]))
 
+    # The pool service can only rebuild crawl4ai's own filter classes, so
+    # with --server aliases are fetched and caught as near-duplicates instead
+    if not server:
+        filters.append(SeenUrlFilter(normalizer, [root_url]))
+
     filter_chain = FilterChain(filters)
 
     # Choose strategy
@@ -130,59 +256,121 @@ async def deep_crawl_docs(
         verbose=True
     )
 
+    manifest_path = output_path / MANIFEST_FILENAME
+
     stats = {
         'pages_crawled': 0,
         'pages_saved': 0,
         'pages_failed': 0,
-        'files': [],
-        'errors': []
+        'pages_duplicate': 0,
+        'errors': [],
+        'manifest': str(manifest_path)
     }
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        async for result in await crawler.arun(root_url, config=run_config):
-            stats['pages_crawled'] += 1
-            depth = result.metadata.get('depth', 0)
-            score = result.metadata.get('score', 0)
-
-            if result.success:
-                # Get markdown content
-                markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
-                title = result.metadata.get('title', 'Untitled')
-
-                # Build output with metadata
-                output = f"# {title}\n\n"
-                output += f"- **Source:** {result.url}\n"
-                output += f"- **Depth:** {depth}\n"
-                if score:
-                    output += f"- **Relevance Score:** {score:.2f}\n"
-                output += f"- **Status:** {result.status_code}\n\n"
-                output += "---\n\n"
-                output += markdown
-
-                # Determine file path preserving structure
-                filepath = url_to_filepath(result.url, base_domain, output_path)
-                filepath.parent.mkdir(parents=True, exist_ok=True)
-
-                # Avoid overwriting
-                if filepath.exists():
-                    stem = filepath.stem
-                    filepath = filepath.parent / f"{stem}-{stats['pages_crawled']}.md"
-
-                filepath.write_text(output, encoding='utf-8')
-
-                stats['pages_saved'] += 1
-                stats['files'].append(str(filepath))
-
-                print(f"[{stats['pages_crawled']}/{max_pages}] Depth {depth} | Score {score:.2f} | Saved: {filepath.name}", file=sys.stderr)
-
-            else:
-                stats['pages_failed'] += 1
-                stats['errors'].append({
-                    'url': result.url,
-                    'error': result.error_message,
-                    'depth': depth
-                })
-                print(f"[{stats['pages_crawled']}/{max_pages}] Depth {depth} | Failed: {result.url}", file=sys.stderr)
+    # Pages are still fetched in incremental mode (their links drive the deep
+    # crawl), but unchanged content is never rewritten
+    incremental_manifest = None
+    if incremental:
+        incremental_manifest = CrawlManifest(output_path / MANIFEST_DB_FILENAME)
+        incremental_manifest.begin_run()
+
+    # Markdown files mirror the site's URL structure, named by URL rather than title
+    page_sink = open_sink(sink, output_path, layout='tree', slug_from_title=False)
+    writer = PageWriter(manifest_path, page_sink, workers=writer_threads, max_pending=writer_threads * 16)
+    near_duplicates = None if keep_near_duplicates else NearDuplicateIndex()
+
+    try:
+        async with create_crawler('browser', browser_config, server) as crawler:
+            async for result in await crawler.arun(root_url, config=run_config):
+                stats['pages_crawled'] += 1
+                depth = result.metadata.get('depth', 0)
+                score = result.metadata.get('score', 0)
+
+                if result.success:
+                    # Get markdown content
+                    markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
+                    title = result.metadata.get('title', 'Untitled')
+                    url = normalizer.normalize(result.url)
+                    record = {
+                        'url': url,
+                        'status': 'saved',
+                        'title': title,
+                        'depth': depth,
+                        'score': score
+                    }
+
+                    original = near_duplicates.check(markdown, url) if near_duplicates else None
+                    if original:
+                        stats['pages_duplicate'] += 1
+                        if incremental_manifest:
+                            incremental_manifest.touch(url)
+                        await writer.record({**record, 'status': 'duplicate', 'duplicate_of': original})
+                        print(f"[{stats['pages_crawled']}/{max_pages}] Depth {depth} | Near-duplicate of {original}: {url}", file=sys.stderr)
+                        continue
+
+                    page = make_page(url, title, result.status_code, markdown, depth=depth, score=score)
+
+                    # Stable per-URL location; the page is written in the background
+                    location = page_sink.location_for(page)
+
+                    if incremental_manifest:
+                        sha256 = page['hash']
+                        change, previous = incremental_manifest.classify(url, sha256)
+                        record['status'] = change
+
+                        if change == 'unchanged':
+                            incremental_manifest.update(url, previous['file'], sha256, result.response_headers)
+                            await writer.record({**record, 'file': previous['file']})
+                            print(f"[{stats['pages_crawled']}/{max_pages}] Depth {depth} | Unchanged: {url}", file=sys.stderr)
+                            continue
+
+                        # Names are per URL, so a changed page lands on its own file.
+                        # The hash is stored only once the write succeeds; until
+                        # then the page keeps its previous record and is retried
+                        # next run
+                        incremental_manifest.touch(url)
+
+                        def store_hash(location, url=url, sha256=sha256, headers=result.response_headers):
+                            incremental_manifest.update(url, location, sha256, headers)
+
+                        await writer.submit(page, record, on_written=store_hash)
+                    else:
+                        await writer.submit(page, record)
+
+                    stats['pages_saved'] += 1
+
+                    print(f"[{stats['pages_crawled']}/{max_pages}] Depth {depth} | Score {score:.2f} | Saved: {Path(location).name if page_sink.per_page_files else url}", file=sys.stderr)
+
+                else:
+                    stats['pages_failed'] += 1
+                    error = {
+                        'url': result.url,
+                        'error': result.error_message,
+                        'depth': depth
+                    }
+                    if len(stats['errors']) < MAX_ERRORS_IN_SUMMARY:
+                        stats['errors'].append(error)
+                    if incremental_manifest:
+                        # A failed fetch is not evidence the page was removed
+                        incremental_manifest.touch(normalizer.normalize(result.url))
+                    await writer.record({**error, 'status': 'failed'})
+                    print(f"[{stats['pages_crawled']}/{max_pages}] Depth {depth} | Failed: {result.url}", file=sys.stderr)
+    finally:
+        # Drain pending writes even if the crawl was interrupted
+        try:
+            await writer.close()
+        finally:
+            page_sink.close()
+
+        stats['pages_saved'] -= len(writer.failures)
+        stats['pages_failed'] += len(writer.failures)
+        stats['errors'].extend(writer.failures[:MAX_ERRORS_IN_SUMMARY - len(stats['errors'])])
+
+        if incremental_manifest:
+            removed = incremental_manifest.finish_run()
+            stats['incremental'] = dict(incremental_manifest.counts)
+            stats['removed'] = removed[:MAX_ERRORS_IN_SUMMARY]
+            incremental_manifest.close()
 
     return stats
 
@@ -226,6 +414,43 @@ def main():
         action='store_true',
         help='Use BFS strategy instead of BestFirst'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Rewrite only pages whose content changed since the last crawl into this output dir'
+    )
+    parser.add_argument(
+        '--writer-threads',
+        type=int,
+        default=4,
+        help='Background threads writing pages to disk (default: 4)'
+    )
+    parser.add_argument(
+        '--sink',
+        choices=SINKS,
+        default='markdown',
+        help='Output format: markdown (file per page), jsonl (_corpus.jsonl) or '
+             'sqlite (_corpus.sqlite3) in --output-dir (default: markdown)'
+    )
+    parser.add_argument(
+        '--url-rules',
+        help='YAML/JSON per-domain URL normalization rules (see configs/url-rules.yaml)'
+    )
+    parser.add_argument(
+        '--keep-near-duplicates',
+        action='store_true',
+        help='Store pages even when their content nearly duplicates an earlier page'
+    )
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Crawl through the shared browser pool service (start it with crawl_server.py)'
+    )
+    parser.add_argument(
+        '--server-url',
+        default=DEFAULT_SERVER_URL,
+        help=f'Browser pool service URL (default: {DEFAULT_SERVER_URL})'
+    )
 
     args = parser.parse_args()
 
@@ -240,7 +465,13 @@ def main():
             max_pages=args.max_pages,
             url_pattern=args.pattern,
             keywords=args.keywords,
-            use_best_first=not args.bfs
+            use_best_first=not args.bfs,
+            writer_threads=args.writer_threads,
+            incremental=args.incremental,
+            server=args.server_url if args.server else None,
+            sink=args.sink,
+            url_rules_file=args.url_rules,
+            keep_near_duplicates=args.keep_near_duplicates
         ))
 
         # Summary
@@ -250,12 +481,29 @@ def main():
         print(f"Pages crawled: {stats['pages_crawled']}", file=sys.stderr)
         print(f"Pages saved: {stats['pages_saved']}", file=sys.stderr)
         print(f"Pages failed: {stats['pages_failed']}", file=sys.stderr)
+        if stats['pages_duplicate']:
+            print(f"Near-duplicates not stored: {stats['pages_duplicate']}", file=sys.stderr)
         print(f"Output directory: {args.output_dir}", file=sys.stderr)
+        print(f"Manifest: {stats['manifest']}", file=sys.stderr)
+
+        if 'incremental' in stats:
+            changes = stats['incremental']
+            print(
+                f"Changes: {changes['added']} added, {changes['changed']} changed, "
+                f"{changes['unchanged']} unchanged, {changes['removed']} removed",
+                file=sys.stderr
+            )
+            if stats['removed']:
+                print("\nNo longer found (files kept):", file=sys.stderr)
+                for page in stats['removed']:
+                    print(f"  {page['url']} -> {page['file']}", file=sys.stderr)
 
         if stats['errors']:
             print(f"\nFailed URLs:", file=sys.stderr)
-            for error in stats['errors'][:10]:
+            for error in stats['errors']:
                 print(f"  Depth {error['depth']}: {error['url']}", file=sys.stderr)
+            if stats['pages_failed'] > len(stats['errors']):
+                print(f"  ... {stats['pages_failed'] - len(stats['errors'])} more (see manifest)", file=sys.stderr)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -20,16 +20,39 @@ Examples:
 
     # Use Common Crawl for comprehensive discovery
     python discover_urls.py example.com --source cc --max-urls 1000
+
+    # Nightly ingestion: emit only URLs that are new or have a newer sitemap
+    # lastmod than in the discovery store, then update the store
+    python discover_urls.py example.com --store discovery-store.json --format urls -o new.txt
+
+    # Diff against a previous snapshot, and snapshot this run for the next diff
+    python discover_urls.py example.com --since day1.json --snapshot day2.json --format urls
+
+    # Site-specific URL normalization rules (aliases are always collapsed)
+    python discover_urls.py example.com --url-rules ../configs/url-rules.yaml --format urls
 """
 
 import argparse
 import asyncio
 import json
 import sys
+import xml.etree.ElementTree as ET
+import zlib
+from datetime import datetime
 from pathlib import Path
 
+import aiohttp
 from crawl4ai import AsyncUrlSeeder, SeedingConfig
 
+from crawl_urls import UrlNormalizer, load_url_rules
+
+
+# Upper bound on nested sitemap indexes followed when collecting lastmod dates
+MAX_SITEMAPS = 200
+
+# Sitemap bytes read per step; a 50 MB sitemap is never held in memory whole
+SITEMAP_CHUNK_SIZE = 64 * 1024
+
 
 async def discover_urls(
     domain: str,
@@ -40,7 +63,8 @@ async def discover_urls(
     max_urls: int = 500,
     extract_metadata: bool = False,
     live_check: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    url_rules_file: str | None = None
 ) -> list[dict]:
     """
     Discover URLs from a domain using sitemap and/or Common Crawl.
@@ -55,9 +79,12 @@ async def discover_urls(
         extract_metadata: Extract <head> metadata (slower but more info)
         live_check: Verify URLs are accessible (slower)
         verbose: Print progress messages
+        url_rules_file: YAML/JSON per-domain URL normalization rules (see crawl_urls)
 
     Returns:
-        List of URL dictionaries with 'url', 'status', and optionally 'relevance_score'
+        List of URL dictionaries with 'url', 'status', and optionally 'relevance_score'.
+        URLs are normalized, and aliases of one page (tracking parameters,
+        trailing slashes, index.html, http/https) are listed once.
     """
     config_kwargs = {
         "source": source,
@@ -88,10 +115,210 @@ async def discover_urls(
 
         urls = await seeder.urls(domain, config)
 
-        if verbose:
-            print(f"  Found: {len(urls)} URLs", file=sys.stderr)
+    # Keep the first entry of each normalized URL (seeder order: best score first)
+    normalizer = load_url_rules(url_rules_file)
+    unique = {}
+    for url in urls:
+        normalized = normalizer.normalize(url['url'])
+        unique.setdefault(normalizer.key(normalized), {**url, 'url': normalized})
+
+    if verbose:
+        print(f"  Found: {len(urls)} URLs ({len(urls) - len(unique)} duplicates after normalization)", file=sys.stderr)
+
+    return list(unique.values())
+
+
+class _SitemapParser:
+    """
+    Incremental parser for a sitemap or sitemap index, plain or gzipped.
 
-        return urls
+    Bytes are fed as they arrive and parsed elements are cleared, so memory
+    stays flat however large the sitemap is.
+    """
+
+    def __init__(self, normalizer: UrlNormalizer):
+        self._normalizer = normalizer
+        self._parser = ET.XMLPullParser(events=('end',))
+        self._head = b''
+        self._gunzip = None
+        self._loc = self._lastmod = None
+        self.lastmods = {}
+        self.children = []
+
+    def feed(self, chunk: bytes) -> None:
+        if self._head is not None:
+            # The gzip magic number decides how the rest is read
+            self._head += chunk
+            if len(self._head) < 2:
+                return
+            chunk, self._head = self._head, None
+            if chunk[:2] == b'\x1f\x8b':
+                self._gunzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._gunzip:
+            chunk = self._gunzip.decompress(chunk)
+        self._parser.feed(chunk)
+        self._collect()
+
+    def close(self) -> tuple[dict[str, str], list[str]]:
+        """Returns ({url key: lastmod}, [child sitemap urls]), keyed by normalizer.key()."""
+        if self._head:
+            self._parser.feed(self._head)
+        if self._gunzip:
+            self._parser.feed(self._gunzip.flush())
+        self._parser.close()
+        self._collect()
+        return self.lastmods, self.children
+
+    def _collect(self) -> None:
+        for _, elem in self._parser.read_events():
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if tag == 'loc':
+                self._loc = (elem.text or '').strip()
+            elif tag == 'lastmod':
+                self._lastmod = (elem.text or '').strip()
+            elif tag == 'url' and self._loc:
+                if self._lastmod:
+                    self.lastmods[self._normalizer.key(self._loc)] = self._lastmod
+                self._loc = self._lastmod = None
+            elif tag == 'sitemap' and self._loc:
+                self.children.append(self._loc)
+                self._loc = self._lastmod = None
+            elem.clear()
+
+
+async def fetch_sitemap_lastmods(
+    domain: str,
+    verbose: bool = False,
+    normalizer: UrlNormalizer | None = None
+) -> dict[str, str]:
+    """
+    Collect <lastmod> dates from a domain's sitemaps.
+
+    Sitemaps are taken from robots.txt 'Sitemap:' lines, falling back to
+    /sitemap.xml, and sitemap indexes are followed (up to MAX_SITEMAPS files).
+
+    Returns:
+        Dict mapping each URL's normalizer.key() (built-in rules by default)
+        to its lastmod string
+    """
+    normalizer = normalizer or load_url_rules()
+    base = domain if '://' in domain else f"https://{domain}"
+    base = base.rstrip('/')
+    lastmods = {}
+
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        pending = []
+        try:
+            async with session.get(f"{base}/robots.txt") as response:
+                if response.status == 200:
+                    for line in (await response.text()).splitlines():
+                        if line.lower().startswith('sitemap:'):
+                            pending.append(line.split(':', 1)[1].strip())
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+            pass  # Fall back to /sitemap.xml
+
+        if not pending:
+            pending.append(f"{base}/sitemap.xml")
+
+        seen = set()
+        while pending and len(seen) < MAX_SITEMAPS:
+            sitemap_url = pending.pop()
+            if sitemap_url in seen:
+                continue
+            seen.add(sitemap_url)
+
+            try:
+                async with session.get(sitemap_url) as response:
+                    if response.status != 200:
+                        continue
+                    parser = _SitemapParser(normalizer)
+                    async for chunk in response.content.iter_chunked(SITEMAP_CHUNK_SIZE):
+                        parser.feed(chunk)
+                found, children = parser.close()
+            except (aiohttp.ClientError, asyncio.TimeoutError, ET.ParseError, zlib.error, OSError) as e:
+                if verbose:
+                    print(f"  Skipping sitemap {sitemap_url}: {e}", file=sys.stderr)
+                continue
+
+            lastmods.update(found)
+            pending.extend(children)
+
+    if verbose:
+        print(f"  Sitemap lastmod dates: {len(lastmods)} URLs ({len(seen)} sitemaps)", file=sys.stderr)
+
+    return lastmods
+
+
+def load_previous_discovery(path: str | Path | None) -> list[dict]:
+    """
+    Load a previous discovery: either a --format json output (list of URL
+    dicts) or a discovery store/snapshot written by save_discovery_store().
+    """
+    if not path or not Path(path).exists():
+        return []
+    path = Path(path)
+    data = json.loads(path.read_text(encoding='utf-8'))
+    return data.get('urls', []) if isinstance(data, dict) else data
+
+
+def diff_discovery(
+    current: list[dict],
+    previous: list[dict],
+    normalizer: UrlNormalizer | None = None
+) -> list[dict]:
+    """
+    Return URLs that are new or updated since a previous discovery.
+
+    URLs are matched by normalizer.key(). A known URL counts as updated only
+    when both runs have a sitemap lastmod for it and the two differ; a
+    missing lastmod on either side is not evidence of a change. Each
+    returned dict gets a 'change' key: 'new' or 'updated'.
+    """
+    normalizer = normalizer or load_url_rules()
+    known = {normalizer.key(u['url']): u.get('lastmod') for u in previous}
+    changed = []
+
+    for url in current:
+        key = normalizer.key(url['url'])
+        if key not in known:
+            changed.append({**url, 'change': 'new'})
+        elif url.get('lastmod') and known[key] and url['lastmod'] != known[key]:
+            changed.append({**url, 'change': 'updated'})
+
+    return changed
+
+
+def save_discovery_store(
+    path: str | Path,
+    domain: str,
+    current: list[dict],
+    previous: list[dict],
+    normalizer: UrlNormalizer | None = None
+):
+    """
+    Write the discovery store: previous URLs updated with the current run.
+
+    URLs missing from this run (e.g. past --max-urls) are kept, so they are
+    not reported as new again next time, and a URL whose sitemap lastmod is
+    missing this run keeps the one recorded before.
+    """
+    normalizer = normalizer or load_url_rules()
+    merged = {normalizer.key(u['url']): u for u in previous}
+    for url in current:
+        key = normalizer.key(url['url'])
+        entry = {k: v for k, v in url.items() if k != 'change'}
+        if not entry.get('lastmod') and key in merged:
+            entry['lastmod'] = merged[key].get('lastmod')
+        merged[key] = entry
+
+    output = {
+        'domain': domain,
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+        'total_urls': len(merged),
+        'urls': list(merged.values())
+    }
+    Path(path).write_text(json.dumps(output, indent=2), encoding='utf-8')
 
 
 def format_output(urls: list[dict], output_format: str, include_metadata: bool) -> str:
@@ -202,6 +429,27 @@ Examples:
         help="Output file path (default: stdout)"
     )
 
+    parser.add_argument(
+        "--since",
+        help="Previous discovery JSON (--snapshot or --store file); emit only new/updated URLs"
+    )
+
+    parser.add_argument(
+        "--snapshot",
+        help="Write every URL of this run with its lastmod (plus earlier URLs from --since) "
+             "to this file, for the next run's --since"
+    )
+
+    parser.add_argument(
+        "--store",
+        help="Persistent discovery store: diff against it, then update it with this run"
+    )
+
+    parser.add_argument(
+        "--url-rules",
+        help="YAML/JSON per-domain URL normalization rules (see configs/url-rules.yaml)"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -220,13 +468,42 @@ Examples:
             max_urls=args.max_urls,
             extract_metadata=args.metadata,
             live_check=args.live_check,
-            verbose=args.verbose
+            verbose=args.verbose,
+            url_rules_file=args.url_rules
         ))
 
         if not urls:
             print("No URLs found matching criteria", file=sys.stderr)
             sys.exit(1)
 
+        if args.since or args.store or args.snapshot:
+            # Sitemap, previous and current URLs are all keyed with the same rules
+            normalizer = load_url_rules(args.url_rules)
+            if args.source != "cc":
+                lastmods = asyncio.run(fetch_sitemap_lastmods(args.domain, args.verbose, normalizer))
+                for url in urls:
+                    url.setdefault("lastmod", lastmods.get(normalizer.key(url["url"])))
+
+            previous = load_previous_discovery(args.since or args.store)
+            discovered = urls
+            urls = diff_discovery(discovered, previous, normalizer)
+
+            if args.store:
+                save_discovery_store(
+                    args.store, args.domain, discovered, load_previous_discovery(args.store), normalizer
+                )
+            # The output holds only changed URLs; the snapshot keeps unchanged
+            # ones too, so chained --since runs do not report them as new
+            if args.snapshot:
+                save_discovery_store(args.snapshot, args.domain, discovered, previous, normalizer)
+
+            new_count = sum(1 for u in urls if u["change"] == "new")
+            print(
+                f"Changes since previous discovery: {new_count} new, "
+                f"{len(urls) - new_count} updated, {len(discovered) - len(urls)} unchanged",
+                file=sys.stderr
+            )
+
         output = format_output(urls, args.format, args.metadata)
 
         if args.output:
@@ -7,6 +7,14 @@ Run once to log in manually, then reuse the session for authenticated crawls.
 Usage:
     Step 1: Run this script to open browser and log in manually
     Step 2: Use medium_authenticated_crawl() for subsequent crawls
+
+    python medium-auth-setup.py                 # log in
+    python medium-auth-setup.py test            # verify the saved session
+    python medium-auth-setup.py test --server   # same, on the browser pool service
+
+With the browser pool service (crawl_server.py), the profile stays open in
+one warm headless browser between crawls. Stop the server (or let it idle
+out) before re-running the login step, which needs the profile to itself.
 """
 
 import asyncio
@@ -15,6 +23,9 @@ from pathlib import Path
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 
+from crawl_client import DEFAULT_SERVER_URL
+from crawl_engine import create_crawler
+
 # Persistent browser data directory
 MEDIUM_PROFILE_DIR = Path(__file__).parent.parent / "browser-profiles" / "medium"
 
@@ -86,12 +97,13 @@ async def setup_medium_session():
             print(f"\n❌ Failed to open Medium: {result.error_message}")
 
 
-async def medium_authenticated_crawl(url: str) -> str:
+async def medium_authenticated_crawl(url: str, server: str | None = None) -> str:
     """
     Crawl a Medium article using the saved authenticated session.
 
     Args:
         url: Medium article URL to crawl
+        server: Browser pool service URL (crawl_server.py); None launches a browser here
 
     Returns:
         Full markdown content of the article
@@ -115,7 +127,7 @@ async def medium_authenticated_crawl(url: str) -> str:
         css_selector="article",
     )
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
+    async with create_crawler('browser', browser_config, server) as crawler:
         result = await crawler.arun(url=url, config=crawler_config)
 
         if result.success:
@@ -124,7 +136,7 @@ async def medium_authenticated_crawl(url: str) -> str:
             raise RuntimeError(f"Crawl failed: {result.error_message}")
 
 
-async def test_authenticated_crawl():
+async def test_authenticated_crawl(server: str | None = None):
     """Test the authenticated session with a sample Medium article."""
     # Test URL - a known paywalled article
     test_url = "https://medium.com/"
@@ -132,7 +144,7 @@ async def test_authenticated_crawl():
     print(f"Testing authenticated crawl of: {test_url}")
 
     try:
-        content = await medium_authenticated_crawl(test_url)
+        content = await medium_authenticated_crawl(test_url, server)
         print(f"\n✅ Successfully crawled! Content length: {len(content)} characters")
         print("\nFirst 500 characters:")
         print("-" * 40)
@@ -146,7 +158,8 @@ if __name__ == "__main__":
 
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         # Test mode: verify authentication works
-        asyncio.run(test_authenticated_crawl())
+        server = DEFAULT_SERVER_URL if "--server" in sys.argv[2:] else None
+        asyncio.run(test_authenticated_crawl(server))
     else:
         # Setup mode: open browser for manual login
         asyncio.run(setup_medium_session())
@@ -0,0 +1,213 @@
+"""
+Data-driven SPA content validator registry.
+
+Validation rules say what a correctly rendered page must look like, so SPA
+routing failures (wrong page content for a URL) can be detected. Rules are
+loaded from a YAML or JSON file and indexed once per domain: literal rules
+(pattern substrings, globs without wildcards, globs ending in a single '*')
+go into dicts keyed by the literal, so their cost depends on the number of
+distinct literal lengths, not on the number of rules. True patterns
+(regexes, other globs) are compiled one per rule and tried in file order,
+only while they could still beat the best literal match. Lookups are
+memoized per URL.
+
+Rules file format (YAML shown; JSON with the same structure also works):
+
+    rules:
+      - domain: developers.notion.com      # optional; omit to match any host
+        pattern: post-database-query        # substring of the URL path (default)
+        h1_keywords: [query, database]      # lowercase words the H1 must contain
+      - domain: docs.example.com
+        glob: "/api/*/endpoints/*"          # or: shell-style glob on the path
+        regex: "^/guides/v\\d+/"            # or: regular expression on the path
+        h1_keywords: [endpoint]
+        required: ["## Parameters"]         # markers the markdown must contain
+        forbidden: ["Page not found"]       # markers the markdown must not contain
+
+When several rules match a URL, the first one listed wins.
+
+Usage:
+    from spa_validators import SpaValidatorRegistry
+
+    registry = SpaValidatorRegistry.from_file("configs/spa-validators.yaml")
+    rule = registry.lookup(url)   # dict or None
+"""
+
+import fnmatch
+import json
+import re
+from pathlib import Path
+from urllib.parse import urlparse
+
+try:
+    import yaml
+except ImportError:  # YAML rules files need PyYAML; JSON works without it
+    yaml = None
+
+
+# Any-host rules are stored under this key
+ANY_DOMAIN = '*'
+
+
+# Glob characters that make a glob more than a literal path or prefix
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+
+def _compile_pattern(rule: dict):
+    """
+    Matcher for a regex or wildcard-glob rule: a callable taking the path
+    (plus query) that returns a match or None.
+
+    Each rule gets its own compiled regex, so a user regex keeps its exact
+    meaning (anchors, alternations, groups, backreferences).
+    """
+    if 'regex' in rule:
+        return re.compile(rule['regex'], re.IGNORECASE | re.DOTALL).search
+    return re.compile(fnmatch.translate(rule['glob'].lower()), re.IGNORECASE | re.DOTALL).match
+
+
+def _normalize_rule(rule: dict) -> dict:
+    """Fill defaults and lowercase keywords so matching is case-insensitive."""
+    return {
+        **rule,
+        'domain': (rule.get('domain') or ANY_DOMAIN).lower(),
+        'h1_keywords': [kw.lower() for kw in rule.get('h1_keywords', [])],
+        'required': list(rule.get('required', [])),
+        'forbidden': list(rule.get('forbidden', [])),
+    }
+
+
+def _literal_index(rule: dict) -> tuple[str, str] | None:
+    """
+    ('exact' | 'prefix' | 'substring', lowercase literal) for rules that need
+    no regex, else None.
+    """
+    if 'regex' in rule:
+        return None
+    if 'glob' in rule:
+        glob = rule['glob'].lower()
+        if not _GLOB_CHARS.search(glob):
+            return 'exact', glob
+        if glob.endswith('*') and not _GLOB_CHARS.search(glob[:-1]):
+            return 'prefix', glob[:-1]
+        return None
+    if 'pattern' in rule:
+        return 'substring', rule['pattern'].lower()
+    raise ValueError(f"Validator rule needs one of 'pattern', 'glob' or 'regex': {rule}")
+
+
+class _DomainMatcher:
+    """First matching rule among one domain's rules (given as rule indices)."""
+
+    def __init__(self, rules: list[dict], indices: list[int]):
+        self._exact = {}
+        # {literal length: {literal: rule index}}; the first-listed rule keeps a literal
+        self._prefixes = {}
+        self._substrings = {}
+        # (rule index, matcher) in file order
+        self._patterns = []
+
+        for i in indices:
+            literal = _literal_index(rules[i])
+            if literal is None:
+                self._patterns.append((i, _compile_pattern(rules[i])))
+                continue
+            kind, text = literal
+            if kind == 'exact':
+                self._exact.setdefault(text, i)
+            else:
+                table = self._prefixes if kind == 'prefix' else self._substrings
+                table.setdefault(len(text), {}).setdefault(text, i)
+
+    def match(self, target: str) -> int | None:
+        """Index of the first-listed rule matching target (path + query), or None."""
+        target_lower = target.lower()
+        candidates = []
+
+        exact = self._exact.get(target_lower)
+        if exact is not None:
+            candidates.append(exact)
+        for length, table in self._prefixes.items():
+            hit = table.get(target_lower[:length])
+            if hit is not None:
+                candidates.append(hit)
+        for length, table in self._substrings.items():
+            for start in range(len(target_lower) - length + 1):
+                hit = table.get(target_lower[start:start + length])
+                if hit is not None:
+                    candidates.append(hit)
+
+        best = min(candidates) if candidates else None
+        for index, matcher in self._patterns:
+            if best is not None and index > best:
+                break
+            if matcher(target):
+                return index
+        return best
+
+
+class SpaValidatorRegistry:
+    """Compiled, per-domain SPA validation rules."""
+
+    def __init__(self, rules: list[dict]):
+        self.rules = [_normalize_rule(rule) for rule in rules]
+        self._matchers = {}
+        self._cache = {}
+
+        domains = {rule['domain'] for rule in self.rules}
+        for domain in domains:
+            # Each domain's matcher also includes any-host rules, in file order
+            indices = [
+                i for i, rule in enumerate(self.rules)
+                if rule['domain'] in (domain, ANY_DOMAIN)
+            ]
+            self._matchers[domain] = _DomainMatcher(self.rules, indices)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> 'SpaValidatorRegistry':
+        """Load rules from a YAML (.yaml/.yml) or JSON file."""
+        path = Path(path)
+        text = path.read_text(encoding='utf-8')
+
+        if path.suffix.lower() in ('.yaml', '.yml'):
+            if yaml is None:
+                raise RuntimeError("PyYAML is required for YAML rules files (uv pip install pyyaml)")
+            data = yaml.safe_load(text) or {}
+        else:
+            data = json.loads(text)
+
+        rules = data.get('rules', []) if isinstance(data, dict) else data
+        return cls(rules)
+
+    @classmethod
+    def from_keyword_map(cls, mapping: dict[str, list[str]]) -> 'SpaValidatorRegistry':
+        """Build a registry from a {url-substring: [h1 keywords]} mapping."""
+        return cls([
+            {'pattern': pattern, 'h1_keywords': keywords}
+            for pattern, keywords in mapping.items()
+        ])
+
+    def extend(self, other: 'SpaValidatorRegistry') -> 'SpaValidatorRegistry':
+        """Return a new registry with this registry's rules first, then other's."""
+        return SpaValidatorRegistry(self.rules + other.rules)
+
+    def lookup(self, url: str) -> dict | None:
+        """Return the first rule matching the URL, or None."""
+        if url in self._cache:
+            return self._cache[url]
+
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        target = parsed.path or '/'
+        if parsed.query:
+            target += f"?{parsed.query}"
+
+        matcher = self._matchers.get(host) or self._matchers.get(ANY_DOMAIN)
+        rule = None
+        if matcher:
+            index = matcher.match(target)
+            if index is not None:
+                rule = self.rules[index]
+
+        self._cache[url] = rule
+        return rule
@@ -10,6 +10,10 @@ Examples:
     python url_to_markdown.py https://example.com
     python url_to_markdown.py https://example.com --output article.md
     python url_to_markdown.py https://example.com -o -  # stdout
+    python url_to_markdown.py https://docs.example.com/page --engine http  # no browser
+    python url_to_markdown.py https://example.com --server  # warm browser from crawl_server.py
+    python url_to_markdown.py https://example.com --sink jsonl -o corpus.jsonl  # append a record
+    python url_to_markdown.py https://example.com --sink sqlite -o corpus.sqlite3
 """
 
 import argparse
@@ -17,16 +21,31 @@ import asyncio
 import sys
 from pathlib import Path
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from crawl4ai import BrowserConfig, CrawlerRunConfig, CacheMode
 
+from crawl_client import DEFAULT_SERVER_URL
+from crawl_engine import ENGINES, crawl_one
+from crawl_sink import SINKS, JsonlSink, SqliteSink, make_page, render_markdown
 
-async def url_to_markdown(url: str, output_path: str | None = None) -> str:
+
+async def url_to_markdown(
+    url: str,
+    output_path: str | None = None,
+    engine: str = 'browser',
+    server: str | None = None,
+    sink: str = 'markdown'
+) -> str:
     """
     Convert a URL to clean markdown.
 
     Args:
         url: The URL to crawl
         output_path: Optional file path to save output (None = return string)
+        engine: 'browser', 'http' (no browser) or 'auto' (HTTP, browser for SPA shells)
+        server: Browser pool service URL (crawl_server.py); None launches a browser here
+        sink: 'markdown' writes output_path as a markdown file; 'jsonl' appends a
+            corpus record to output_path (stdout if omitted); 'sqlite' upserts
+            into the output_path database
 
     Returns:
         The markdown content as a string
@@ -41,29 +60,42 @@ async def url_to_markdown(url: str, output_path: str | None = None) -> str:
         cache_mode=CacheMode.BYPASS
     )
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        result = await crawler.arun(url=url, config=run_config)
+    result = await crawl_one(url, run_config, engine=engine, browser_config=browser_config, server=server)
 
-        if not result.success:
-            raise RuntimeError(f"Crawl failed: {result.error_message}")
+    if not result.success:
+        raise RuntimeError(f"Crawl failed: {result.error_message}")
 
-        # Get the filtered markdown (cleaner) or fall back to raw
-        markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
+    # Get the filtered markdown (cleaner) or fall back to raw
+    markdown = result.markdown.fit_markdown or result.markdown.raw_markdown
 
-        # Add metadata header
-        title = result.metadata.get('title', 'Untitled')
-        output = f"# {title}\n\n"
-        output += f"- **Source:** {url}\n"
-        output += f"- **Status:** {result.status_code}\n\n"
-        output += "---\n\n"
-        output += markdown
+    # Add metadata header
+    title = result.metadata.get('title', 'Untitled')
+    page = make_page(url, title, result.status_code, markdown)
+    output = render_markdown(page)
+    to_stdout = not output_path or output_path == '-'
 
-        if output_path and output_path != '-':
+    if sink == 'markdown':
+        if not to_stdout:
             Path(output_path).write_text(output, encoding='utf-8')
             print(f"Saved to: {output_path}", file=sys.stderr)
-
         return output
 
+    if sink == 'sqlite' and to_stdout:
+        raise ValueError("The sqlite sink needs --output <database file>")
+
+    if sink == 'jsonl':
+        page_sink = JsonlSink(None if to_stdout else Path(output_path))
+    else:
+        page_sink = SqliteSink(Path(output_path))
+    try:
+        page_sink.write(page)
+    finally:
+        page_sink.close()
+    if not to_stdout:
+        print(f"Saved to: {output_path}", file=sys.stderr)
+
+    return output
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -75,13 +107,42 @@ def main():
         help='Output file path (use - for stdout, omit to print to stdout)',
         default='-'
     )
+    parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default='browser',
+        help='Fetch engine: browser (Chromium), http (no browser, static pages), '
+             'auto (http, escalating SPA shells to browser) (default: browser)'
+    )
+
+    parser.add_argument(
+        '--sink',
+        choices=SINKS,
+        default='markdown',
+        help='Output format: markdown, jsonl (append a corpus record) or sqlite '
+             '(upsert into the --output database) (default: markdown)'
+    )
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Crawl through the shared browser pool service (start it with crawl_server.py)'
+    )
+    parser.add_argument(
+        '--server-url',
+        default=DEFAULT_SERVER_URL,
+        help=f'Browser pool service URL (default: {DEFAULT_SERVER_URL})'
+    )
 
     args = parser.parse_args()
+    server = args.server_url if args.server else None
+
+    if args.sink == 'sqlite' and args.output == '-':
+        parser.error('--sink sqlite needs --output <database file>')
 
     try:
-        result = asyncio.run(url_to_markdown(args.url, args.output))
+        result = asyncio.run(url_to_markdown(args.url, args.output, args.engine, server, args.sink))
 
-        if args.output == '-':
+        if args.output == '-' and args.sink == 'markdown':
             print(result)
 
     except Exception as e: